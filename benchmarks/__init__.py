@@ -0,0 +1 @@
+# Benchmark 패키지
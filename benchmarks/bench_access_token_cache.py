@@ -0,0 +1,90 @@
+"""검증된 Access Token 캐시(access_token_cache) 효과 측정
+
+같은 Access Token으로 반복 요청하는 상황에서 인증 비용을 캐시 on/off로 비교합니다.
+
+1. verify_access_token: 토큰 검증/디코딩 단독
+2. get_current_user_id: 인증 의존성 전체 (사용자 상태 캐시가 채워진 상태)
+
+DB에 있는 사용 중인 사용자 한 명으로 토큰을 만들어 사용합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_access_token_cache
+
+환경 변수:
+  BENCH_ITERATIONS: 반복 횟수 (기본값 20000)
+"""
+
+import asyncio
+import os
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.db import engine
+from src.services.auth_service import AuthService
+from src.utils.auth_helper import get_current_user_id
+from src.utils.jwt_helper import (
+  access_token_cache,
+  create_access_token,
+  verify_access_token,
+)
+
+
+def bench_verify(token: str, iterations: int) -> float:
+  """verify_access_token 평균 (µs)"""
+  started = time.perf_counter()
+  for _ in range(iterations):
+    verify_access_token(token)
+  return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+async def bench_dependency(
+  service: AuthService, token: str, user_no: int, iterations: int
+) -> float:
+  """get_current_user_id 평균 (µs)"""
+  credentials = HTTPAuthorizationCredentials(scheme='Bearer', credentials=token)
+  # 사용자 상태 캐시를 채움 (이후 반복은 DB 조회 없음)
+  assert await get_current_user_id(None, credentials, None, service) == user_no  # type: ignore[arg-type]
+  started = time.perf_counter()
+  for _ in range(iterations):
+    await get_current_user_id(None, credentials, None, service)  # type: ignore[arg-type]
+  return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+  iterations = int(os.getenv('BENCH_ITERATIONS', '20000'))
+
+  with engine.connect() as conn:
+    user_no, user_role = conn.execute(
+      text(
+        "SELECT user_no, user_role FROM user_info WHERE use_yn = 'Y' "
+        "AND del_yn = 'N' ORDER BY user_no LIMIT 1"
+      )
+    ).one()
+  token = create_access_token({'sub': str(user_no), 'userRole': user_role})
+  enabled = access_token_cache.enabled
+
+  try:
+    with Session(engine, expire_on_commit=False) as session:
+      service = AuthService(session)
+      for cache_enabled in (False, True):
+        access_token_cache.enabled = cache_enabled
+        access_token_cache.clear()
+        label = 'on ' if cache_enabled else 'off'
+        verify_us = bench_verify(token, iterations)
+        dependency_us = asyncio.run(
+          bench_dependency(service, token, user_no, iterations)
+        )
+        print(
+          f'[BENCH] token cache {label} verify_access_token: {verify_us:7.2f} µs, '
+          f'get_current_user_id: {dependency_us:7.2f} µs'
+        )
+    print(f'[BENCH] stats: {access_token_cache.snapshot()}')
+  finally:
+    access_token_cache.enabled = enabled
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,133 @@
+"""인증 의존성(get_current_user_id) 사용자 상태 확인 방식별 응답 시간 측정
+
+보호된 API에서 인증 의존성이 사용자를 확인하는 방식을 바꿔 가며 비교합니다.
+
+- db: 상태 캐시를 끄고 매 요청 상태 컬럼을 DB에서 조회
+- cache: 사용자 상태 캐시 사용 (기본값, AUTH_STATUS_CACHE_TTL_SECONDS)
+- token: AUTH_TRUST_TOKEN=True (DB 확인 없이 토큰만 신뢰)
+
+측정 대상:
+1. PATCH /users/{user_no}: 인증 + 대상 사용자 조회/수정
+2. DELETE /users: 인증 + 다건 소프트 삭제 (같은 대상을 반복 삭제)
+
+요청당 SQL 수는 Server-Timing 헤더(db;desc="N queries")로 확인합니다.
+측정이 끝나면 벤치마크 사용자를 삭제합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_auth_dependency
+  DB_ASYNC_ENABLED=true uv run python -m benchmarks.bench_auth_dependency
+
+환경 변수:
+  BENCH_REQUESTS: 방식별 요청 횟수 (기본값 300, 중앙값 출력)
+"""
+
+import os
+import re
+import statistics
+import time
+import uuid
+from typing import Callable
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.dao.user_dao import user_status_cache
+from src.db import engine
+from src.main import app
+from src.settings import settings
+
+BENCH_USER_PREFIX = 'auth-bench-'
+PASSWORD = 'pw123456!'
+DELETE_TARGET_CNT = 10
+
+
+def query_count(response: httpx.Response) -> int:
+  """Server-Timing 헤더의 SQL 수 (헤더가 없으면 0)"""
+  match = re.search(r'"(\d+) queries"', response.headers.get('server-timing', ''))
+  return int(match.group(1)) if match else 0
+
+
+def measure(
+  requests: int, send: Callable[[int], httpx.Response]
+) -> tuple[float, float]:
+  """(중앙값 ms, 요청당 평균 SQL 수)"""
+  elapsed_ms: list[float] = []
+  queries = 0
+  for n in range(requests):
+    started = time.perf_counter()
+    response = send(n)
+    elapsed_ms.append((time.perf_counter() - started) * 1000)
+    assert not response.json()['error'], response.json()['message']
+    queries += query_count(response)
+  return statistics.median(elapsed_ms), queries / requests
+
+
+def set_mode(mode: str) -> None:
+  """인증 의존성의 사용자 상태 확인 방식 변경"""
+  settings.AUTH_TRUST_TOKEN = mode == 'token'
+  user_status_cache.enabled = mode == 'cache'
+  user_status_cache.clear()
+
+
+def create_user(client: TestClient, name: str, user_role: str) -> int:
+  """벤치마크 사용자 생성 후 사용자 번호 반환"""
+  return client.post(
+    '/users/',
+    json={
+      'emlAddr': f'{name}@example.com',
+      'userNm': name,
+      'password': PASSWORD,
+      'userRole': user_role,
+    },
+  ).json()['data']['userNo']
+
+
+def main():
+  requests = int(os.getenv('BENCH_REQUESTS', '300'))
+  prefix = f'{BENCH_USER_PREFIX}{uuid.uuid4().hex[:8]}-'
+  trust_token = settings.AUTH_TRUST_TOKEN
+  status_cache_enabled = user_status_cache.enabled
+
+  try:
+    with TestClient(app, base_url='https://testserver') as client:
+      create_user(client, f'{prefix}admin', 'ADMIN')
+      target_no = create_user(client, f'{prefix}target', 'USER')
+      delete_nos = [
+        create_user(client, f'{prefix}delete{n}', 'USER')
+        for n in range(DELETE_TARGET_CNT)
+      ]
+      client.post(
+        '/auth/signin',
+        json={'emlAddr': f'{prefix}admin@example.com', 'password': PASSWORD},
+      )
+
+      for mode in ('db', 'cache', 'token'):
+        set_mode(mode)
+        patch_ms, patch_queries = measure(
+          requests,
+          lambda n: client.patch(f'/users/{target_no}', json={'userBiogp': f'{n}'}),
+        )
+        delete_ms, delete_queries = measure(
+          requests,
+          lambda n: client.request(
+            'DELETE', '/users/', json={'userNoList': delete_nos}
+          ),
+        )
+        print(
+          f'[BENCH] {mode:<5} PATCH /users/{{no}}: {patch_ms:6.2f} ms, '
+          f'{patch_queries:.1f} queries/req | '
+          f'DELETE /users: {delete_ms:6.2f} ms, {delete_queries:.1f} queries/req'
+        )
+  finally:
+    settings.AUTH_TRUST_TOKEN = trust_token
+    user_status_cache.enabled = status_cache_enabled
+    with engine.begin() as conn:
+      conn.execute(
+        text('DELETE FROM user_info WHERE user_nm LIKE :prefix'),
+        {'prefix': f'{BENCH_USER_PREFIX}%'},
+      )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,126 @@
+"""캐시 백엔드(memory, shm, redis) 비교
+
+1. 연산 비용: get(hit), get_many(BENCH_BATCH개), set, delete 평균 (µs)
+2. 워커 간 공유: 워커 프로세스 BENCH_WORKERS개가 같은 키 BENCH_KEYS개를 차례로
+   조회하고, 없으면 값을 만들어(DB 조회 대신) 저장합니다. 만든 횟수가 적을수록
+   워커 사이에 캐시를 공유한 것입니다. (memory는 워커 수 x 키 수, 공유 백엔드는 키 수)
+
+redis는 CACHE_REDIS_URL 서버에 연결할 수 있을 때만 측정합니다.
+워커는 동시에 실행되므로 같은 키를 거의 동시에 조회하면 공유 백엔드도 여러 번 만들 수
+있습니다.
+측정에 사용한 shm 파일과 redis 키는 끝나면 삭제합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_cache_backends
+  BENCH_BACKENDS=memory,shm uv run python -m benchmarks.bench_cache_backends
+
+환경 변수:
+  BENCH_BACKENDS: 측정할 백엔드 (기본값 memory,shm,redis)
+  BENCH_ITERATIONS: 연산별 반복 횟수 (기본값 20000)
+  BENCH_BATCH: get_many 키 수 (기본값 100)
+  BENCH_WORKERS: 워커 프로세스 수 (기본값 4)
+  BENCH_KEYS: 워커가 조회할 키 수 (기본값 1000)
+"""
+
+import multiprocessing
+import os
+import time
+import uuid
+from typing import Callable
+
+from src.settings import settings
+from src.utils.cache_helper import CacheBackend, LruTtlCache
+from src.utils.redis_cache_helper import RedisCache
+from src.utils.shm_cache_helper import SharedMemoryCache
+
+BACKENDS: dict[str, type[CacheBackend]] = {
+  'memory': LruTtlCache,
+  'shm': SharedMemoryCache,
+  'redis': RedisCache,
+}
+
+# 사용자 단건 조회 캐시 값과 비슷한 크기의 값
+SAMPLE_VALUE = {
+  'userNo': 1,
+  'emlAddr': 'bench@example.com',
+  'userNm': 'bench',
+  'userBiogp': 'x' * 200,
+  'useYn': 'Y',
+  'delYn': 'N',
+}
+
+
+def per_op_us(iterations: int, op: Callable[[int], object]) -> float:
+  """연산 평균 시간 (µs)"""
+  started = time.perf_counter()
+  for n in range(iterations):
+    op(n)
+  return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def bench_ops(cache: CacheBackend, iterations: int, batch: int) -> dict[str, float]:
+  """연산별 평균 시간 (µs)"""
+  keys = [('userNo', n) for n in range(batch)]
+  for key in keys:
+    cache.set(key, SAMPLE_VALUE)
+  return {
+    'get': per_op_us(iterations, lambda n: cache.get(keys[n % batch])),
+    f'get_many({batch})': per_op_us(
+      max(iterations // batch, 10), lambda n: cache.get_many(keys)
+    ),
+    'set': per_op_us(iterations, lambda n: cache.set(keys[n % batch], SAMPLE_VALUE)),
+    'delete': per_op_us(iterations, lambda n: cache.delete(keys[n % batch])),
+  }
+
+
+def run_worker(backend: str, name: str, key_cnt: int) -> int:
+  """워커 하나: 키를 차례로 조회하고 없으면 저장 (저장한 횟수 반환)"""
+  cache = BACKENDS[backend](name, key_cnt, 60, True)
+  loads = 0
+  for n in range(key_cnt):
+    if cache.get(('userNo', n)) is None:
+      loads += 1
+      cache.set(('userNo', n), SAMPLE_VALUE)
+  return loads
+
+
+def bench_workers(backend: str, name: str, workers: int, key_cnt: int) -> int:
+  """워커 프로세스 여러 개의 저장 횟수 합계"""
+  context = multiprocessing.get_context('spawn')
+  with context.Pool(workers) as pool:
+    return sum(pool.starmap(run_worker, [(backend, name, key_cnt)] * workers))
+
+
+def main():
+  backends = os.getenv('BENCH_BACKENDS', 'memory,shm,redis').split(',')
+  iterations = int(os.getenv('BENCH_ITERATIONS', '20000'))
+  batch = int(os.getenv('BENCH_BATCH', '100'))
+  workers = int(os.getenv('BENCH_WORKERS', '4'))
+  key_cnt = int(os.getenv('BENCH_KEYS', '1000'))
+
+  for backend in backends:
+    name = f'bench-{uuid.uuid4().hex[:8]}'
+    cache = BACKENDS[backend](name, max(batch, key_cnt), 60, True)
+    if backend == 'redis':
+      # 연결에 실패해도 예외 없이 None을 반환하므로, 저장 후 다시 읽어 확인
+      cache.set('ping', 1)
+      if cache.get('ping') is None:
+        print(f'[BENCH] {backend}: {settings.CACHE_REDIS_URL}에 연결할 수 없어 생략')
+        continue
+    try:
+      ops = bench_ops(cache, iterations, batch)
+      cache.clear()
+      loads = bench_workers(backend, name, workers, key_cnt)
+      print(
+        f'[BENCH] {backend:<6} '
+        + ', '.join(f'{op}: {us:7.2f} µs' for op, us in ops.items())
+        + f' | {workers} workers x {key_cnt} keys: {loads:,} loads'
+      )
+    finally:
+      cache.clear()
+      if isinstance(cache, SharedMemoryCache):
+        os.remove(cache.path)
+
+
+if __name__ == '__main__':
+  main()
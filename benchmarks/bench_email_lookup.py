@@ -0,0 +1,110 @@
+"""이메일 조회/로그인 응답 시간 측정 (대소문자 구분 없는 이메일)
+
+1. 조회: UserDAO.get_user_by_email (lower(eml_addr) 함수 인덱스)
+2. 비교용: 같은 쿼리를 인덱스 스캔 없이 실행 (함수 인덱스가 없을 때와 같은 순차 스캔)
+3. 로그인: 대문자가 섞인 이메일로 POST /auth/signin (비밀번호 검증 포함)
+
+사용 방법:
+  uv run python -m benchmarks.bench_email_lookup
+
+환경 변수:
+  BENCH_LOOKUPS: 조회 횟수 (기본값 200, 순차 스캔은 10분의 1)
+  BENCH_SIGNINS: 로그인 횟수 (기본값 20)
+"""
+
+import os
+import statistics
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.dao.user_dao import UserDAO
+from src.db import engine, init_db
+from src.main import app
+
+BENCH_USER_PREFIX = 'email-bench-'
+PASSWORD = 'pw123456!'
+
+
+def bench_lookup(eml_addrs: list[str], seq_scan: bool) -> float:
+  """get_user_by_email 중앙값 (ms)"""
+  dao = UserDAO()
+  elapsed_ms: list[float] = []
+  with Session(engine) as session:
+    if seq_scan:
+      session.execute(text('SET LOCAL enable_indexscan = off'))
+      session.execute(text('SET LOCAL enable_bitmapscan = off'))
+    for eml_addr in eml_addrs:
+      started = time.perf_counter()
+      user = dao.get_user_by_email(session, eml_addr.upper())
+      elapsed_ms.append((time.perf_counter() - started) * 1000)
+      assert user is not None, eml_addr
+  return statistics.median(elapsed_ms)
+
+
+def main():
+  lookups = int(os.getenv('BENCH_LOOKUPS', '200'))
+  signins = int(os.getenv('BENCH_SIGNINS', '20'))
+
+  init_db()
+  with engine.connect() as conn:
+    total_cnt = conn.execute(text('SELECT count(*) FROM user_info')).scalar_one()
+    eml_addrs = list(
+      conn.execute(
+        text('SELECT eml_addr FROM user_info ORDER BY random() LIMIT :n'),
+        {'n': lookups},
+      ).scalars()
+    )
+    plan = conn.execute(
+      text('EXPLAIN SELECT * FROM user_info WHERE lower(eml_addr) = :eml_addr'),
+      {'eml_addr': eml_addrs[0]},
+    ).scalar()
+  print(f'[BENCH] user_info {total_cnt:,} rows, plan: {plan}')
+
+  print(
+    f'[BENCH] get_user_by_email (index):    {bench_lookup(eml_addrs, False):8.2f} ms'
+  )
+  seq_scan_ms = bench_lookup(eml_addrs[: max(lookups // 10, 1)], True)
+  print(f'[BENCH] get_user_by_email (seq scan): {seq_scan_ms:8.2f} ms')
+
+  suffix = uuid.uuid4().hex[:8]
+  eml_addr = f'{BENCH_USER_PREFIX}{suffix}@example.com'
+  try:
+    with TestClient(app, base_url='https://testserver') as client:
+      client.post(
+        '/users/',
+        json={
+          'emlAddr': eml_addr.upper(),
+          'userNm': f'{BENCH_USER_PREFIX}{suffix}',
+          'password': PASSWORD,
+          'userRole': 'USER',
+        },
+      )
+      elapsed_ms: list[float] = []
+      for n in range(signins):
+        login_eml_addr = eml_addr.upper() if n % 2 else eml_addr
+        started = time.perf_counter()
+        body = client.post(
+          '/auth/signin', json={'emlAddr': login_eml_addr, 'password': PASSWORD}
+        ).json()
+        elapsed_ms.append((time.perf_counter() - started) * 1000)
+        assert not body['error'], body['message']
+        # 로그인 상태에서는 다시 로그인할 수 없으므로 로그아웃
+        client.post('/auth/signout')
+    print(
+      f'[BENCH] POST /auth/signin x{signins}:      '
+      f'{statistics.median(elapsed_ms):8.2f} ms (비밀번호 해시 검증 포함)'
+    )
+  finally:
+    with engine.begin() as conn:
+      conn.execute(
+        text('DELETE FROM user_info WHERE user_nm LIKE :prefix'),
+        {'prefix': f'{BENCH_USER_PREFIX}%'},
+      )
+
+
+if __name__ == '__main__':
+  main()
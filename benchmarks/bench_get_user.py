@@ -0,0 +1,66 @@
+"""GET /users/{user_no} 처리량 벤치마크 (동기/비동기 DB 모드 비교)
+
+처리량과 함께 연결 풀의 대여 대기 시간/점유 시간(평균, 최대)을 출력합니다.
+
+사용 방법:
+  DB_ASYNC_ENABLED=false uv run python -m benchmarks.bench_get_user
+  DB_ASYNC_ENABLED=true uv run python -m benchmarks.bench_get_user
+  DB_EARLY_RELEASE=false uv run python -m benchmarks.bench_get_user  # 조기 반납 비교
+
+환경 변수:
+  BENCH_USER_NO: 조회할 사용자 번호 (기본값 1)
+  BENCH_REQUESTS: 총 요청 수 (기본값 2000)
+  BENCH_CONCURRENCY: 동시 요청 수 (기본값 100)
+"""
+
+import asyncio
+import os
+import time
+
+import httpx
+
+from src.main import app
+from src.settings import settings
+from src.utils.pool_helper import pool_telemetry
+
+
+async def main():
+  user_no = int(os.getenv('BENCH_USER_NO', '1'))
+  total = int(os.getenv('BENCH_REQUESTS', '2000'))
+  concurrency = int(os.getenv('BENCH_CONCURRENCY', '100'))
+
+  transport = httpx.ASGITransport(app=app)
+  async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request_once():
+      async with semaphore:
+        response = await client.get(f'/users/{user_no}')
+        response.raise_for_status()
+
+    # 워밍업 (연결 풀 채우기)
+    await asyncio.gather(*(request_once() for _ in range(concurrency)))
+
+    # 워밍업 통계 제외
+    for telemetry in pool_telemetry.values():
+      telemetry.reset_latency()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request_once() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+
+  mode = 'async' if settings.DB_ASYNC_ENABLED else 'sync'
+  print(f'[BENCH] mode={mode} requests={total} concurrency={concurrency}')
+  print(f'[BENCH] elapsed={elapsed:.2f}s rps={total / elapsed:.1f}')
+  for telemetry in pool_telemetry.values():
+    if telemetry.wait.count:
+      print(
+        f'[BENCH] pool={telemetry.name} early_release={settings.DB_EARLY_RELEASE} '
+        f'checkouts={telemetry.wait.count} '
+        f'wait avg={telemetry.wait.avg_ms}ms max={telemetry.wait.max_ms:.2f}ms '
+        f'hold avg={telemetry.hold.avg_ms}ms max={telemetry.hold.max_ms:.2f}ms'
+      )
+
+
+if __name__ == '__main__':
+  asyncio.run(main())
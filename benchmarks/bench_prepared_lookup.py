@@ -0,0 +1,68 @@
+"""사용자 단건 조회 지연 시간 벤치마크 (prepared statement 사용/미사용 비교)
+
+get_user_by_no/email/username을 번갈아 호출하며 조회 1회당 지연 시간을 측정합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_prepared_lookup
+
+환경 변수:
+  BENCH_USER_NO: 조회할 사용자 번호 (기본값 1)
+  BENCH_LOOKUPS: 모드별 조회 횟수 (기본값 3000)
+"""
+
+import os
+import statistics
+import time
+
+from sqlmodel import Session, create_engine
+
+from src.dao.user_dao import UserDAO
+from src.settings import settings
+from src.utils.prepare_helper import instrument_prepare
+
+
+def measure(prepared: bool, user_no: int, lookups: int) -> list[float]:
+  """새 엔진으로 조회를 반복 실행한 시간(밀리초) 목록"""
+  engine = create_engine(settings.DATABASE_URL)
+  instrument_prepare(engine, enabled=prepared)
+
+  elapsed_ms: list[float] = []
+  dao = UserDAO()
+  with Session(engine) as session:
+    user = dao.get_user_by_no(session, user_no)
+    if user is None:
+      raise SystemExit(
+        f'[BENCH] 사용자 {user_no}번이 없습니다. BENCH_USER_NO를 확인하세요.'
+      )
+
+    lookups_by_kind = [
+      lambda: dao.get_user_by_no(session, user_no),
+      lambda: dao.get_user_by_email(session, user.emlAddr),
+      lambda: UserDAO.get_user_by_username(session, user.userNm),
+    ]
+    for index in range(lookups):
+      started = time.perf_counter()
+      lookups_by_kind[index % len(lookups_by_kind)]()
+      elapsed_ms.append((time.perf_counter() - started) * 1000)
+      # 식별자 맵 재사용을 막아 매번 행을 다시 읽도록 함
+      session.expunge_all()
+  engine.dispose()
+  return elapsed_ms
+
+
+def main():
+  user_no = int(os.getenv('BENCH_USER_NO', '1'))
+  lookups = int(os.getenv('BENCH_LOOKUPS', '3000'))
+
+  for prepared in (False, True):
+    elapsed_ms = sorted(measure(prepared, user_no, lookups))
+    print(
+      f'[BENCH] prepared={prepared} lookups={lookups} '
+      f'mean={statistics.mean(elapsed_ms) * 1000:.1f}us '
+      f'p50={elapsed_ms[len(elapsed_ms) // 2] * 1000:.1f}us '
+      f'p99={elapsed_ms[int(len(elapsed_ms) * 0.99)] * 1000:.1f}us'
+    )
+
+
+if __name__ == '__main__':
+  main()
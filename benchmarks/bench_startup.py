@@ -0,0 +1,57 @@
+"""기동 시 스키마 초기화 시간 벤치마크 (create_all vs 스키마 지문 비교)
+
+워커 기동을 흉내 내기 위해 매 회 새 엔진(빈 연결 풀)을 만들어 측정합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_startup
+
+환경 변수:
+  BENCH_RUNS: 반복 횟수 (기본값 20)
+"""
+
+import os
+import statistics
+import time
+from typing import Callable
+
+from sqlalchemy import Engine
+from sqlmodel import SQLModel, create_engine
+
+import src.db  # noqa: F401 (모델을 SQLModel.metadata에 등록)
+from src.settings import settings
+from src.utils.schema_helper import migrate_schema
+
+
+def measure(runs: int, init: Callable[[Engine], object]) -> list[float]:
+  """새 엔진으로 init을 실행한 시간(밀리초) 목록"""
+  elapsed_ms: list[float] = []
+  for _ in range(runs):
+    engine = create_engine(settings.DATABASE_URL)
+    started = time.perf_counter()
+    init(engine)
+    elapsed_ms.append((time.perf_counter() - started) * 1000)
+    engine.dispose()
+  return elapsed_ms
+
+
+def main():
+  runs = int(os.getenv('BENCH_RUNS', '20'))
+
+  # 지문이 저장된 상태에서 측정
+  migrate_schema(create_engine(settings.DATABASE_URL), SQLModel.metadata)
+
+  results = {
+    'create_all': measure(runs, SQLModel.metadata.create_all),
+    'fingerprint': measure(
+      runs, lambda engine: migrate_schema(engine, SQLModel.metadata)
+    ),
+  }
+  for name, elapsed_ms in results.items():
+    print(
+      f'[BENCH] {name}: runs={runs} '
+      f'median={statistics.median(elapsed_ms):.2f}ms max={max(elapsed_ms):.2f}ms'
+    )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,64 @@
+"""사용자 다건 조회(POST /users/batch) 응답 시간 측정
+
+목록 화면에서 생성자/수정자 BENCH_BATCH_SIZE명을 가져오는 상황을 가정하고,
+GET /users/{user_no}를 한 명씩 호출한 시간과
+POST /users/batch 한 번의 시간을 비교합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_batch
+  BENCH_BATCH_SIZE=200 uv run python -m benchmarks.bench_user_batch
+
+환경 변수:
+  BENCH_BATCH_SIZE: 한 번에 조회할 사용자 수 (기본값 50)
+  BENCH_REPEAT: 반복 횟수 (기본값 20, 중앙값 출력)
+"""
+
+import os
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.db import engine
+from src.main import app
+
+
+def main():
+  batch_size = int(os.getenv('BENCH_BATCH_SIZE', '50'))
+  repeat = int(os.getenv('BENCH_REPEAT', '20'))
+
+  with TestClient(app, base_url='https://testserver') as client:
+    with engine.connect() as conn:
+      user_nos = list(
+        conn.execute(
+          text('SELECT user_no FROM user_info ORDER BY random() LIMIT :n'),
+          {'n': batch_size},
+        ).scalars()
+      )
+
+    single_ms: list[float] = []
+    batch_ms: list[float] = []
+    for _ in range(repeat):
+      started = time.perf_counter()
+      for user_no in user_nos:
+        client.get(f'/users/{user_no}')
+      single_ms.append((time.perf_counter() - started) * 1000)
+
+      started = time.perf_counter()
+      body = client.post('/users/batch', json={'userNoList': user_nos}).json()
+      batch_ms.append((time.perf_counter() - started) * 1000)
+      assert body['data']['foundCnt'] == len(user_nos), body['message']
+
+  print(
+    f'[BENCH] GET /users/{{user_no}} x{batch_size}: '
+    f'{statistics.median(single_ms):8.1f} ms'
+  )
+  print(
+    f'[BENCH] POST /users/batch ({batch_size}명):  '
+    f'{statistics.median(batch_ms):8.1f} ms'
+  )
+
+
+if __name__ == '__main__':
+  main()
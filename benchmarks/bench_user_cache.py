@@ -0,0 +1,138 @@
+"""사용자 단건 조회 캐시(USER_CACHE_ENABLED) 효과 측정
+
+캐시를 켠 상태와 끈 상태에서 다음을 비교합니다.
+
+1. UserDAO.get_user_by_no 단독 (같은 사용자 반복 조회)
+2. GET /admin/pool: 보호된 API 비교 기준 (인증 의존성은 사용자 캐시 대신 사용자
+   상태 캐시를 사용하므로 캐시 on/off와 관계없음)
+3. PATCH /users/{user_no}: 대상 사용자 조회/수정
+   (수정 후 대상 사용자 캐시는 무효화되므로 다음 요청에서 다시 조회)
+
+요청당 SQL 수는 Server-Timing 헤더(db;desc="N queries")로 확인합니다.
+측정이 끝나면 벤치마크 사용자를 삭제합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_cache
+
+환경 변수:
+  BENCH_REQUESTS: 요청 횟수 (기본값 200, 중앙값 출력)
+"""
+
+import os
+import re
+import statistics
+import time
+import uuid
+from typing import Callable
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.dao.user_dao import UserDAO, user_cache
+from src.db import engine
+from src.main import app
+
+BENCH_USER_PREFIX = 'cache-bench-'
+PASSWORD = 'pw123456!'
+
+
+def query_count(response: httpx.Response) -> int:
+  """Server-Timing 헤더의 SQL 수 (헤더가 없으면 0)"""
+  match = re.search(r'"(\d+) queries"', response.headers.get('server-timing', ''))
+  return int(match.group(1)) if match else 0
+
+
+def measure(
+  requests: int, send: Callable[[int], httpx.Response]
+) -> tuple[float, float]:
+  """(중앙값 ms, 요청당 평균 SQL 수)"""
+  elapsed_ms: list[float] = []
+  queries = 0
+  for n in range(requests):
+    started = time.perf_counter()
+    response = send(n)
+    elapsed_ms.append((time.perf_counter() - started) * 1000)
+    assert not response.json()['error'], response.json()['message']
+    queries += query_count(response)
+  return statistics.median(elapsed_ms), queries / requests
+
+
+def bench_dao(user_no: int, requests: int) -> float:
+  """get_user_by_no 중앙값 (ms)"""
+  dao = UserDAO()
+  elapsed_ms: list[float] = []
+  with Session(engine, expire_on_commit=False) as session:
+    for _ in range(requests):
+      started = time.perf_counter()
+      dao.get_user_by_no(session, user_no)
+      elapsed_ms.append((time.perf_counter() - started) * 1000)
+      # 세션 식별 맵에 남은 객체를 재사용하지 않도록 비움
+      session.expunge_all()
+  return statistics.median(elapsed_ms)
+
+
+def main():
+  requests = int(os.getenv('BENCH_REQUESTS', '200'))
+  suffix = uuid.uuid4().hex[:8]
+  prefix = f'{BENCH_USER_PREFIX}{suffix}-'
+
+  try:
+    with TestClient(app, base_url='https://testserver') as client:
+      admin_eml_addr = f'{prefix}admin@example.com'
+      client.post(
+        '/users/',
+        json={
+          'emlAddr': admin_eml_addr,
+          'userNm': f'{prefix}admin',
+          'password': PASSWORD,
+          'userRole': 'ADMIN',
+        },
+      )
+      target_no = client.post(
+        '/users/',
+        json={
+          'emlAddr': f'{prefix}target@example.com',
+          'userNm': f'{prefix}target',
+          'password': PASSWORD,
+          'userRole': 'USER',
+        },
+      ).json()['data']['userNo']
+      client.post(
+        '/auth/signin', json={'emlAddr': admin_eml_addr, 'password': PASSWORD}
+      )
+
+      for enabled in (False, True):
+        user_cache.enabled = enabled
+        user_cache.clear()
+        label = 'on ' if enabled else 'off'
+
+        dao_ms = bench_dao(target_no, requests)
+        print(f'[BENCH] cache {label} get_user_by_no:      {dao_ms:7.3f} ms')
+
+        pool_ms, pool_queries = measure(requests, lambda n: client.get('/admin/pool'))
+        print(
+          f'[BENCH] cache {label} GET /admin/pool:       {pool_ms:7.2f} ms, '
+          f'{pool_queries:.1f} queries/req'
+        )
+
+        patch_ms, patch_queries = measure(
+          requests,
+          lambda n: client.patch(f'/users/{target_no}', json={'userBiogp': f'{n}'}),
+        )
+        print(
+          f'[BENCH] cache {label} PATCH /users/{{no}}:     {patch_ms:7.2f} ms, '
+          f'{patch_queries:.1f} queries/req'
+        )
+      print(f'[BENCH] stats: {user_cache.snapshot()}')
+  finally:
+    with engine.begin() as conn:
+      conn.execute(
+        text('DELETE FROM user_info WHERE user_nm LIKE :prefix'),
+        {'prefix': f'{BENCH_USER_PREFIX}%'},
+      )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,120 @@
+"""사용자 조회 ETag 조건부 요청(If-None-Match) 효과 측정
+
+같은 사용자/목록을 반복 조회(폴링)하는 클라이언트를 흉내 내어 비교합니다.
+
+- full: If-None-Match 없이 매번 전체 응답 (200)
+- conditional: 첫 응답의 ETag를 If-None-Match로 보냄 (바뀌지 않았으므로 304)
+
+측정 대상:
+1. GET /users/{user_no}: 강한 ETag (304 확인 버전은 공유 캐시 또는 SELECT updt_dt)
+2. GET /users/email/{eml_addr}: 강한 ETag
+3. GET /users/?crtDtFrom=...: 약한 ETag (검색 조건에 맞는 사용자 수/최근 수정 일시)
+   (측정 시작 이후 가입한 벤치마크 사용자만 조회되도록 가입 일시로 검색)
+
+요청당 SQL 수는 Server-Timing 헤더(db;desc="N queries")로 확인합니다.
+측정이 끝나면 벤치마크 사용자를 삭제합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_etag
+  DB_ASYNC_ENABLED=true uv run python -m benchmarks.bench_user_etag
+
+환경 변수:
+  BENCH_REQUESTS: 방식별 요청 횟수 (기본값 300, 중앙값 출력)
+  BENCH_LIST_USERS: 목록 조회 대상 사용자 수 (기본값 20)
+"""
+
+import os
+import re
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlencode
+
+import httpx
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.db import engine
+from src.main import app
+
+BENCH_USER_PREFIX = 'etag-bench-'
+PASSWORD = 'pw123456!'
+
+
+def query_count(response: httpx.Response) -> int:
+  """Server-Timing 헤더의 SQL 수 (헤더가 없으면 0)"""
+  match = re.search(r'"(\d+) queries"', response.headers.get('server-timing', ''))
+  return int(match.group(1)) if match else 0
+
+
+def measure(
+  client: TestClient, url: str, requests: int, etag: Optional[str]
+) -> tuple[float, float, int, int]:
+  """(중앙값 ms, 요청당 평균 SQL 수, 응답 상태 코드, 응답 본문 바이트)"""
+  headers = {'If-None-Match': etag} if etag else {}
+  elapsed_ms: list[float] = []
+  queries = 0
+  response = None
+  for _ in range(requests):
+    started = time.perf_counter()
+    response = client.get(url, headers=headers)
+    elapsed_ms.append((time.perf_counter() - started) * 1000)
+    queries += query_count(response)
+  assert response is not None
+  return (
+    statistics.median(elapsed_ms),
+    queries / requests,
+    response.status_code,
+    len(response.content),
+  )
+
+
+def main():
+  requests = int(os.getenv('BENCH_REQUESTS', '300'))
+  list_users = int(os.getenv('BENCH_LIST_USERS', '20'))
+  prefix = f'{BENCH_USER_PREFIX}{uuid.uuid4().hex[:8]}-'
+  started_at = datetime.now(timezone.utc).isoformat()
+
+  try:
+    with TestClient(app, base_url='https://testserver') as client:
+      user_nos = [
+        client.post(
+          '/users/',
+          json={
+            'emlAddr': f'{prefix}{n}@example.com',
+            'userNm': f'{prefix}{n}',
+            'password': PASSWORD,
+            'userRole': 'USER',
+          },
+        ).json()['data']['userNo']
+        for n in range(list_users)
+      ]
+      targets = {
+        'GET /users/{user_no}': f'/users/{user_nos[0]}',
+        'GET /users/email/{eml_addr}': f'/users/email/{prefix}0@example.com',
+        'GET /users/?crtDtFrom=': '/users/?'
+        + urlencode({'crtDtFrom': started_at, 'pageSz': list_users}),
+      }
+      for label, url in targets.items():
+        etag = client.get(url).headers['etag']
+        for mode, sent_etag in (('full', None), ('conditional', etag)):
+          median_ms, queries, status_code, body_bytes = measure(
+            client, url, requests, sent_etag
+          )
+          print(
+            f'[BENCH] {label:<28} {mode:<11} {status_code} '
+            f'median {median_ms:6.2f} ms, {queries:.2f} queries/req, '
+            f'{body_bytes:,} bytes'
+          )
+  finally:
+    with engine.begin() as conn:
+      conn.execute(
+        text('DELETE FROM user_info WHERE user_nm LIKE :prefix'),
+        {'prefix': f'{prefix}%'},
+      )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,84 @@
+"""사용자 내보내기(GET /users/export) 메모리 사용량 측정
+
+같은 행 수를 두 가지 방식으로 NDJSON 텍스트로 만들며
+tracemalloc 최대 메모리를 비교합니다.
+
+1. 스트림: UserService.exportUsers (서버 측 커서로 EXPORT_CHUNK_SIZE행씩 읽고 변환)
+2. 비교용: 목록 조회처럼 결과 전체를 Row 리스트 -> UserVo 리스트로 만든 뒤 변환
+
+스트림 방식의 최대 메모리는 행 수와 관계없이 거의 일정해야 합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_export
+  BENCH_ROWS=1000,10000 uv run python -m benchmarks.bench_user_export
+
+환경 변수:
+  BENCH_ROWS: 측정할 행 수 (콤마 구분, 기본값 10000,100000)
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from typing import Callable
+
+from sqlmodel import Session
+
+from src.dao.user_dao import EXPORT_CHUNK_SIZE, UserDAO
+from src.db import engine, init_db
+from src.services.user_service import UserService
+from src.vos.user_vo import UserVo
+
+
+def measure(export: Callable[[], int]) -> tuple[int, float, float]:
+  """(출력 바이트 수, 최대 메모리 MB, 소요 시간 초)"""
+  tracemalloc.start()
+  started = time.perf_counter()
+  try:
+    size = export()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+  finally:
+    tracemalloc.stop()
+  return size, peak / 1024 / 1024, elapsed
+
+
+def export_stream(rows: int) -> int:
+  """exportUsers 스트림을 rows행까지 읽기"""
+  with Session(engine) as session:
+    chunks = UserService(session).exportUsers(UserVo(), 'ndjson')
+    size = 0
+    for count, chunk in enumerate(chunks, start=1):
+      size += len(chunk)
+      if count * EXPORT_CHUNK_SIZE >= rows:
+        break
+    return size
+
+
+def export_list(rows: int) -> int:
+  """결과 전체를 VO 리스트로 만든 뒤 NDJSON으로 변환"""
+  with Session(engine) as session:
+    statement = UserDAO.build_export_statement(UserVo()).limit(rows)
+    user_vos = [
+      UserVo.model_validate(row._mapping) for row in session.execute(statement).all()
+    ]
+    return sum(
+      len(json.dumps(user_vo.model_dump(mode='json', exclude_unset=True)) + '\n')
+      for user_vo in user_vos
+    )
+
+
+def main():
+  row_counts = [int(n) for n in os.getenv('BENCH_ROWS', '10000,100000').split(',')]
+  init_db()
+  for rows in row_counts:
+    for name, export in (('stream', export_stream), ('list', export_list)):
+      size, peak_mb, elapsed = measure(lambda: export(rows))
+      print(
+        f'[BENCH] {name:6} {rows:>9,} rows: peak {peak_mb:8.1f} MB, '
+        f'{size / 1024 / 1024:7.1f} MB out, {elapsed:6.1f}s'
+      )
+
+
+if __name__ == '__main__':
+  main()
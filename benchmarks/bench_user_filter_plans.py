@@ -0,0 +1,107 @@
+"""사용자 목록 필터 조합별 실행 계획 확인
+
+UserDAO.get_users가 실행하는 SQL(목록 조회, 건수 조회)을 그대로 캡처하여
+EXPLAIN (ANALYZE)으로 실행하고, user_info를 전체 스캔(Seq Scan)하는지 확인합니다.
+전체 스캔하는 조합이 있으면 종료 코드 1로 끝납니다.
+
+벤치마크용 사용자는 benchmarks.bench_user_list_paging과 같은 방식으로 채웁니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_filter_plans
+
+환경 변수:
+  BENCH_ROWS: 채울 사용자 수 (기본값 1000000)
+"""
+
+import json
+import os
+import sys
+from datetime import timedelta
+from typing import Any, Iterator
+
+from sqlalchemy import event, text
+from sqlmodel import Session
+
+from benchmarks.bench_user_list_paging import seed_users
+from src.dao.user_dao import UserDAO
+from src.db import engine, init_db
+from src.utils.datetime_helper import utc_now
+from src.vos.user_vo import UserVo
+
+# 자주 쓰는 get_users 필터 조합
+FILTER_CASES: dict[str, dict[str, Any]] = {
+  'delYn=N': {'delYn': 'N'},
+  'useYn=Y,delYn=N': {'useYn': 'Y', 'delYn': 'N'},
+  'userRole=ADMIN': {'userRole': 'ADMIN'},
+  'userRole=ADMIN,useYn=Y,delYn=N': {'userRole': 'ADMIN', 'useYn': 'Y', 'delYn': 'N'},
+  'userRole=USER,useYn=Y,delYn=N': {'userRole': 'USER', 'useYn': 'Y', 'delYn': 'N'},
+  'userRole=ADMIN,page=50': {'userRole': 'ADMIN', 'page': 50},
+  # 최근 로그인 사용자, 특정 날짜 가입자
+  'lastLgnDtFrom=10m ago': {'lastLgnDtFrom': utc_now() - timedelta(minutes=10)},
+  'crtDtFrom~crtDtTo=1 day': {
+    'crtDtFrom': utc_now() - timedelta(days=366),
+    'crtDtTo': utc_now() - timedelta(days=365),
+  },
+}
+
+
+def iter_plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+  yield node
+  for child in node.get('Plans', []):
+    yield from iter_plan_nodes(child)
+
+
+def capture_get_users_sql(user_vo: UserVo) -> list[tuple[str, Any]]:
+  """get_users가 실행하는 (SQL, 파라미터) 목록 캡처"""
+  captured: list[tuple[str, Any]] = []
+
+  def _capture(conn, cursor, statement, parameters, context, executemany):
+    captured.append((statement, parameters))
+
+  event.listen(engine, 'before_cursor_execute', _capture)
+  try:
+    with Session(engine) as session:
+      UserDAO.get_users(session, user_vo)
+  finally:
+    event.remove(engine, 'before_cursor_execute', _capture)
+  return captured
+
+
+def main():
+  rows = int(os.getenv('BENCH_ROWS', '1000000'))
+
+  init_db()
+  seed_users(rows)
+  # 인덱스 전용 스캔(Index Only Scan)이 가능하도록 visibility map 갱신
+  with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+    conn.execute(text('VACUUM ANALYZE user_info'))
+
+  seq_scans = 0
+  with engine.connect() as conn:
+    for label, filter_values in FILTER_CASES.items():
+      user_vo = UserVo(pageSz=20, **filter_values)
+      for kind, (statement, parameters) in zip(
+        ('list', 'count'), capture_get_users_sql(user_vo)
+      ):
+        plan_json = conn.exec_driver_sql(
+          f'EXPLAIN (ANALYZE, FORMAT JSON) {statement}', parameters
+        ).scalar_one()
+        plan = (plan_json if isinstance(plan_json, list) else json.loads(plan_json))[0]
+        scans = [
+          f'{node["Node Type"]}({node.get("Index Name", node.get("Relation Name"))})'
+          for node in iter_plan_nodes(plan['Plan'])
+          if 'Scan' in node['Node Type']
+        ]
+        if any(scan.startswith('Seq Scan') for scan in scans):
+          seq_scans += 1
+        print(
+          f'[PLAN] {label} {kind} {plan["Execution Time"]:.2f}ms {", ".join(scans)}'
+        )
+
+  if seq_scans:
+    print(f'[PLAN] Seq Scan {seq_scans}건')
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,149 @@
+"""사용자 대량 가입(POST /users/import) 처리량 측정
+
+1. 저장: 미리 해시화한 비밀번호로 UserDAO.insert_users만 반복 (DB 저장 처리량)
+2. 가입 API: NDJSON을 스트림으로 보내 검증/해시화/저장 전체 처리량 측정
+3. 비교용: POST /users를 한 건씩 호출한 처리량
+
+처리 시간은 대부분 비밀번호 해시화(sha256_crypt 80000 rounds)이므로
+가입 API 처리량은 PASSWORD_HASH_WORKERS(기본값 CPU 코어 수)에 비례합니다.
+측정이 끝나면 벤치마크 사용자를 삭제합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_import
+  BENCH_ROWS=2000 PASSWORD_HASH_WORKERS=8 uv run python -m benchmarks.bench_user_import
+
+환경 변수:
+  BENCH_ROWS: 가입 API로 생성할 사용자 수 (기본값 100000)
+  BENCH_LOAD_ROWS: 저장만 측정할 사용자 수 (기본값 100000)
+  BENCH_SINGLE_ROWS: POST /users로 생성할 사용자 수 (기본값 50)
+"""
+
+import json
+import os
+import time
+import uuid
+from typing import Iterator
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.dao.user_dao import UserDAO
+from src.db import engine, init_db
+from src.main import app
+from src.models import UserRole
+from src.utils.import_helper import IMPORT_BATCH_SIZE
+from src.utils.password_helper import hash_password, hash_pool
+from src.vos.user_vo import UserVo
+
+# 벤치마크 사용자 이름 접두사 (측정 후 삭제)
+IMPORT_USER_PREFIX = 'import-bench-'
+PASSWORD = 'pw123456!'
+
+
+def iter_ndjson(prefix: str, rows: int) -> Iterator[bytes]:
+  """가입할 사용자 NDJSON을 IMPORT_BATCH_SIZE행씩 생성 (요청 본문 스트림)"""
+  for start in range(0, rows, IMPORT_BATCH_SIZE):
+    yield ''.join(
+      json.dumps(
+        {
+          'emlAddr': f'{prefix}{n}@example.com',
+          'userNm': f'{prefix}{n}',
+          'password': PASSWORD,
+          'userRole': 'USER',
+        }
+      )
+      + '\n'
+      for n in range(start, min(start + IMPORT_BATCH_SIZE, rows))
+    ).encode()
+
+
+def bench_load(prefix: str, rows: int) -> float:
+  """해시화 없이 insert_users만 반복한 처리량 (행/초)"""
+  encpt_pswd = hash_password(PASSWORD)
+  user_vos = [
+    UserVo(
+      emlAddr=f'{prefix}{n}@example.com',
+      userNm=f'{prefix}{n}',
+      encptPswd=encpt_pswd,
+      userRole=UserRole.USER,
+    )
+    for n in range(rows)
+  ]
+  started = time.perf_counter()
+  with Session(engine) as session:
+    for start in range(0, rows, IMPORT_BATCH_SIZE):
+      UserDAO.insert_users(session, user_vos[start : start + IMPORT_BATCH_SIZE], 0)
+  return rows / (time.perf_counter() - started)
+
+
+def main():
+  rows = int(os.getenv('BENCH_ROWS', '100000'))
+  load_rows = int(os.getenv('BENCH_LOAD_ROWS', '100000'))
+  single_rows = int(os.getenv('BENCH_SINGLE_ROWS', '50'))
+  suffix = uuid.uuid4().hex[:8]
+  prefix = f'{IMPORT_USER_PREFIX}{suffix}-'
+
+  init_db()
+  try:
+    load_rate = bench_load(f'{prefix}load-', load_rows)
+    print(f'[BENCH] insert_users {load_rows} rows: {load_rate:,.0f} rows/s')
+
+    with TestClient(app, base_url='https://testserver') as client:
+      admin_eml_addr = f'{prefix}admin@example.com'
+      client.post(
+        '/users/',
+        json={
+          'emlAddr': admin_eml_addr,
+          'userNm': f'{prefix}admin',
+          'password': PASSWORD,
+          'userRole': 'ADMIN',
+        },
+      )
+      client.post(
+        '/auth/signin', json={'emlAddr': admin_eml_addr, 'password': PASSWORD}
+      )
+
+      # 해시화 프로세스 기동 시간은 제외
+      client.post(
+        '/users/import',
+        content=iter_ndjson(f'{prefix}warmup-', 1),
+        headers={'content-type': 'application/x-ndjson'},
+      )
+
+      started = time.perf_counter()
+      body = client.post(
+        '/users/import',
+        content=iter_ndjson(f'{prefix}api-', rows),
+        headers={'content-type': 'application/x-ndjson'},
+      ).json()
+      elapsed = time.perf_counter() - started
+      print(
+        f'[BENCH] POST /users/import {rows} rows: {rows / elapsed:,.1f} rows/s '
+        f'({elapsed:.1f}s, created={body["data"]["createdCnt"]}, '
+        f'hash_workers={hash_pool.workers})'
+      )
+
+      started = time.perf_counter()
+      for n in range(single_rows):
+        client.post(
+          '/users/',
+          json={
+            'emlAddr': f'{prefix}single-{n}@example.com',
+            'userNm': f'{prefix}single-{n}',
+            'password': PASSWORD,
+            'userRole': 'USER',
+          },
+        )
+      elapsed = time.perf_counter() - started
+      print(f'[BENCH] POST /users x{single_rows}: {single_rows / elapsed:,.1f} rows/s')
+  finally:
+    with engine.begin() as conn:
+      conn.execute(
+        text('DELETE FROM user_info WHERE user_nm LIKE :prefix'),
+        {'prefix': f'{IMPORT_USER_PREFIX}%'},
+      )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,114 @@
+"""사용자 목록 페이지 깊이별 지연 시간 벤치마크 (OFFSET vs 키셋 커서)
+
+벤치마크용 사용자(user_nm이 'bench-user-'로 시작)를 BENCH_ROWS만큼 채운 뒤,
+같은 페이지를 OFFSET 방식(UserDAO.get_users)과 키셋 방식(UserDAO.get_users_after)으로
+조회하여 페이지 깊이에 따른 지연 시간을 비교합니다.
+
+사용 방법:
+  uv run python -m benchmarks.bench_user_list_paging
+
+환경 변수:
+  BENCH_ROWS: 채울 사용자 수 (기본값 1000000)
+  BENCH_PAGE_SZ: 페이지 사이즈 (기본값 20)
+  BENCH_REPEAT: 페이지별 반복 횟수 (기본값 5, 중앙값 출력)
+  BENCH_CLEANUP: true면 종료 시 벤치마크용 사용자 삭제 (기본값 false)
+"""
+
+import os
+import statistics
+import time
+from typing import Callable
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.dao.user_dao import UserDAO
+from src.db import engine, init_db
+from src.vos.user_vo import UserVo
+
+BENCH_USER_PREFIX = 'bench-user-'
+
+
+def seed_users(rows: int) -> None:
+  """벤치마크용 사용자를 rows만큼 채움 (이미 있으면 부족한 만큼만)"""
+  with engine.begin() as conn:
+    existing = conn.execute(
+      text('SELECT count(*) FROM user_info WHERE user_nm LIKE :prefix'),
+      {'prefix': f'{BENCH_USER_PREFIX}%'},
+    ).scalar_one()
+    if existing >= rows:
+      return
+
+    started = time.perf_counter()
+    conn.execute(
+      text(
+        """
+        INSERT INTO user_info (eml_addr, user_nm, encpt_pswd, user_role, use_yn, del_yn)
+        SELECT 'bench' || n || '@example.com', :prefix || n, 'x',
+               CASE WHEN n % 10 = 0 THEN 'ADMIN' ELSE 'USER' END::user_role,
+               'Y'::yn_status, CASE WHEN n % 7 = 0 THEN 'Y' ELSE 'N' END::yn_status
+        FROM generate_series(:start, :stop) AS n
+        """
+      ),
+      {'prefix': BENCH_USER_PREFIX, 'start': existing + 1, 'stop': rows},
+    )
+    conn.execute(text('ANALYZE user_info'))
+    print(
+      f'[BENCH] seeded {rows - existing} users ({time.perf_counter() - started:.1f}s)'
+    )
+
+
+def median_ms(repeat: int, func: Callable[[], object]) -> float:
+  elapsed_ms: list[float] = []
+  for _ in range(repeat):
+    started = time.perf_counter()
+    func()
+    elapsed_ms.append((time.perf_counter() - started) * 1000)
+  return statistics.median(elapsed_ms)
+
+
+def main():
+  rows = int(os.getenv('BENCH_ROWS', '1000000'))
+  page_sz = int(os.getenv('BENCH_PAGE_SZ', '20'))
+  repeat = int(os.getenv('BENCH_REPEAT', '5'))
+
+  init_db()
+  seed_users(rows)
+
+  filters = {'': {}, ' useYn=Y,delYn=N': {'useYn': 'Y', 'delYn': 'N'}}
+  with Session(engine) as session:
+    for label, filter_values in filters.items():
+      total = UserDAO.get_users(session, UserVo(pageSz=1, **filter_values))[1]
+      last_page = max(total // page_sz, 1)
+      pages = sorted({1, 10, 100, 1000, last_page // 10, last_page // 2, last_page})
+
+      for page in [p for p in pages if 1 <= p <= last_page]:
+        user_vo = UserVo(page=page, pageSz=page_sz, **filter_values)
+        offset_ms = median_ms(repeat, lambda: UserDAO.get_users(session, user_vo))
+
+        # 이전 페이지 마지막 행의 userNo를 커서로 사용 (측정 제외)
+        if page == 1:
+          after_user_no = 2**31 - 1
+        else:
+          previous_vo = UserVo(page=page - 1, pageSz=page_sz, **filter_values)
+          after_user_no = UserDAO.get_users(session, previous_vo)[0][-1].userNo
+        keyset_ms = median_ms(
+          repeat, lambda: UserDAO.get_users_after(session, user_vo, after_user_no)
+        )
+        session.expunge_all()
+
+        print(
+          f'[BENCH]{label} page={page} offset={(page - 1) * page_sz} '
+          f'offset_ms={offset_ms:.2f} keyset_ms={keyset_ms:.2f}'
+        )
+
+  if os.getenv('BENCH_CLEANUP', 'false').lower() == 'true':
+    with engine.begin() as conn:
+      conn.execute(
+        text('DELETE FROM user_info WHERE user_nm LIKE :prefix'),
+        {'prefix': f'{BENCH_USER_PREFIX}%'},
+      )
+
+
+if __name__ == '__main__':
+  main()
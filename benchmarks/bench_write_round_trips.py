@@ -0,0 +1,139 @@
+"""쓰기 API별 DB 왕복(round trip) 횟수 측정
+
+사용자 생성부터 로그아웃까지 쓰기 API를 한 번씩 호출하고,
+요청마다 실행한 SQL 문 수와 트랜잭션 시작/종료(BEGIN/COMMIT/ROLLBACK) 수를 셉니다.
+(pool_pre_ping의 연결 확인은 SQLAlchemy 이벤트에 잡히지 않으므로 제외)
+
+사용 방법:
+  DB_ASYNC_ENABLED=false uv run python -m benchmarks.bench_write_round_trips
+  DB_ASYNC_ENABLED=true uv run python -m benchmarks.bench_write_round_trips
+"""
+
+import uuid
+from collections import Counter
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from src.db import ALL_ENGINES
+from src.main import app
+from src.settings import settings
+
+# 현재 요청에서 발생한 DB 이벤트 수 (요청을 순차 실행하므로 하나만 사용)
+round_trips: Counter[str] = Counter()
+
+
+def instrument_round_trips() -> None:
+  for engine in ALL_ENGINES:
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+      round_trips[statement.split(None, 1)[0].upper()] += 1
+
+    @event.listens_for(engine, 'begin')
+    def _on_begin(conn):
+      round_trips['BEGIN'] += 1
+
+    @event.listens_for(engine, 'commit')
+    def _on_commit(conn):
+      round_trips['COMMIT'] += 1
+
+    @event.listens_for(engine, 'rollback')
+    def _on_rollback(conn):
+      round_trips['ROLLBACK'] += 1
+
+
+def main():
+  instrument_round_trips()
+  suffix = uuid.uuid4().hex[:8]
+  eml_addr = f'rt-{suffix}@example.com'
+  password = 'pw123456!'
+
+  with TestClient(app, base_url='https://testserver') as client:
+
+    def measure(label: str, method: str, url: str, **kwargs) -> dict:
+      round_trips.clear()
+      body = client.request(method, url, **kwargs).json()
+      detail = ' '.join(f'{key}={count}' for key, count in sorted(round_trips.items()))
+      print(
+        f'[BENCH] {label:<28} code={body["code"]:<6} '
+        f'round_trips={sum(round_trips.values())} ({detail})'
+      )
+      return body
+
+    created = measure(
+      'POST /users',
+      'POST',
+      '/users/',
+      json={
+        'emlAddr': eml_addr,
+        'userNm': f'rt-{suffix}',
+        'password': password,
+        'userRole': 'USER',
+      },
+    )
+    user_no = created['data']['userNo']
+    # 사용자명 중복 수정 확인용 다른 사용자
+    client.post(
+      '/users/',
+      json={
+        'emlAddr': f'rt-other-{suffix}@example.com',
+        'userNm': f'rt-other-{suffix}',
+        'password': password,
+        'userRole': 'USER',
+      },
+    )
+
+    # 중복 이메일/사용자명 (UNIQUE 제약 위반 -> CONFLICT)
+    measure(
+      'POST /users (dup email)',
+      'POST',
+      '/users/',
+      json={
+        'emlAddr': eml_addr,
+        'userNm': f'rt-dup-{suffix}',
+        'password': password,
+        'userRole': 'USER',
+      },
+    )
+    measure(
+      'POST /users (dup userNm)',
+      'POST',
+      '/users/',
+      json={
+        'emlAddr': f'rt-dup-{suffix}@example.com',
+        'userNm': f'rt-{suffix}',
+        'password': password,
+        'userRole': 'USER',
+      },
+    )
+
+    measure(
+      'POST /auth/signin',
+      'POST',
+      '/auth/signin',
+      json={'emlAddr': eml_addr, 'password': password},
+    )
+    measure('GET /users/{no}', 'GET', f'/users/{user_no}')
+    measure('PATCH /users/{no}', 'PATCH', f'/users/{user_no}', json={'userBiogp': 'rt'})
+    measure(
+      'PATCH /users/{no} (dup)',
+      'PATCH',
+      f'/users/{user_no}',
+      json={'userNm': f'rt-other-{suffix}'},
+    )
+    measure(
+      'PATCH /users/{no}/password',
+      'PATCH',
+      f'/users/{user_no}/password',
+      json={'password': 'pw234567!'},
+    )
+    measure('POST /auth/refresh', 'POST', '/auth/refresh')
+    measure('POST /auth/signout', 'POST', '/auth/signout')
+
+  mode = 'async' if settings.DB_ASYNC_ENABLED else 'sync'
+  print(f'[BENCH] mode={mode}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,212 @@
+from typing import AsyncIterator, Optional, Sequence
+
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.dao.user_dao import UserDAO, UserListVersion, UserStatus, UserVersion
+from src.models import UserInfo
+from src.utils.cache_helper import CacheBackend
+from src.vos.user_vo import UserVo
+
+
+class AsyncUserDAO:
+  """사용자 데이터 접근 객체 (비동기)
+
+  쿼리 로직은 UserDAO를 그대로 사용하고, AsyncSession.run_sync로 실행합니다.
+  run_sync 내부의 I/O는 psycopg 비동기 드라이버를 통해 이벤트 루프에서 처리됩니다.
+  캐시는 UserDAO와 같이 생성자로 주입합니다.
+  """
+
+  def __init__(
+    self,
+    user_cache: Optional[CacheBackend] = None,
+    user_status_cache: Optional[CacheBackend] = None,
+  ):
+    self.dao = UserDAO(user_cache, user_status_cache)
+
+  @staticmethod
+  def get_conflict_field(error: IntegrityError) -> Optional[str]:
+    """UNIQUE 제약 위반 오류에서 중복된 필드(emlAddr, userNm) 반환 (I/O 없음)"""
+    return UserDAO.get_conflict_field(error)
+
+  @staticmethod
+  async def create_user(
+    session: AsyncSession, user_vo: UserVo, crt_no: int
+  ) -> UserInfo:
+    """사용자 생성"""
+    return await session.run_sync(UserDAO.create_user, user_vo, crt_no)
+
+  @staticmethod
+  async def insert_users(
+    session: AsyncSession, user_vos: list[UserVo], crt_no: int
+  ) -> dict[str, int]:
+    """다건 사용자 생성 (저장된 사용자의 이메일 -> 사용자 번호)"""
+    return await session.run_sync(UserDAO.insert_users, user_vos, crt_no)
+
+  @staticmethod
+  async def get_existing_eml_addrs(
+    session: AsyncSession, eml_addrs: list[str]
+  ) -> set[str]:
+    """이미 가입된 이메일 조회"""
+    return await session.run_sync(UserDAO.get_existing_eml_addrs, eml_addrs)
+
+  async def get_user_by_no(
+    self, session: AsyncSession, user_no: int
+  ) -> Optional[UserInfo]:
+    """번호로 사용자 조회"""
+    return await session.run_sync(self.dao.get_user_by_no, user_no)
+
+  async def load_user_by_no(
+    self, session: AsyncSession, user_no: int
+  ) -> Optional[UserInfo]:
+    """번호로 사용자를 DB에서 조회 (캐시 사용 안 함, 수정/인증 정보 확인용)"""
+    return await session.run_sync(self.dao.load_user_by_no, user_no)
+
+  async def get_user_version(
+    self, session: AsyncSession, user_no: int
+  ) -> Optional[UserVersion]:
+    """번호로 사용자 버전 조회 (If-None-Match 비교용, 공유 캐시 우선)"""
+    return await session.run_sync(self.dao.get_user_version, user_no)
+
+  def get_cached_user_status(self, user_no: int) -> Optional[UserStatus]:
+    """캐시된 사용자 상태 조회 (DB 조회 없음, 없으면 None)"""
+    return self.dao.get_cached_user_status(user_no)
+
+  async def load_user_status(
+    self, session: AsyncSession, user_no: int
+  ) -> Optional[UserStatus]:
+    """사용자 상태를 DB에서 조회 후 캐시"""
+    return await session.run_sync(self.dao.load_user_status, user_no)
+
+  async def get_user_by_email(
+    self, session: AsyncSession, eml_addr: str
+  ) -> Optional[UserInfo]:
+    """이메일로 사용자 조회"""
+    return await session.run_sync(self.dao.get_user_by_email, eml_addr)
+
+  async def load_user_by_email(
+    self, session: AsyncSession, eml_addr: str
+  ) -> Optional[UserInfo]:
+    """이메일로 사용자를 DB에서 조회 (캐시 사용 안 함, 인증 정보 확인용)"""
+    return await session.run_sync(self.dao.load_user_by_email, eml_addr)
+
+  async def get_user_version_by_email(
+    self, session: AsyncSession, eml_addr: str
+  ) -> Optional[UserVersion]:
+    """이메일로 사용자 버전 조회 (If-None-Match 비교용, 공유 캐시 우선)"""
+    return await session.run_sync(self.dao.get_user_version_by_email, eml_addr)
+
+  @staticmethod
+  async def get_public_user_by_no(
+    session: AsyncSession, user_no: int, fields: Optional[list[str]] = None
+  ) -> Optional[Row]:
+    """번호로 사용자의 공개 컬럼만 조회"""
+    return await session.run_sync(UserDAO.get_public_user_by_no, user_no, fields)
+
+  @staticmethod
+  async def get_public_users(
+    session: AsyncSession,
+    user_nos: list[int],
+    eml_addrs: list[str],
+    fields: Optional[list[str]] = None,
+  ) -> Sequence[Row]:
+    """번호/이메일 목록으로 사용자의 공개 컬럼 다건 조회"""
+    return await session.run_sync(UserDAO.get_public_users, user_nos, eml_addrs, fields)
+
+  @staticmethod
+  async def get_public_user_by_email(
+    session: AsyncSession, eml_addr: str, fields: Optional[list[str]] = None
+  ) -> Optional[Row]:
+    """이메일로 사용자의 공개 컬럼만 조회"""
+    return await session.run_sync(UserDAO.get_public_user_by_email, eml_addr, fields)
+
+  @staticmethod
+  async def get_user_by_username(
+    session: AsyncSession, user_nm: str
+  ) -> Optional[UserInfo]:
+    """사용자명으로 사용자 조회"""
+    return await session.run_sync(UserDAO.get_user_by_username, user_nm)
+
+  @staticmethod
+  async def get_users(
+    session: AsyncSession,
+    user_vo: Optional[UserVo] = None,
+    total_cnt: Optional[int] = None,
+  ) -> tuple[list[Row], int]:
+    """사용자 목록 조회 (현재 페이지 목록, 전체 건수)"""
+    return await session.run_sync(UserDAO.get_users, user_vo, total_cnt)
+
+  @staticmethod
+  async def get_users_version(
+    session: AsyncSession, user_vo: UserVo
+  ) -> UserListVersion:
+    """검색 조건에 맞는 사용자 수와 최근 수정 일시 조회 (목록 ETag용)"""
+    return await session.run_sync(UserDAO.get_users_version, user_vo)
+
+  @staticmethod
+  async def get_users_after(
+    session: AsyncSession, user_vo: UserVo, after_user_no: int
+  ) -> tuple[list[Row], bool]:
+    """키셋(커서) 방식 사용자 목록 조회 (다음 사용자 목록, 이후 행 존재 여부)"""
+    return await session.run_sync(UserDAO.get_users_after, user_vo, after_user_no)
+
+  @staticmethod
+  async def stream_users(
+    session: AsyncSession, user_vo: UserVo, fields: Optional[list[str]] = None
+  ) -> AsyncIterator[Sequence[Row]]:
+    """검색 조건에 맞는 사용자 전체를 EXPORT_CHUNK_SIZE행씩 조회 (공개 컬럼만)
+
+    run_sync 안에서는 결과를 나누어 돌려줄 수 없으므로 AsyncSession.stream으로
+    서버 측 커서를 직접 사용합니다. (SELECT 문은 UserDAO와 공통)
+    """
+    result = await session.stream(UserDAO.build_export_statement(user_vo, fields))
+    return result.partitions()
+
+  async def update_user_password(
+    self, session: AsyncSession, user: UserInfo, encpt_pswd: str, updt_no: int
+  ) -> UserInfo:
+    """사용자 비밀번호 업데이트"""
+    return await session.run_sync(
+      self.dao.update_user_password, user, encpt_pswd, updt_no
+    )
+
+  async def update_user(
+    self, session: AsyncSession, user: UserInfo, user_vo: UserVo, updt_no: int
+  ) -> UserInfo:
+    """사용자 정보 업데이트"""
+    return await session.run_sync(self.dao.update_user, user, user_vo, updt_no)
+
+  async def delete_user(
+    self, session: AsyncSession, user: UserInfo, updt_no: int
+  ) -> None:
+    """사용자 삭제 (소프트 삭제)"""
+    await session.run_sync(self.dao.delete_user, user, updt_no)
+
+  async def delete_users(
+    self, session: AsyncSession, user_nos: list[int], updt_no: int
+  ) -> list[int]:
+    """다건 사용자 삭제 (소프트 삭제, 삭제 처리된 사용자 번호 반환)"""
+    return await session.run_sync(self.dao.delete_users, user_nos, updt_no)
+
+  async def update_user_login_info(
+    self, session: AsyncSession, user: UserInfo, refresh_token: str, updt_no: int
+  ) -> UserInfo:
+    """사용자 로그인 정보 업데이트 (마지막 로그인, 리프레시 토큰)"""
+    return await session.run_sync(
+      self.dao.update_user_login_info, user, refresh_token, updt_no
+    )
+
+  async def clear_user_refresh_token(
+    self, session: AsyncSession, user: UserInfo, updt_no: int
+  ) -> UserInfo:
+    """사용자 리프레시 토큰 초기화 (로그아웃)"""
+    return await session.run_sync(self.dao.clear_user_refresh_token, user, updt_no)
+
+  async def update_user_refresh_token(
+    self, session: AsyncSession, user: UserInfo, new_refresh_token: str, updt_no: int
+  ) -> UserInfo:
+    """사용자 리프레시 토큰 업데이트 (재발급 시)"""
+    return await session.run_sync(
+      self.dao.update_user_refresh_token, user, new_refresh_token, updt_no
+    )
@@ -1,14 +1,183 @@
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime
+from typing import Any, Iterator, NamedTuple, Optional, Sequence, TypeVar
 
-from sqlmodel import Session, select
+from sqlalchemy import (
+  ARRAY,
+  Column,
+  Integer,
+  MetaData,
+  Row,
+  Select,
+  String,
+  Table,
+  any_,
+  bindparam,
+  cast,
+  func,
+  or_,
+  update,
+)
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import Session, col, select
 
 from src.models import UserInfo, UserRole, YnStatus
+from src.settings import settings
+from src.utils.cache_helper import CacheBackend, register_cache
+from src.utils.constraint_helper import get_unique_violation
+from src.utils.copy_helper import copy_rows
+from src.utils.datetime_helper import utc_now
+from src.utils.email_helper import normalize_email
+from src.utils.prepare_helper import PREPARED_LOOKUP
+from src.utils.search_helper import LIKE_ESCAPE, is_trigram_available, to_like_pattern
+from src.vos.search_vo import SRCH_SORT_SIMILARITY
 from src.vos.user_vo import UserVo
 
+TStatement = TypeVar('TStatement', bound=Select)
+
+# 다건 UPDATE 한 번에 전달할 최대 사용자 번호 수
+BULK_CHUNK_SIZE = 1000
+
+# 내보내기에서 서버 측 커서로 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 1000
+
+# 조회 API에서 응답하는 공개 필드 (encptPswd, reshToken은 조회하지 않음)
+USER_PUBLIC_FIELDS = (
+  'userNo',
+  'emlAddr',
+  'userNm',
+  'userRole',
+  'proflImg',
+  'userBiogp',
+  'useYn',
+  'delYn',
+  'lastLgnDt',
+  'lastPswdChgDt',
+  'crtNo',
+  'crtDt',
+  'updtNo',
+  'updtDt',
+  'delNo',
+  'delDt',
+)
+
+# UNIQUE 제약조건(인덱스) 이름 -> 중복된 필드 (Postgres 기본 이름: 테이블_컬럼_key)
+USER_UNIQUE_CONSTRAINTS = {
+  'ix_user_info_eml_addr_lower': 'emlAddr',
+  'user_info_user_nm_key': 'userNm',
+}
+
+# 캐시에 저장하지 않는 인증 정보 컬럼 (인증 경로는 load_user_by_*로 매번 DB에서 조회)
+USER_CREDENTIAL_FIELDS = ('encptPswd', 'reshToken')
+
+# 캐시에 저장하는 컬럼 (UserInfo의 컬럼 중 인증 정보 제외)
+USER_CACHED_COLUMNS = [
+  attr
+  for attr in sa_inspect(UserInfo).column_attrs
+  if attr.key not in USER_CREDENTIAL_FIELDS
+]
+USER_CACHED_FIELDS = tuple(attr.key for attr in USER_CACHED_COLUMNS)
+
+# 캐시 값 구조 (컬럼 이름과 타입, 바뀌면 공유 저장소에 남은 이전 값을 읽지 않음)
+USER_CACHE_VERSION = ','.join(
+  f'{attr.key}:{attr.columns[0].type}' for attr in USER_CACHED_COLUMNS
+)
+
+# 이메일 비교 키 (ix_user_info_eml_addr_lower 인덱스와 같은 식이어야 인덱스 사용)
+EML_ADDR_LOWER = func.lower(col(UserInfo.emlAddr))
+
+# 사용자 단건 조회 캐시 (get_user_by_no/get_user_by_email)
+# ('userNo', 번호) -> 컬럼 값 dict, ('emlAddr', 정규화된 이메일) -> 사용자 번호
+user_cache = register_cache(
+  'user',
+  max_size=settings.USER_CACHE_SIZE,
+  ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+  enabled=settings.USER_CACHE_ENABLED,
+  version=USER_CACHE_VERSION,
+)
+
+
+def get_user_cache() -> CacheBackend:
+  """사용자 단건 조회 캐시 의존성 주입"""
+  return user_cache
+
+
+class UserStatus(NamedTuple):
+  """인증 의존성에서 확인하는 사용자 상태"""
+
+  userRole: UserRole
+  useYn: YnStatus
+  delYn: YnStatus
+
+  @property
+  def is_active(self) -> bool:
+    """사용 중이고 삭제되지 않은 사용자인지 여부"""
+    return self.useYn == YnStatus.Y and self.delYn == YnStatus.N
+
+
+class UserVersion(NamedTuple):
+  """사용자 단건 조회 응답의 버전 (ETag용, 사용자를 바꾸는 모든 쓰기가 updtDt를 갱신)"""
+
+  userNo: int
+  updtDt: datetime
+
+
+class UserListVersion(NamedTuple):
+  """사용자 목록 조회 응답의 버전 (ETag용, 검색 조건에 맞는 사용자 기준)
+
+  사용자가 조건에 새로 들어오면 maxUpdtDt가, 조건에서 빠지기만 하면 totalCnt가
+  바뀝니다. (사용자는 삭제해도 행이 남음)
+  """
+
+  totalCnt: int
+  maxUpdtDt: Optional[datetime]
+
+
+# 사용자 상태 캐시 (인증 의존성용, 사용자 번호 -> UserStatus)
+# 보호된 API마다 조회하므로 짧은 TTL로 유지하고, 사용자 쓰기 후 함께 무효화
+user_status_cache = register_cache(
+  'user_status',
+  max_size=settings.USER_CACHE_SIZE,
+  ttl_seconds=settings.AUTH_STATUS_CACHE_TTL_SECONDS,
+  enabled=settings.USER_CACHE_ENABLED,
+  version=','.join(UserStatus._fields),
+)
+
+
+def get_user_status_cache() -> CacheBackend:
+  """사용자 상태 캐시 의존성 주입"""
+  return user_status_cache
+
+
+# 대량 가입 COPY 대상 임시 테이블 (트랜잭션이 끝나면 삭제)
+USER_IMPORT_STAGE = Table(
+  'user_import_stage',
+  MetaData(),
+  Column('eml_addr', String),
+  Column('user_nm', String),
+  Column('encpt_pswd', String),
+  Column('user_role', String),
+  prefixes=['TEMPORARY'],
+  postgresql_on_commit='DROP',
+)
+
 
 class UserDAO:
-  """사용자 데이터 접근 객체"""
+  """사용자 데이터 접근 객체
+
+  사용자 캐시와 사용자 상태 캐시는 생성자로 주입하며, 없으면 등록된 기본 캐시를
+  사용합니다. 캐시를 쓰지 않는 조회/저장은 정적 메서드입니다.
+  """
+
+  def __init__(
+    self,
+    user_cache: Optional[CacheBackend] = None,
+    user_status_cache: Optional[CacheBackend] = None,
+  ):
+    self.user_cache = user_cache or get_user_cache()
+    self.user_status_cache = user_status_cache or get_user_status_cache()
 
   @staticmethod
   def create_user(session: Session, user_vo: UserVo, crt_no: int) -> UserInfo:
@@ -20,7 +189,7 @@ class UserDAO:
     assert user_vo.userNm is not None, 'userNm is required'
     assert user_vo.encptPswd is not None, 'encptPswd is required'
 
-    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = utc_now()
     user = UserInfo(
       emlAddr=user_vo.emlAddr,
       userNm=user_vo.userNm,
@@ -34,82 +203,460 @@ class UserDAO:
       updtDt=now,  # 생성 시 수정 일시도 동일하게 설정
     )
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    UserDAO._commit_or_rollback(session)
     print('[DAO] user_entity:', user)
     return user
 
   @staticmethod
-  def get_user_by_no(session: Session, user_no: int) -> Optional[UserInfo]:
-    """번호로 사용자 조회"""
-    statement = select(UserInfo).where(UserInfo.userNo == user_no)
-    return session.exec(statement).first()
+  def insert_users(
+    session: Session, user_vos: list[UserVo], crt_no: int
+  ) -> dict[str, int]:
+    """다건 사용자 생성 (대량 가입)
+
+    행을 임시 테이블에 COPY한 뒤 INSERT ... SELECT ... ON CONFLICT DO NOTHING
+    RETURNING 한 번으로 옮기고 커밋합니다. 이메일/사용자명이 이미 있는 행은
+    오류 없이 건너뛰므로 반환값에 없는 행이 중복된 행입니다.
+    (Service에서 비밀번호 해시화/검증 완료, 사용/삭제 여부와 일시는 컬럼 기본값)
+
+    Returns:
+      저장된 사용자의 이메일 -> 사용자 번호
+    """
+    connection = session.connection()
+    USER_IMPORT_STAGE.create(connection)
+    copy_rows(
+      connection,
+      f'COPY {USER_IMPORT_STAGE.name} '
+      f'({", ".join(USER_IMPORT_STAGE.c.keys())}) FROM STDIN',
+      (
+        (
+          user_vo.emlAddr,
+          user_vo.userNm,
+          user_vo.encptPswd,
+          (user_vo.userRole or UserRole.USER).value,
+        )
+        for user_vo in user_vos
+      ),
+    )
+
+    user_table = UserInfo.__table__  # type: ignore[attr-defined]
+    stage = USER_IMPORT_STAGE.c
+    statement = (
+      pg_insert(UserInfo)
+      .from_select(
+        ['eml_addr', 'user_nm', 'encpt_pswd', 'user_role', 'crt_no', 'updt_no'],
+        select(
+          stage.eml_addr,
+          stage.user_nm,
+          stage.encpt_pswd,
+          cast(stage.user_role, user_table.c.user_role.type),
+          bindparam('crt_no', crt_no),
+          bindparam('updt_no', crt_no),
+        ),
+      )
+      .on_conflict_do_nothing()
+      .returning(col(UserInfo.emlAddr), col(UserInfo.userNo))
+    )
+    created = {eml_addr: user_no for eml_addr, user_no in session.execute(statement)}
+    session.commit()
+    return created
 
   @staticmethod
-  def get_user_by_email(session: Session, eml_addr: str) -> Optional[UserInfo]:
-    """이메일로 사용자 조회"""
-    statement = select(UserInfo).where(UserInfo.emlAddr == eml_addr)
-    return session.exec(statement).first()
+  def get_existing_eml_addrs(session: Session, eml_addrs: list[str]) -> set[str]:
+    """이미 가입된 이메일 조회 (대량 가입 중복 사유 판별용, 정규화된 이메일 반환)"""
+    normalized = [normalize_email(eml_addr) for eml_addr in eml_addrs]
+    statement = select(EML_ADDR_LOWER).where(
+      EML_ADDR_LOWER == any_(bindparam('eml_addrs', normalized, ARRAY(String)))
+    )
+    return set(session.execute(statement).scalars().all())
+
+  @staticmethod
+  def _commit_or_rollback(session: Session) -> None:
+    """커밋 (제약조건 위반 시 세션을 되돌린 뒤 IntegrityError를 그대로 전달)"""
+    try:
+      session.commit()
+    except IntegrityError:
+      session.rollback()
+      raise
+
+  @staticmethod
+  def get_conflict_field(error: IntegrityError) -> Optional[str]:
+    """UNIQUE 제약 위반 오류에서 중복된 필드(emlAddr, userNm) 반환 (그 외 None)"""
+    return USER_UNIQUE_CONSTRAINTS.get(get_unique_violation(error) or '')
+
+  def _cache_user(self, user: UserInfo, generation: int) -> None:
+    """조회한 사용자를 캐시에 저장 (세션과 분리된 컬럼 값, 인증 정보 제외)"""
+    values = {key: getattr(user, key) for key in USER_CACHED_FIELDS}
+    self.user_cache.set(('userNo', user.userNo), values, generation)
+    self.user_cache.set(
+      ('emlAddr', normalize_email(user.emlAddr)), user.userNo, generation
+    )
+
+  @staticmethod
+  def _attach_cached_user(session: Session, values: dict[str, Any]) -> UserInfo:
+    """캐시한 컬럼 값을 DB 조회 없이 세션의 영속 객체로 복원 (조회 전용)
+
+    캐시 값을 DB에 저장된 상태로 취급하므로, 캐시가 오래된 상태에서 수정하면 캐시 값과
+    같은 값으로 바꾸는 변경이 UPDATE에서 빠집니다. 수정할 사용자는 load_user_by_*로
+    조회합니다. 인증 정보(encptPswd, reshToken)는 캐시하지 않으므로 None입니다.
+    """
+    user = UserInfo(**values, **dict.fromkeys(USER_CREDENTIAL_FIELDS))
+    make_transient_to_detached(user)
+    return session.merge(user, load=False)
+
+  def invalidate_user_cache(self, *users: UserInfo) -> None:
+    """사용자 캐시 무효화 (사용자를 바꾸는 쓰기 후 호출)"""
+    self.user_cache.delete(
+      *(('userNo', user.userNo) for user in users),
+      *(('emlAddr', normalize_email(user.emlAddr)) for user in users),
+    )
+    self.user_status_cache.delete(*(user.userNo for user in users))
+
+  def get_cached_user_status(self, user_no: int) -> Optional[UserStatus]:
+    """캐시된 사용자 상태 조회 (DB 조회 없음, 없으면 None)"""
+    return self.user_status_cache.get(user_no)
+
+  def load_user_status(self, session: Session, user_no: int) -> Optional[UserStatus]:
+    """사용자 상태를 DB에서 조회 후 캐시 (상태 컬럼만 prepared statement로 조회)"""
+    generation = self.user_status_cache.generation
+    statement = (
+      select(UserInfo.userRole, UserInfo.useYn, UserInfo.delYn)
+      .where(UserInfo.userNo == user_no)
+      .execution_options(**PREPARED_LOOKUP)
+    )
+    row = session.exec(statement).first()
+    if row is None:
+      return None
+    user_status = UserStatus(*row)
+    self.user_status_cache.set(user_no, user_status, generation)
+    return user_status
+
+  def _load_user(self, session: Session, condition: Any) -> Optional[UserInfo]:
+    """조건으로 사용자를 prepared statement로 조회 후 캐시"""
+    generation = self.user_cache.generation
+    statement = select(UserInfo).where(condition).execution_options(**PREPARED_LOOKUP)
+    user = session.exec(statement).first()
+    if user:
+      self._cache_user(user, generation)
+    return user
+
+  def _get_cached_values_by_email(self, eml_addr: str) -> Optional[dict[str, Any]]:
+    """캐시에서 정규화된 이메일로 사용자 컬럼 값 조회 (없으면 None)"""
+    user_no = self.user_cache.get(('emlAddr', eml_addr))
+    values = self.user_cache.get(('userNo', user_no)) if user_no is not None else None
+    # 이메일이 바뀐 사용자는 이전 이메일 키가 남아 있을 수 있으므로 확인
+    if values is not None and normalize_email(values['emlAddr']) == eml_addr:
+      return values
+    return None
+
+  def get_user_by_no(self, session: Session, user_no: int) -> Optional[UserInfo]:
+    """번호로 사용자 조회 (캐시에 없으면 prepared statement로 조회, 조회 전용)"""
+    values = self.user_cache.get(('userNo', user_no))
+    if values is not None:
+      return UserDAO._attach_cached_user(session, values)
+    return self._load_user(session, UserInfo.userNo == user_no)
+
+  def load_user_by_no(self, session: Session, user_no: int) -> Optional[UserInfo]:
+    """번호로 사용자를 DB에서 조회 (캐시 사용 안 함, 수정/인증 정보 확인용)"""
+    return self._load_user(session, UserInfo.userNo == user_no)
+
+  def _load_user_version(
+    self, session: Session, condition: Any, cached: Optional[dict[str, Any]]
+  ) -> Optional[UserVersion]:
+    """사용자 버전 조회 (If-None-Match 비교용)
+
+    워커 간에 무효화되는 공유 캐시(shm, redis)에 있으면 DB를 조회하지 않으며, 없으면
+    전체 컬럼을 조회해 캐시합니다. 워커별 캐시(memory)는 다른 워커의 쓰기를 모르므로
+    사용하지 않고 수정 일시만 조회합니다.
+    """
+    if not self.user_cache.shared:
+      statement = (
+        select(UserInfo.userNo, UserInfo.updtDt)
+        .where(condition)
+        .execution_options(**PREPARED_LOOKUP)
+      )
+      row = session.exec(statement).first()
+      return UserVersion(*row) if row else None
+    if cached is not None:
+      return UserVersion(cached['userNo'], cached['updtDt'])
+    user = self._load_user(session, condition)
+    return UserVersion(user.userNo, user.updtDt) if user else None
+
+  def get_user_version(self, session: Session, user_no: int) -> Optional[UserVersion]:
+    """번호로 사용자 버전 조회 (If-None-Match 비교용, 공유 캐시 우선)"""
+    cached = (
+      self.user_cache.get(('userNo', user_no)) if self.user_cache.shared else None
+    )
+    return self._load_user_version(session, UserInfo.userNo == user_no, cached)
+
+  @staticmethod
+  def get_public_user_by_no(
+    session: Session, user_no: int, fields: Optional[list[str]] = None
+  ) -> Optional[Row]:
+    """번호로 사용자의 공개 컬럼만 조회 (fields가 있으면 해당 컬럼만)"""
+    statement = UserDAO._select_public(fields).where(UserInfo.userNo == user_no)
+    if fields is None:
+      # 기본 조회는 SQL이 고정이므로 prepared statement 사용
+      statement = statement.execution_options(**PREPARED_LOOKUP)
+    return session.execute(statement).first()
+
+  @staticmethod
+  def get_public_users(
+    session: Session,
+    user_nos: list[int],
+    eml_addrs: list[str],
+    fields: Optional[list[str]] = None,
+  ) -> Sequence[Row]:
+    """번호/이메일 목록으로 사용자의 공개 컬럼 다건 조회
+
+    WHERE user_no = ANY(:user_nos) OR lower(eml_addr) = ANY(...) 한 번으로 조회합니다.
+    결과는 순서가 없으며, 요청 순서 정렬과 없는 사용자 판별은 서비스에서 처리합니다.
+    (이메일로 조회하면 결과와 요청을 맞추기 위해 emlAddr 컬럼을 함께 조회)
+    """
+    if eml_addrs and fields is not None and 'emlAddr' not in fields:
+      fields = [*fields, 'emlAddr']
+
+    conditions = []
+    if user_nos:
+      conditions.append(
+        col(UserInfo.userNo) == any_(bindparam('user_nos', user_nos, ARRAY(Integer)))
+      )
+    if eml_addrs:
+      normalized = [normalize_email(eml_addr) for eml_addr in eml_addrs]
+      conditions.append(
+        EML_ADDR_LOWER == any_(bindparam('eml_addrs', normalized, ARRAY(String)))
+      )
+    statement = UserDAO._select_public(fields).where(or_(*conditions))
+    return session.execute(statement).all()
+
+  @staticmethod
+  def get_public_user_by_email(
+    session: Session, eml_addr: str, fields: Optional[list[str]] = None
+  ) -> Optional[Row]:
+    """이메일로 사용자의 공개 컬럼만 조회 (fields가 있으면 해당 컬럼만)"""
+    statement = UserDAO._select_public(fields).where(
+      EML_ADDR_LOWER == normalize_email(eml_addr)
+    )
+    if fields is None:
+      # 기본 조회는 SQL이 고정이므로 prepared statement 사용
+      statement = statement.execution_options(**PREPARED_LOOKUP)
+    return session.execute(statement).first()
+
+  @staticmethod
+  def _select_public(fields: Optional[list[str]] = None) -> Select:
+    """공개 컬럼 SELECT 문 생성
+
+    fields가 없으면 USER_PUBLIC_FIELDS 전체를, 있으면 해당 컬럼과 정렬/커서 키인
+    userNo만 조회합니다. (fields는 서비스에서 USER_PUBLIC_FIELDS 안의 값인지 검증)
+    """
+    names = (
+      USER_PUBLIC_FIELDS
+      if fields is None
+      else ['userNo', *(name for name in fields if name != 'userNo')]
+    )
+    return select(*(getattr(UserInfo, name) for name in names))
+
+  def get_user_by_email(self, session: Session, eml_addr: str) -> Optional[UserInfo]:
+    """이메일로 사용자 조회 (캐시에 없으면 prepared statement로 조회)"""
+    eml_addr = normalize_email(eml_addr)
+    values = self._get_cached_values_by_email(eml_addr)
+    if values is not None:
+      return UserDAO._attach_cached_user(session, values)
+    return self._load_user(session, EML_ADDR_LOWER == eml_addr)
+
+  def load_user_by_email(self, session: Session, eml_addr: str) -> Optional[UserInfo]:
+    """이메일로 사용자를 DB에서 조회 (캐시 사용 안 함, 인증 정보 확인용)"""
+    return self._load_user(session, EML_ADDR_LOWER == normalize_email(eml_addr))
+
+  def get_user_version_by_email(
+    self, session: Session, eml_addr: str
+  ) -> Optional[UserVersion]:
+    """이메일로 사용자 버전 조회 (If-None-Match 비교용, 공유 캐시 우선)"""
+    eml_addr = normalize_email(eml_addr)
+    cached = (
+      self._get_cached_values_by_email(eml_addr) if self.user_cache.shared else None
+    )
+    return self._load_user_version(session, EML_ADDR_LOWER == eml_addr, cached)
 
   @staticmethod
   def get_user_by_username(session: Session, user_nm: str) -> Optional[UserInfo]:
-    """사용자명으로 사용자 조회"""
-    statement = select(UserInfo).where(UserInfo.userNm == user_nm)
+    """사용자명으로 사용자 조회 (prepared statement 사용)"""
+    statement = (
+      select(UserInfo)
+      .where(UserInfo.userNm == user_nm)
+      .execution_options(**PREPARED_LOOKUP)
+    )
     return session.exec(statement).first()
 
   @staticmethod
-  def get_users(session: Session, user_vo: Optional[UserVo] = None) -> list[UserInfo]:
-    """사용자 목록 조회 (UserVo의 검색 조건 활용)"""
-    statement = select(UserInfo)
-
-    if user_vo:
-      # VO에서 검색 조건 추출
-      if user_vo.userNm:
-        statement = statement.where(UserInfo.userNm == user_vo.userNm)
-      if user_vo.emlAddr:
-        statement = statement.where(UserInfo.emlAddr == user_vo.emlAddr)
-      if user_vo.userRole:
-        statement = statement.where(UserInfo.userRole == user_vo.userRole)
-      if user_vo.useYn:
-        statement = statement.where(UserInfo.useYn == user_vo.useYn)
-      if user_vo.delYn:
-        statement = statement.where(UserInfo.delYn == user_vo.delYn)
-      # 검색 키워드 활용 (srchType과 srchKywd 조합)
-      if user_vo.srchKywd:
-        from sqlmodel import col
-
-        search_pattern = f'%{user_vo.srchKywd}%'
-        if user_vo.srchType == 'userNm':
-          statement = statement.where(col(UserInfo.userNm).like(search_pattern))
-        elif user_vo.srchType == 'emlAddr':
-          statement = statement.where(col(UserInfo.emlAddr).like(search_pattern))
-        else:
-          # 기본: 사용자명 또는 이메일에서 검색
-          statement = statement.where(
-            (col(UserInfo.userNm).like(search_pattern))
-            | (col(UserInfo.emlAddr).like(search_pattern))
-          )
-
-    return list(session.exec(statement).all())
+  def get_users(
+    session: Session, user_vo: Optional[UserVo] = None, total_cnt: Optional[int] = None
+  ) -> tuple[list[Row], int]:
+    """사용자 목록 조회 (UserVo의 검색 조건과 페이지 정보 활용)
+
+    최신 사용자부터(userNo 내림차순) 한 페이지만 조회하며, 전체 건수는 별도의
+    count 쿼리로 조회합니다. (count(*) OVER()는 LIMIT와 관계없이 검색 조건에 맞는
+    모든 행을 읽고 정렬하므로 사용하지 않음)
+    srchSort=similarity이면 검색 키워드와의 유사도가 높은 순으로 정렬합니다.
+    (pg_trgm이 없으면 기본 정렬)
+    비밀번호/리프레시 토큰은 조회하지 않으며, fields가 있으면 해당 컬럼만 조회합니다.
+
+    Args:
+      session: DB 세션
+      user_vo: 검색 조건과 페이지 정보
+      total_cnt: 이미 조회한 전체 건수 (get_users_version 결과, 있으면 건수 조회 생략)
+
+    Returns:
+      (현재 페이지의 사용자 목록(공개 컬럼 Row), 검색 조건에 맞는 전체 건수)
+    """
+    user_vo = user_vo or UserVo()
+    offset, limit = user_vo.to_offset_limit()
+
+    statement = UserDAO._apply_user_filters(
+      UserDAO._select_public(user_vo.to_field_list()), user_vo
+    )
+    if (
+      user_vo.srchKywd
+      and user_vo.srchSort == SRCH_SORT_SIMILARITY
+      and is_trigram_available(session.connection())
+    ):
+      statement = statement.order_by(
+        func.greatest(
+          func.similarity(UserInfo.userNm, user_vo.srchKywd),
+          func.similarity(UserInfo.emlAddr, user_vo.srchKywd),
+        ).desc()
+      )
+    statement = (
+      statement.order_by(col(UserInfo.userNo).desc()).offset(offset).limit(limit)
+    )
+    users = list(session.execute(statement).all())
+
+    if total_cnt is not None:
+      return users, total_cnt
+    # 첫 페이지가 다 차지 않았다면 조회한 행 수가 전체 건수
+    if offset == 0 and len(users) < limit:
+      return users, len(users)
+
+    count_statement = UserDAO._apply_user_filters(
+      select(func.count()).select_from(UserInfo), user_vo
+    )
+    return users, session.exec(count_statement).one()
+
+  @staticmethod
+  def get_users_version(session: Session, user_vo: UserVo) -> UserListVersion:
+    """검색 조건에 맞는 사용자 수와 최근 수정 일시 조회 (목록 ETag용, 집계 한 번)"""
+    statement = UserDAO._apply_user_filters(
+      select(func.count(), func.max(UserInfo.updtDt)).select_from(UserInfo), user_vo
+    )
+    total_cnt, max_updt_dt = session.exec(statement).one()
+    return UserListVersion(total_cnt, max_updt_dt)
+
+  @staticmethod
+  def get_users_after(
+    session: Session, user_vo: UserVo, after_user_no: int
+  ) -> tuple[list[Row], bool]:
+    """키셋(커서) 방식 사용자 목록 조회 (공개 컬럼만, fields가 있으면 해당 컬럼만)
+
+    OFFSET 대신 WHERE user_no < :after_user_no로 이어서 조회하므로
+    페이지 깊이와 관계없이 PK 인덱스에서 필요한 행만 읽습니다.
+    (정렬 키가 userNo 하나이므로 (정렬 키, user_no) 비교가 user_no 비교가 됩니다.)
+
+    Returns:
+      (다음 사용자 목록, 이후 행 존재 여부)
+    """
+    _, limit = user_vo.to_offset_limit()
+    statement = (
+      UserDAO._apply_user_filters(
+        UserDAO._select_public(user_vo.to_field_list()), user_vo
+      )
+      .where(col(UserInfo.userNo) < after_user_no)
+      .order_by(col(UserInfo.userNo).desc())
+      .limit(limit + 1)  # 한 행 더 조회하여 다음 페이지 존재 여부 확인
+    )
+    users = list(session.execute(statement).all())
+    return users[:limit], len(users) > limit
+
+  @staticmethod
+  def build_export_statement(
+    user_vo: UserVo, fields: Optional[list[str]] = None
+  ) -> Select:
+    """내보내기 SELECT 문 생성 (목록과 같은 검색 조건, 페이지 없이 userNo 오름차순)
+
+    yield_per로 서버 측 커서(psycopg named cursor)를 사용하여 EXPORT_CHUNK_SIZE행씩
+    가져오므로 결과 전체를 메모리에 올리지 않습니다. (I/O 없음, 동기/비동기 DAO 공통)
+    """
+    return (
+      UserDAO._apply_user_filters(UserDAO._select_public(fields), user_vo)
+      .order_by(col(UserInfo.userNo))
+      .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    )
 
   @staticmethod
+  def stream_users(
+    session: Session, user_vo: UserVo, fields: Optional[list[str]] = None
+  ) -> Iterator[Sequence[Row]]:
+    """검색 조건에 맞는 사용자 전체를 EXPORT_CHUNK_SIZE행씩 조회 (공개 컬럼만)
+
+    쿼리는 바로 실행하고, 반환한 이터레이터를 다 읽을 때까지 세션의
+    연결/트랜잭션(서버 측 커서)을 사용합니다.
+    """
+    statement = UserDAO.build_export_statement(user_vo, fields)
+    return session.execute(statement).partitions()
+
+  @staticmethod
+  def _apply_user_filters(statement: TStatement, user_vo: UserVo) -> TStatement:
+    """사용자 목록 검색 조건 적용 (목록 조회와 건수 조회에서 공통 사용)"""
+    # VO에서 검색 조건 추출
+    if user_vo.userNm:
+      statement = statement.where(UserInfo.userNm == user_vo.userNm)
+    if user_vo.emlAddr:
+      statement = statement.where(EML_ADDR_LOWER == normalize_email(user_vo.emlAddr))
+    if user_vo.userRole:
+      statement = statement.where(UserInfo.userRole == user_vo.userRole)
+    if user_vo.useYn:
+      statement = statement.where(UserInfo.useYn == user_vo.useYn)
+    if user_vo.delYn:
+      statement = statement.where(UserInfo.delYn == user_vo.delYn)
+    # 가입/마지막 로그인 일시 범위 (From 이상, To 미만)
+    if user_vo.crtDtFrom:
+      statement = statement.where(col(UserInfo.crtDt) >= user_vo.crtDtFrom)
+    if user_vo.crtDtTo:
+      statement = statement.where(col(UserInfo.crtDt) < user_vo.crtDtTo)
+    if user_vo.lastLgnDtFrom:
+      statement = statement.where(col(UserInfo.lastLgnDt) >= user_vo.lastLgnDtFrom)
+    if user_vo.lastLgnDtTo:
+      statement = statement.where(col(UserInfo.lastLgnDt) < user_vo.lastLgnDtTo)
+    # 검색 키워드 활용 (srchType과 srchKywd 조합)
+    # 대소문자 구분 없는 부분 일치 (Postgres는 trigram 인덱스, SQLite는 lower() LIKE)
+    if user_vo.srchKywd:
+      search_pattern = to_like_pattern(user_vo.srchKywd)
+      user_nm_match = col(UserInfo.userNm).ilike(search_pattern, escape=LIKE_ESCAPE)
+      eml_addr_match = col(UserInfo.emlAddr).ilike(search_pattern, escape=LIKE_ESCAPE)
+      if user_vo.srchType == 'userNm':
+        statement = statement.where(user_nm_match)
+      elif user_vo.srchType == 'emlAddr':
+        statement = statement.where(eml_addr_match)
+      else:
+        # 기본: 사용자명 또는 이메일에서 검색
+        statement = statement.where(user_nm_match | eml_addr_match)
+
+    return statement
+
   def update_user_password(
-    session: Session, user: UserInfo, encpt_pswd: str, updt_no: int
+    self, session: Session, user: UserInfo, encpt_pswd: str, updt_no: int
   ) -> UserInfo:
     """사용자 비밀번호 업데이트"""
-    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = utc_now()
     user.encptPswd = encpt_pswd
     user.lastPswdChgDt = now  # 비밀번호 변경 일시 추가
     user.updtNo = updt_no
     user.updtDt = now
     session.add(user)
     session.commit()
-    session.refresh(user)
+    self.invalidate_user_cache(user)
     return user
 
-  @staticmethod
   def update_user(
-    session: Session, user: UserInfo, user_vo: UserVo, updt_no: int
+    self, session: Session, user: UserInfo, user_vo: UserVo, updt_no: int
   ) -> UserInfo:
     """사용자 정보 업데이트 (UserVo와 수정자 번호를 받아 Entity 업데이트)"""
     # Service에서 이미 비밀번호 해시화 등 변환 완료
@@ -127,12 +674,19 @@ class UserDAO:
         'delNo',
         'delDt',
         'userNoList',  # 확장 필드
+        'crtDtFrom',
+        'crtDtTo',
+        'lastLgnDtFrom',
+        'lastLgnDtTo',
         'page',  # SearchVo 필드
         'pageSz',
         'strtRow',
         'endRow',
         'srchType',
         'srchKywd',
+        'srchSort',
+        'cursor',
+        'fields',
       },
     )
 
@@ -143,74 +697,90 @@ class UserDAO:
 
     # 업데이트 번호와 일시 직접 설정
     user.updtNo = updt_no
-    user.updtDt = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    user.updtDt = utc_now()
 
     session.add(user)
-    session.commit()
-    session.refresh(user)
+    UserDAO._commit_or_rollback(session)
+    self.invalidate_user_cache(user)
     return user
 
-  @staticmethod
-  def delete_user(session: Session, user: UserInfo, updt_no: int) -> None:
+  def delete_user(self, session: Session, user: UserInfo, updt_no: int) -> None:
     """사용자 삭제 (소프트 삭제)"""
     user.useYn = YnStatus.N
     user.delYn = YnStatus.Y
     user.updtNo = updt_no
-    user.updtDt = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    user.updtDt = utc_now()
     session.add(user)
     session.commit()
+    self.invalidate_user_cache(user)
 
-  @staticmethod
-  def delete_users(session: Session, users: list[UserInfo], updt_no: int) -> None:
-    """다건 사용자 삭제 (소프트 삭제)"""
-    updt_dt = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
-    for user in users:
-      user.useYn = YnStatus.N
-      user.delYn = YnStatus.Y
-      user.updtNo = updt_no
-      user.updtDt = updt_dt
-      session.add(user)
+  def delete_users(
+    self, session: Session, user_nos: list[int], updt_no: int
+  ) -> list[int]:
+    """다건 사용자 삭제 (소프트 삭제)
+
+    사용자를 하나씩 조회/수정하지 않고 UPDATE ... WHERE user_no = ANY(:ids)
+    RETURNING user_no 한 번으로 처리합니다. 목록이 매우 길면 BULK_CHUNK_SIZE씩
+    나누어 실행하며, 모든 청크는 한 트랜잭션으로 커밋합니다.
+
+    Returns:
+      실제로 삭제 처리된 사용자 번호 목록
+    """
+    updt_dt = utc_now()
+    deleted_nos: list[int] = []
+    for start in range(0, len(user_nos), BULK_CHUNK_SIZE):
+      chunk = user_nos[start : start + BULK_CHUNK_SIZE]
+      statement = (
+        update(UserInfo)
+        .where(col(UserInfo.userNo) == any_(bindparam('ids', chunk, ARRAY(Integer))))
+        .values(useYn=YnStatus.N, delYn=YnStatus.Y, updtNo=updt_no, updtDt=updt_dt)
+        .returning(col(UserInfo.userNo))
+        # 세션에 로드된 객체가 없으므로 동기화(조회/평가) 생략
+        .execution_options(synchronize_session=False)
+      )
+      deleted_nos.extend(session.execute(statement).scalars().all())
     session.commit()
+    # 이메일 키는 남지만 get_user_by_email에서 번호 키가 없으면 다시 조회
+    self.user_cache.delete(*(('userNo', user_no) for user_no in deleted_nos))
+    self.user_status_cache.delete(*deleted_nos)
+    return deleted_nos
 
-  @staticmethod
   def update_user_login_info(
-    session: Session, user: UserInfo, refresh_token: str, updt_no: int
+    self, session: Session, user: UserInfo, refresh_token: str, updt_no: int
   ) -> UserInfo:
     """사용자 로그인 정보 업데이트 (마지막 로그인, 리프레시 토큰)"""
-    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = utc_now()
     user.lastLgnDt = now
     user.reshToken = refresh_token
     user.updtNo = updt_no
     user.updtDt = now
     session.add(user)
     session.commit()
-    session.refresh(user)
+    self.invalidate_user_cache(user)
     return user
 
-  @staticmethod
   def clear_user_refresh_token(
-    session: Session, user: UserInfo, updt_no: int
+    self, session: Session, user: UserInfo, updt_no: int
   ) -> UserInfo:
     """사용자 리프레시 토큰 초기화 (로그아웃)"""
-    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = utc_now()
     user.reshToken = None
     user.updtNo = updt_no
     user.updtDt = now
     session.add(user)
     session.commit()
-    session.refresh(user)
+    self.invalidate_user_cache(user)
     return user
 
-  @staticmethod
   def update_user_refresh_token(
-    session: Session, user: UserInfo, new_refresh_token: str, updt_no: int
+    self, session: Session, user: UserInfo, new_refresh_token: str, updt_no: int
   ) -> UserInfo:
     """사용자 리프레시 토큰 업데이트 (재발급 시)"""
-    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    now = utc_now()
     user.reshToken = new_refresh_token
     user.updtNo = updt_no
     user.updtDt = now
     session.add(user)
     session.commit()
-    session.refresh(user)
+    self.invalidate_user_cache(user)
     return user
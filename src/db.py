@@ -1,32 +1,209 @@
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
+from sqlalchemy import Engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # 모든 모델을 import하여 SQLModel.metadata에 등록
 from src.models import (  # noqa: F401
   UserInfo,
 )
 from src.settings import settings
+from src.utils.pool_helper import (
+  TimedAsyncAdaptedQueuePool,
+  TimedQueuePool,
+  compute_pool_size,
+  instrument_pool,
+)
+from src.utils.prepare_helper import instrument_prepare
+from src.utils.query_stats_helper import instrument_engine
+from src.utils.replica_helper import ReplicaRouter, RoutingSession
+from src.utils.schema_helper import is_schema_current, migrate_schema
+from src.utils.search_helper import register_trigram_extension
+
+# 연결 풀 크기 (DB_POOL_AUTO_SIZE=True면 워커 수, 스레드풀 크기, 연결 예산으로 계산)
+POOL_SIZE, MAX_OVERFLOW = (
+  compute_pool_size(
+    connection_budget=settings.DB_CONNECTION_BUDGET,
+    worker_count=settings.WEB_CONCURRENCY,
+    threadpool_limit=settings.THREADPOOL_LIMIT,
+    async_enabled=settings.DB_ASYNC_ENABLED,
+  )
+  if settings.DB_POOL_AUTO_SIZE
+  else (5, 10)
+)
 
-# 연결 풀 설정:
+# 연결 풀 설정 (primary/복제본, 동기/비동기 엔진 공통):
+# - SQL 로그(echo)는 사용하지 않음 (DB_SQL_LOG_SAMPLE_RATE로 샘플링 로그 사용)
 # - pool_pre_ping=True: 연결 사용 전에 살아있는지 확인 (stale connection 방지)
 # - pool_recycle=3600: 1시간마다 연결을 재생성 (서버 타임아웃 방지)
-# - pool_size=5: 기본 연결 풀 크기
-# - max_overflow=10: 추가 연결 허용 수
-engine = create_engine(
-  settings.DATABASE_URL,
-  echo=True,
-  pool_pre_ping=True,  # 연결이 살아있는지 확인 후 사용
-  pool_recycle=3600,  # 1시간마다 연결 재생성 (초 단위)
-  pool_size=5,  # 기본 연결 풀 크기
-  max_overflow=10,  # 추가 연결 허용 수
+# - pool_size: 기본 연결 풀 크기 (기본값 5)
+# - max_overflow: 추가 연결 허용 수 (기본값 10)
+ENGINE_OPTIONS = {
+  'pool_pre_ping': True,  # 연결이 살아있는지 확인 후 사용
+  'pool_recycle': 3600,  # 1시간마다 연결 재생성 (초 단위)
+  'pool_size': POOL_SIZE,  # 기본 연결 풀 크기
+  'max_overflow': MAX_OVERFLOW,  # 추가 연결 허용 수
+}
+
+
+def create_pooled_engine(database_url: str, name: str) -> Engine:
+  """연결 풀 통계 이름(name)을 지정하여 동기 엔진 생성"""
+  return create_engine(
+    database_url,
+    poolclass=TimedQueuePool,
+    pool_logging_name=name,
+    **ENGINE_OPTIONS,
+  )
+
+
+engine = create_pooled_engine(settings.DATABASE_URL, 'primary')
+
+# 읽기 복제본 URL 목록 (DATABASE_REPLICA_URLS, 콤마 구분)
+REPLICA_URLS = [
+  url.strip() for url in settings.DATABASE_REPLICA_URLS.split(',') if url.strip()
+]
+
+# 복제본이 설정된 경우에만 라우팅 세션 사용
+replica_router: Optional[ReplicaRouter] = (
+  ReplicaRouter(
+    primary=engine,
+    replicas=[
+      create_pooled_engine(url, f'replica-{index}')
+      for index, url in enumerate(REPLICA_URLS, start=1)
+    ],
+    eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+  )
+  if REPLICA_URLS
+  else None
 )
 
 
-def init_db():
-  SQLModel.metadata.create_all(engine)
+def to_async_url(database_url: str) -> URL:
+  """DATABASE_URL을 psycopg 비동기 드라이버 URL로 변환
+
+  Args:
+    database_url: 동기 엔진용 데이터베이스 URL (예: postgresql://...)
+
+  Returns:
+    postgresql+psycopg_async 드라이버를 사용하는 URL
+  """
+  url = make_url(database_url)
+  if url.get_backend_name() == 'postgresql':
+    url = url.set(drivername='postgresql+psycopg_async')
+  return url
+
+
+def create_pooled_async_engine(database_url: str, name: str) -> AsyncEngine:
+  """연결 풀 통계 이름(name)을 지정하여 비동기 엔진 생성"""
+  return create_async_engine(
+    to_async_url(database_url),
+    poolclass=TimedAsyncAdaptedQueuePool,
+    pool_logging_name=name,
+    **ENGINE_OPTIONS,
+  )
+
+
+# 비동기 엔진 (DB_ASYNC_ENABLED=True일 때만 생성)
+async_engine: Optional[AsyncEngine] = (
+  create_pooled_async_engine(settings.DATABASE_URL, 'async-primary')
+  if settings.DB_ASYNC_ENABLED
+  else None
+)
+
+# 비동기 복제본 라우터 (AsyncSession 내부의 동기 세션은 sync_engine을 사용)
+async_replica_router: Optional[ReplicaRouter] = (
+  ReplicaRouter(
+    primary=async_engine.sync_engine,
+    replicas=[
+      create_pooled_async_engine(url, f'async-replica-{index}').sync_engine
+      for index, url in enumerate(REPLICA_URLS, start=1)
+    ],
+    eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+  )
+  if async_engine is not None and REPLICA_URLS
+  else None
+)
+
+# 생성한 모든 엔진 (비동기 엔진은 sync_engine)
+ALL_ENGINES: list[Engine] = [
+  engine,
+  *(replica_router.replicas if replica_router else []),
+  *([async_engine.sync_engine] if async_engine else []),
+  *(async_replica_router.replicas if async_replica_router else []),
+]
+
+# 연결 풀 통계 수집 이벤트 등록 (GET /admin/pool)
+for pooled_engine in ALL_ENGINES:
+  instrument_pool(pooled_engine, max_overflow=MAX_OVERFLOW)
+
+# 자주 쓰는 조회의 prepared statement 사용 (트랜잭션 풀러 사용 시 비활성화)
+for prepared_engine in ALL_ENGINES:
+  instrument_prepare(
+    prepared_engine,
+    enabled=settings.DB_PREPARED_STATEMENTS and not settings.DB_TRANSACTION_POOLER,
+  )
+
+# 요청 단위 SQL 통계 수집 이벤트 등록 (모든 엔진)
+if settings.DB_QUERY_STATS_ENABLED:
+  for instrumented_engine in ALL_ENGINES:
+    instrument_engine(instrumented_engine)
+
+# create_all 직전에 pg_trgm 확장 생성 (키워드 검색 trigram 인덱스)
+register_trigram_extension(SQLModel.metadata)
+
+
+def init_db(force: bool = False) -> bool:
+  """스키마 지문이 바뀐 경우에만 테이블 생성 (advisory lock으로 워커 간 직렬화)
+
+  Args:
+    force: True면 지문이 같아도 create_all 실행
+
+  Returns:
+    DDL 실행 여부
+  """
+  return migrate_schema(engine, SQLModel.metadata, force=force)
+
+
+def is_db_schema_current() -> bool:
+  """DB 스키마가 현재 모델과 같은지 확인 (DDL 실행 없음)"""
+  return is_schema_current(engine, SQLModel.metadata)
 
 
 def get_session() -> Generator[Session, None, None]:
-  with Session(engine) as session:
+  # expire_on_commit=False: 쓰기 값은 flush(INSERT ... RETURNING)로 이미 객체에 있으므로
+  # 커밋 후 속성 접근 시 다시 조회하지 않음 (요청 단위 세션이라 오래된 값 문제 없음)
+  if replica_router is not None:
+    with RoutingSession(
+      router=replica_router, expire_on_commit=False
+    ) as routing_session:
+      yield routing_session
+    return
+
+  with Session(engine, expire_on_commit=False) as session:
     yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+  """비동기 세션 의존성 (DB_ASYNC_ENABLED=True일 때 사용)"""
+  if async_engine is None:
+    raise RuntimeError('비동기 세션을 사용하려면 DB_ASYNC_ENABLED=True로 설정하세요.')
+
+  # expire_on_commit=False: 커밋 후 속성 접근 시 암묵적 lazy load(블로킹 I/O) 방지
+  if async_replica_router is not None:
+    async with AsyncSession(
+      sync_session_class=RoutingSession,
+      router=async_replica_router,
+      expire_on_commit=False,
+    ) as routing_session:
+      yield routing_session
+    return
+
+  async with AsyncSession(async_engine, expire_on_commit=False) as session:
+    yield session
+
+
+# 라우터에서 사용하는 세션 의존성 (설정에 따라 동기/비동기 선택)
+get_db_session = get_async_session if settings.DB_ASYNC_ENABLED else get_session
@@ -1,23 +1,47 @@
+import time
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 
-from src.db import init_db
+from src.db import init_db, is_db_schema_current
+from src.routers.admin_router import router as admin_router
 from src.routers.auth_router import router as auth_router
 from src.routers.user_router import router as user_router
 from src.schemas.response_schema import ApiResponse
+from src.settings import settings
+from src.utils.password_helper import shutdown_hash_executor
+from src.utils.query_stats_helper import start_query_stats
+from src.utils.replica_helper import STICKY_COOKIE, start_route_context
 from src.utils.response_helper import success_response
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-  init_db()
+  # 동기 엔드포인트/의존성을 실행하는 스레드풀 크기 (연결 풀 자동 산정과 같은 값 사용)
+  anyio.to_thread.current_default_thread_limiter().total_tokens = (
+    settings.THREADPOOL_LIMIT
+  )
+
+  # 스키마 지문이 같으면 DDL을 건너뜀 (기동 시간 출력)
+  started = time.perf_counter()
+  if settings.DB_MIGRATE_ON_STARTUP:
+    schema_state = 'migrated' if init_db() else 'up to date'
+  elif is_db_schema_current():
+    schema_state = 'up to date'
+  else:
+    schema_state = 'outdated (python -m src.migrate 실행 필요)'
+  elapsed_ms = (time.perf_counter() - started) * 1000
+  print(f'[DB] schema {schema_state} ({elapsed_ms:.2f}ms)')
   yield
 
+  # 대량 가입에서 사용한 비밀번호 해시화 프로세스 종료
+  shutdown_hash_executor()
+
 
 app = FastAPI(
   lifespan=lifespan,
@@ -30,6 +54,10 @@ app = FastAPI(
       'name': '사용자 관리',
       'description': '사용자 생성, 조회, 수정, 삭제 관련 API',
     },
+    {
+      'name': '관리자',
+      'description': 'DB 연결 풀 통계 등 관리자 전용 API',
+    },
     {
       'name': '기본',
       'description': '기본 API 엔드포인트',
@@ -48,9 +76,54 @@ app.add_middleware(
   allow_credentials=True,  # 쿠키 포함 여부 (True여야 쿠키 주고받기 가능)
   allow_methods=['*'],  # 허용할 HTTP 메서드 (GET, POST 등 전체 허용)
   allow_headers=['*'],  # 허용할 헤더 (전체 허용)
+  expose_headers=['ETag'],  # 브라우저 스크립트에서 읽을 수 있는 응답 헤더 (조건부 조회)
 )
 
 
+async def query_stats_middleware(request: Request, call_next):
+  """요청 단위 SQL 통계를 Server-Timing 헤더로 노출하고 느린 요청을 기록"""
+  stats = start_query_stats()
+  response = await call_next(request)
+
+  if stats.count:
+    response.headers['Server-Timing'] = stats.to_server_timing()
+  if stats.total_ms > settings.DB_SLOW_REQUEST_MS:
+    # SQL 문은 SQL 로그를 켠 경우(DB_SQL_LOG_SAMPLE_RATE > 0)에만 출력
+    statement = (
+      f' {stats.slowest_statement}' if settings.DB_SQL_LOG_SAMPLE_RATE > 0 else ''
+    )
+    print(
+      f'[SQL] slow request {request.method} {request.url.path}: '
+      f'{stats.count} queries, {stats.total_ms:.2f}ms, '
+      f'slowest {stats.slowest_ms:.2f}ms{statement}'
+    )
+  return response
+
+
+async def replica_sticky_middleware(request: Request, call_next):
+  """쓰기가 발생한 클라이언트를 일정 시간 primary DB에 고정 (read-your-writes)"""
+  route_ctx = start_route_context(request.cookies.get(STICKY_COOKIE))
+  response = await call_next(request)
+
+  if route_ctx.wrote:
+    response.set_cookie(
+      key=STICKY_COOKIE,
+      value=str(time.time() + settings.DB_REPLICA_STICKY_SECONDS),
+      max_age=settings.DB_REPLICA_STICKY_SECONDS,
+      httponly=True,
+      samesite='strict',
+      secure=True,
+    )
+  return response
+
+
+# 설정에 따라 미들웨어 등록
+if settings.DB_QUERY_STATS_ENABLED:
+  app.middleware('http')(query_stats_middleware)
+if settings.DATABASE_REPLICA_URLS:
+  app.middleware('http')(replica_sticky_middleware)
+
+
 # 422 Validation Error를 200 응답으로 변환하는 커스텀 핸들러
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
@@ -92,6 +165,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 # 라우터 등록
 app.include_router(auth_router)
 app.include_router(user_router)
+app.include_router(admin_router)
 
 
 # OpenAPI 스키마 커스터마이징 - 422 응답 제거
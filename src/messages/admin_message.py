@@ -0,0 +1,11 @@
+"""관리자 API 관련 메시지 상수"""
+
+
+class AdminMessage:
+  """관리자 API 관련 메시지"""
+
+  # 연결 풀
+  POOL_STATS_SUCCESS = 'DB 연결 풀 통계 조회에 성공했습니다.'
+
+  # 캐시
+  CACHE_STATS_SUCCESS = '캐시 통계 조회에 성공했습니다.'
@@ -29,3 +29,6 @@ class AuthMessage:
   TOKEN_INVALID = '토큰이 유효하지 않습니다.'
   TOKEN_EXPIRED = '토큰이 만료되었습니다.'
   REFRESH_TOKEN_INVALID = 'Refresh Token이 유효하지 않습니다.'
+
+  # 권한
+  ADMIN_REQUIRED = '관리자 권한이 필요합니다.'
@@ -9,9 +9,24 @@ class UserMessage:
   EMAIL_CONFLICT = '이미 존재하는 이메일입니다.'
   USERNAME_CONFLICT = '이미 존재하는 사용자명입니다.'
 
+  # 대량 가입 관련
+  IMPORT_SUCCESS = '대량 가입이 완료되었습니다. (생성 {created}건, 실패 {failed}건)'
+  IMPORT_UNSUPPORTED_FORMAT = (
+    'Content-Type은 application/x-ndjson 또는 text/csv여야 합니다.'
+  )
+  IMPORT_PARSE_ERROR = '행을 읽을 수 없습니다. (JSON 객체 또는 헤더와 같은 개수의 값)'
+  IMPORT_INVALID_FIELDS = '형식이 올바르지 않은 필드가 있습니다: {fields}'
+  IMPORT_REQUIRED_FIELDS = 'emlAddr, userNm, password, userRole은 필수입니다.'
+  IMPORT_DUPLICATE_EMAIL = '파일 안에서 중복된 이메일입니다.'
+  IMPORT_DUPLICATE_USERNAME = '파일 안에서 중복된 사용자명입니다.'
+
   # 조회 관련
   GET_SUCCESS = '사용자 조회에 성공했습니다.'
   GET_LIST_SUCCESS = '사용자 목록 조회에 성공했습니다.'
+  GET_BATCH_SUCCESS = (
+    '사용자 다건 조회에 성공했습니다. (조회 {found}건, 없음 {not_found}건)'
+  )
+  BATCH_TOO_MANY = '한 번에 조회할 수 있는 사용자는 {max_size}명까지입니다.'
   NOT_FOUND = '사용자를 찾을 수 없습니다.'
 
   # 수정 관련
@@ -32,6 +47,8 @@ class UserMessage:
 
   # 기타
   INVALID_REQUEST = '잘못된 요청입니다.'
+  INVALID_CURSOR = '유효하지 않은 커서입니다.'
+  INVALID_FIELDS = '조회할 수 없는 필드가 포함되어 있습니다.'
   VALIDATION_ERROR = '입력값이 유효하지 않습니다.'
 
   @classmethod
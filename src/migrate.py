@@ -0,0 +1,37 @@
+"""스키마 마이그레이션 CLI
+
+애플리케이션 기동과 분리하여 배포 단계에서 스키마를 적용할 때 사용합니다.
+
+  python -m src.migrate          # 스키마 지문이 바뀐 경우에만 DDL 실행
+  python -m src.migrate --check  # DDL 없이 확인만 (최신이 아니면 종료 코드 1)
+  python -m src.migrate --force  # 지문과 관계없이 create_all 실행
+"""
+
+import argparse
+import sys
+import time
+
+from src.db import init_db, is_db_schema_current
+
+
+def main() -> int:
+  parser = argparse.ArgumentParser(description='DB 스키마 마이그레이션')
+  parser.add_argument('--check', action='store_true', help='DDL 없이 최신 여부만 확인')
+  parser.add_argument('--force', action='store_true', help='지문과 관계없이 DDL 실행')
+  args = parser.parse_args()
+
+  started = time.perf_counter()
+  if args.check:
+    is_current = is_db_schema_current()
+    schema_state = 'up to date' if is_current else 'outdated'
+  else:
+    is_current = True
+    schema_state = 'migrated' if init_db(force=args.force) else 'up to date'
+  elapsed_ms = (time.perf_counter() - started) * 1000
+
+  print(f'[DB] schema {schema_state} ({elapsed_ms:.2f}ms)')
+  return 0 if is_current else 1
+
+
+if __name__ == '__main__':
+  sys.exit(main())
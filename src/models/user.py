@@ -1,14 +1,12 @@
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, text
+from sqlalchemy import Column, DateTime, Index, Integer, String, func, text
 from sqlalchemy import Enum as SQLEnum
 from sqlmodel import Field, SQLModel
 
-# UTC 타임스탬프 포맷팅 SQL 함수
-UTC_TIMESTAMP_FORMAT = (
-  'to_char(current_timestamp AT TIME ZONE \'UTC\', \'YYYY-MM-DD"T"HH24:MI:SS"Z"\')'
-)
+from src.utils.search_helper import trigram_index
 
 
 class UserRole(str, Enum):
@@ -23,12 +21,37 @@ class YnStatus(str, Enum):
 
 class UserInfo(SQLModel, table=True):
   __tablename__ = 'user_info'  # type: ignore[assignment]
+  # INSERT/UPDATE 시 서버 기본값(last_lgn_dt 등)을 RETURNING으로 함께 받아옴
+  # (커밋 후 refresh 조회 불필요)
+  __mapper_args__ = {'eager_defaults': True}
+  __table_args__ = (
+    # 삭제되지 않은 사용자 최신순 목록/건수용 부분 인덱스 (대부분의 조회가 del_yn='N')
+    # 권한/사용 여부를 INCLUDE하여 대부분의 행이 해당하는 필터의 건수도
+    # 테이블을 읽지 않고 인덱스만으로 셈 (Index Only Scan)
+    Index(
+      'ix_user_info_live_user_no_cover',
+      'user_no',
+      postgresql_include=['user_role', 'use_yn'],
+      postgresql_where=text("del_yn = 'N'"),
+      sqlite_where=text("del_yn = 'N'"),
+    ),
+    # 권한/사용 여부/삭제 여부 필터 + user_no 정렬용 복합 인덱스
+    Index('ix_user_info_role_use_del', 'user_role', 'use_yn', 'del_yn', 'user_no'),
+    # 이메일은 대소문자 구분 없이 유일 (조회도 lower(eml_addr)로 비교해야 사용됨)
+    Index('ix_user_info_eml_addr_lower', text('lower(eml_addr)'), unique=True),
+    # 가입 일시/마지막 로그인 일시 범위 검색용 인덱스
+    Index('ix_user_info_crt_dt', 'crt_dt'),
+    Index('ix_user_info_last_lgn_dt', 'last_lgn_dt'),
+    # 사용자명/이메일 부분 일치(ILIKE '%키워드%') 검색용 trigram 인덱스
+    trigram_index('ix_user_info_user_nm_trgm', 'user_nm'),
+    trigram_index('ix_user_info_eml_addr_trgm', 'eml_addr'),
+  )
 
   userNo: Optional[int] = Field(
     default=None, sa_column=Column('user_no', Integer, primary_key=True)
   )
 
-  emlAddr: str = Field(sa_column=Column('eml_addr', String, unique=True))
+  emlAddr: str = Field(sa_column=Column('eml_addr', String))
 
   userNm: str = Field(sa_column=Column('user_nm', String, unique=True))
 
@@ -65,23 +88,23 @@ class UserInfo(SQLModel, table=True):
     sa_column=Column('del_yn', SQLEnum(YnStatus, name='yn_status'), default=YnStatus.N),
   )
 
-  lastLgnDt: Optional[str] = Field(
+  lastLgnDt: Optional[datetime] = Field(
     default=None,
     sa_column=Column(
       'last_lgn_dt',
-      String,
+      DateTime(timezone=True),
       nullable=True,
-      server_default=text(UTC_TIMESTAMP_FORMAT),
+      server_default=func.now(),
     ),
   )
 
-  lastPswdChgDt: Optional[str] = Field(
+  lastPswdChgDt: Optional[datetime] = Field(
     default=None,
     sa_column=Column(
       'last_pswd_chg_dt',
-      String,
+      DateTime(timezone=True),
       nullable=True,
-      server_default=text(UTC_TIMESTAMP_FORMAT),
+      server_default=func.now(),
     ),
   )
 
@@ -89,11 +112,11 @@ class UserInfo(SQLModel, table=True):
     default=None, sa_column=Column('crt_no', Integer, nullable=True)
   )
 
-  crtDt: str = Field(
+  crtDt: datetime = Field(
     sa_column=Column(
       'crt_dt',
-      String,
-      server_default=text(UTC_TIMESTAMP_FORMAT),
+      DateTime(timezone=True),
+      server_default=func.now(),
     )
   )
 
@@ -101,11 +124,11 @@ class UserInfo(SQLModel, table=True):
     default=None, sa_column=Column('updt_no', Integer, nullable=True)
   )
 
-  updtDt: str = Field(
+  updtDt: datetime = Field(
     sa_column=Column(
       'updt_dt',
-      String,
-      server_default=text(UTC_TIMESTAMP_FORMAT),
+      DateTime(timezone=True),
+      server_default=func.now(),
     )
   )
 
@@ -113,6 +136,6 @@ class UserInfo(SQLModel, table=True):
     default=None, sa_column=Column('del_no', Integer, nullable=True)
   )
 
-  delDt: Optional[str] = Field(
-    default=None, sa_column=Column('del_dt', String, nullable=True)
+  delDt: Optional[datetime] = Field(
+    default=None, sa_column=Column('del_dt', DateTime(timezone=True), nullable=True)
   )
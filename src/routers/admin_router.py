@@ -0,0 +1,63 @@
+"""관리자 전용 라우터"""
+
+from fastapi import APIRouter, Depends, status
+
+from src.messages.admin_message import AdminMessage
+from src.schemas.admin_schema import CacheStatsResponse, PoolStatsResponse
+from src.schemas.response_code import ResponseCode
+from src.schemas.response_schema import ApiResponse
+from src.utils.auth_helper import get_current_admin_id
+from src.utils.cache_helper import caches
+from src.utils.pool_helper import pool_telemetry
+from src.utils.response_helper import success_response
+
+router = APIRouter(prefix='/admin', tags=['관리자'])
+
+
+@router.get(
+  '/pool',
+  response_model=ApiResponse[list[PoolStatsResponse]],
+  status_code=status.HTTP_200_OK,
+  summary='DB 연결 풀 통계 조회',
+  operation_id='getPoolStats',
+)
+async def getPoolStats(admin_no: int = Depends(get_current_admin_id)):
+  """엔진별 DB 연결 풀 상태와 누적 통계를 조회합니다. (관리자 전용)
+
+  - checkedOut/overflowInUse: 현재 대여 중인 연결 수 / 사용 중인 overflow 연결 수
+  - checkoutWaitHistogram: 연결 대여 대기 시간 분포 (pool_pre_ping 시간 포함)
+  - invalidations/prePingReconnects: 무효화된 연결 수 / pre_ping 실패 재연결 수
+  """
+  pool_stats = [
+    PoolStatsResponse.model_validate(telemetry.snapshot())
+    for telemetry in pool_telemetry.values()
+  ]
+  return success_response(
+    data=pool_stats,
+    message=AdminMessage.POOL_STATS_SUCCESS,
+    code=ResponseCode.OK,
+  )
+
+
+@router.get(
+  '/cache',
+  response_model=ApiResponse[list[CacheStatsResponse]],
+  status_code=status.HTTP_200_OK,
+  summary='캐시 통계 조회',
+  operation_id='getCacheStats',
+)
+async def getCacheStats(admin_no: int = Depends(get_current_admin_id)):
+  """캐시의 크기와 누적 통계를 조회합니다. (관리자 전용)
+
+  - 누적 통계는 요청을 처리한 워커의 값입니다. (memory 백엔드는 캐시도 워커별)
+  - hits/misses/hitRatio: 조회 성공/실패 수와 성공 비율
+  - evictions/expirations/invalidations: 크기 제한/만료/쓰기 무효화로 제거한 수
+  """
+  cache_stats = [
+    CacheStatsResponse.model_validate(cache.snapshot()) for cache in caches.values()
+  ]
+  return success_response(
+    data=cache_stats,
+    message=AdminMessage.CACHE_STATS_SUCCESS,
+    code=ResponseCode.OK,
+  )
@@ -4,8 +4,10 @@ from typing import Annotated, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db import get_session
+from src.dao.user_dao import get_user_cache, get_user_status_cache
+from src.db import get_db_session
 from src.schemas.auth_schema import (
   ChangePasswordRequest,
   LoginRequest,
@@ -14,17 +16,27 @@ from src.schemas.auth_schema import (
   ResetPasswordRequestRequest,
 )
 from src.schemas.response_schema import ApiResponse
-from src.services.auth_service import AuthService
+from src.services.async_auth_service import AsyncAuthService
+from src.services.auth_service import AuthService, get_reset_token_cache
 from src.settings import settings
+from src.utils.async_helper import call_cache, call_service
 from src.utils.auth_helper import get_current_user_id, get_refresh_token_from_cookie
+from src.utils.cache_helper import CacheBackend
 from src.utils.jwt_helper import parse_expiration
 
 router = APIRouter(prefix='/auth', tags=['인증'])
 
 
-def get_auth_service(session: Session = Depends(get_session)) -> AuthService:
-  """AuthService 의존성 주입"""
-  return AuthService(session)
+def get_auth_service(
+  session: Session | AsyncSession = Depends(get_db_session),
+  reset_token_cache: CacheBackend = Depends(get_reset_token_cache),
+  user_cache: CacheBackend = Depends(get_user_cache),
+  user_status_cache: CacheBackend = Depends(get_user_status_cache),
+) -> AuthService | AsyncAuthService:
+  """AuthService 의존성 주입 (DB_ASYNC_ENABLED=True면 AsyncAuthService)"""
+  if isinstance(session, AsyncSession):
+    return AsyncAuthService(session, reset_token_cache, user_cache, user_status_cache)
+  return AuthService(session, reset_token_cache, user_cache, user_status_cache)
 
 
 @router.post(
@@ -34,13 +46,13 @@ def get_auth_service(session: Session = Depends(get_session)) -> AuthService:
   summary='로그인',
   operation_id='signIn',
 )
-def signin(
+async def signin(
   login_request: LoginRequest,
   response: Response,
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
 ):
   """이메일과 비밀번호로 로그인합니다."""
-  result = service.signin(login_request)
+  result = await call_service(service.signin, login_request)
 
   if result.error is False and result.data:
     access_token = result.data.accessToken
@@ -84,13 +96,13 @@ def signin(
   summary='로그아웃',
   operation_id='signOut',
 )
-def signout(
+async def signout(
   response: Response,
   refresh_token: Annotated[Optional[str], Depends(get_refresh_token_from_cookie)],
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
 ):
   """로그아웃합니다."""
-  result = service.signout(refresh_token)
+  result = await call_service(service.signout, refresh_token)
 
   # 쿠키 삭제
   response.delete_cookie(key='access_token', samesite='strict', secure=True)
@@ -106,13 +118,13 @@ def signout(
   summary='Access Token 재발급 (Refresh Token 사용)',
   operation_id='refreshToken',
 )
-def refresh_token(
+async def refresh_token(
   response: Response,
   refresh_token: Annotated[str, Depends(get_refresh_token_from_cookie)],
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
 ):
   """Refresh Token을 사용하여 새로운 Access Token과 Refresh Token을 발급합니다."""
-  result = service.refresh(refresh_token)
+  result = await call_service(service.refresh, refresh_token)
 
   if result.error is False and result.data:
     access_token = result.data.accessToken
@@ -156,24 +168,23 @@ def refresh_token(
   summary='비밀번호 재설정 요청',
   operation_id='requestResetPassword',
 )
-def request_reset_password(
+async def request_reset_password(
   background_tasks: BackgroundTasks,
   request: ResetPasswordRequestRequest,
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
 ):
   """비밀번호 재설정을 위한 이메일을 발송합니다."""
-  result = service.request_reset_password(request)
+  result = await call_service(service.request_reset_password, request)
 
   # 성공 응답인 경우에만 이메일 발송 (백그라운드 작업)
   if result.error is False:
-    from src.services.auth_service import reset_tokens
     from src.utils.email_helper import send_reset_password_email
 
-    token_info = reset_tokens.get(request.emlAddr)
-    if token_info:
-      background_tasks.add_task(
-        send_reset_password_email, request.emlAddr, token_info['token']
-      )
+    reset_token = await call_cache(
+      service.reset_token_cache, service.get_reset_token, request.emlAddr
+    )
+    if reset_token:
+      background_tasks.add_task(send_reset_password_email, request.emlAddr, reset_token)
 
   return result
 
@@ -185,12 +196,12 @@ def request_reset_password(
   summary='비밀번호 재설정',
   operation_id='resetPassword',
 )
-def reset_password(
+async def reset_password(
   request: ResetPasswordRequest,
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
 ):
   """비밀번호를 재설정합니다."""
-  return service.reset_password(request)
+  return await call_service(service.reset_password, request)
 
 
 @router.post(
@@ -200,11 +211,11 @@ def reset_password(
   summary='비밀번호 변경',
   operation_id='changePassword',
 )
-def change_password(
+async def change_password(
   request: Request,
   change_request: ChangePasswordRequest,
   user_no: int = Depends(get_current_user_id),
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
 ):
   """로그인 후 비밀번호를 변경합니다."""
-  return service.change_password(user_no, change_request)
+  return await call_service(service.change_password, user_no, change_request)
@@ -1,21 +1,86 @@
-from fastapi import APIRouter, Depends, Request, status
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db import get_session
+from src.dao.user_dao import get_user_cache, get_user_status_cache
+from src.db import get_db_session
 from src.messages.user_message import UserMessage
 from src.schemas.response_code import ResponseCode
 from src.schemas.response_schema import ApiResponse, ListResponse
+from src.schemas.user_schema import UserBatchResponse, UserImportResponse
+from src.services.async_user_service import AsyncUserService
 from src.services.user_service import UserService
-from src.utils.auth_helper import get_current_user_id, get_current_user_id_optional
+from src.utils.async_helper import call_service, call_streaming_service
+from src.utils.auth_helper import (
+  get_current_admin_id,
+  get_current_user_id,
+  get_current_user_id_optional,
+)
+from src.utils.cache_helper import CacheBackend
+from src.utils.etag_helper import (
+  etag_matches,
+  make_etag,
+  not_modified_response,
+  set_etag,
+)
+from src.utils.export_helper import EXPORT_MEDIA_TYPES
+from src.utils.import_helper import (
+  IMPORT_BATCH_SIZE,
+  get_import_format,
+  iter_import_batches,
+)
+from src.utils.response_helper import error_response, success_response
 from src.utils.swagger_helper import get_user_list_example, get_user_response_example
 from src.vos.user_vo import UserVo
 
 router = APIRouter(prefix='/users')
 
+# 조건부 조회 요청 헤더 설명
+IF_NONE_MATCH_DESCRIPTION = '이전 응답의 ETag (같으면 본문 없이 304 응답)'
+
+# 조건부 조회 API의 304 응답 문서
+NOT_MODIFIED_RESPONSE = {'description': '변경 없음 (If-None-Match가 현재 ETag와 같음)'}
+
+
+def get_user_service(
+  session: Session | AsyncSession = Depends(get_db_session),
+  user_cache: CacheBackend = Depends(get_user_cache),
+  user_status_cache: CacheBackend = Depends(get_user_status_cache),
+) -> UserService | AsyncUserService:
+  """UserService 의존성 주입 (DB_ASYNC_ENABLED=True면 AsyncUserService)"""
+  if isinstance(session, AsyncSession):
+    return AsyncUserService(session, user_cache, user_status_cache)
+  return UserService(session, user_cache, user_status_cache)
+
+
+async def get_user_with_etag(
+  service: UserService | AsyncUserService,
+  user_vo: UserVo,
+  response: Response,
+  if_none_match: Optional[str],
+) -> ApiResponse[UserVo] | Response:
+  """사용자 단건 조회 (번호 또는 이메일) + 강한 ETag
+
+  ETag는 사용자 번호, 수정 일시(updtDt), 응답 필드로 만듭니다.
+  - If-None-Match가 있으면 버전만 조회(공유 캐시 또는 SELECT updt_dt)하여, 같으면
+    공개 컬럼 조회와 응답 직렬화 없이 304를 응답합니다.
+  - 200 응답의 ETag는 본문과 같은 행의 updtDt로 만듭니다. (본문과 항상 일치)
+  """
+  fields = user_vo.to_field_list()
+  if if_none_match:
+    version = await call_service(service.getUserVersion, user_vo)
+    if version:
+      etag = make_etag(version.userNo, version.updtDt, fields)
+      if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
 
-def get_user_service(session: Session = Depends(get_session)) -> UserService:
-  """UserService 의존성 주입"""
-  return UserService(session)
+  result, version = await call_service(service.getUserWithVersion, user_vo)
+  if version and not result.error:
+    set_etag(response, make_etag(version.userNo, version.updtDt, fields))
+  return result
 
 
 @router.post(
@@ -73,11 +138,11 @@ def get_user_service(session: Session = Depends(get_session)) -> UserService:
     },
   },
 )
-def createUser(
+async def createUser(
   request: Request,
   user_vo: UserVo,
   current_user_no: int | None = Depends(get_current_user_id_optional),
-  service: UserService = Depends(get_user_service),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
   """새로운 사용자를 생성합니다.
 
@@ -85,17 +150,186 @@ def createUser(
   - 관리자 생성: 토큰과 함께 호출 시 crtNo는 관리자 번호
   """
   print('[ROUTER] user_vo:', user_vo.model_dump())
-  return service.createUser(user_vo, crt_no=current_user_no)
+  return await call_service(service.createUser, user_vo, crt_no=current_user_no)
+
+
+@router.post(
+  '/import',
+  response_model=ApiResponse[UserImportResponse],
+  status_code=status.HTTP_200_OK,
+  summary='사용자 대량 가입 (NDJSON/CSV)',
+  operation_id='importUsers',
+  tags=['사용자 관리'],
+  openapi_extra={
+    'requestBody': {
+      'required': True,
+      'content': {
+        'application/x-ndjson': {
+          'schema': {'type': 'string'},
+          'example': '{"emlAddr": "user1@example.com", "userNm": "user1", '
+          '"password": "password123!", "userRole": "USER"}\n',
+        },
+        'text/csv': {
+          'schema': {'type': 'string'},
+          'example': 'emlAddr,userNm,password,userRole\n'
+          'user1@example.com,user1,password123!,USER\n',
+        },
+      },
+    },
+  },
+)
+async def importUsers(
+  request: Request,
+  admin_no: int = Depends(get_current_admin_id),
+  service: UserService | AsyncUserService = Depends(get_user_service),
+):
+  """NDJSON 또는 CSV 파일로 사용자를 대량 생성합니다. (관리자 전용)
+
+  - 필드: emlAddr, userNm, password, userRole (CSV는 첫 줄에 필드명)
+  - 요청 본문을 스트림으로 읽으며 IMPORT_BATCH_SIZE행씩 검증/해시화/저장합니다.
+  - 배치마다 커밋하므로 도중에 실패해도 앞선 배치는 저장됩니다.
+  - 저장하지 못한 행은 행 번호와 사유를 errors로 반환합니다.
+  """
+  import_format = get_import_format(request.headers.get('content-type'))
+  if import_format is None:
+    return error_response(
+      message=UserMessage.IMPORT_UNSUPPORTED_FORMAT,
+      code=ResponseCode.VALIDATION_ERROR,
+    )
+
+  import_response = UserImportResponse()
+  async for import_rows in iter_import_batches(
+    request.stream(), import_format, IMPORT_BATCH_SIZE
+  ):
+    import_response.add(
+      await call_service(service.importUsers, import_rows, crt_no=admin_no)
+    )
+  print(
+    f'[ROUTER] import: total={import_response.totalCnt} '
+    f'created={import_response.createdCnt} failed={import_response.failedCnt}'
+  )
+  return success_response(
+    data=import_response,
+    message=UserMessage.IMPORT_SUCCESS.format(
+      created=import_response.createdCnt, failed=import_response.failedCnt
+    ),
+    code=ResponseCode.CREATED,
+  )
+
+
+@router.post(
+  '/batch',
+  response_model=ApiResponse[UserBatchResponse],
+  # 응답 VO에 설정된 필드만 출력 (fields로 지정하지 않은 필드와 검색 필드 제외)
+  response_model_exclude_unset=True,
+  status_code=status.HTTP_200_OK,
+  summary='사용자 다건 조회 (번호/이메일 목록)',
+  operation_id='getUsersBatch',
+  tags=['사용자 관리'],
+  responses={
+    200: {
+      'description': '성공 응답',
+      'content': {
+        'application/json': {
+          'examples': {
+            'success': {
+              'summary': '사용자 다건 조회 성공',
+              'value': {
+                'data': {
+                  'list': [
+                    {
+                      'userNo': 1,
+                      'found': True,
+                      'data': get_user_response_example(),
+                    },
+                    {'userNo': 999, 'found': False, 'data': None},
+                  ],
+                  'foundCnt': 1,
+                  'notFoundCnt': 1,
+                },
+                'error': False,
+                'code': ResponseCode.OK,
+                'message': UserMessage.GET_BATCH_SUCCESS.format(found=1, not_found=1),
+              },
+            },
+          },
+        },
+      },
+    },
+  },
+)
+async def getUsersBatch(
+  user_vo: UserVo,
+  service: UserService | AsyncUserService = Depends(get_user_service),
+):
+  """사용자 번호/이메일 목록으로 여러 사용자를 한 번에 조회합니다.
+
+  - 요청 예시: `{"userNoList": [1, 2], "emlAddrList": ["user@example.com"]}`
+  - `fields`(콤마 구분)로 응답 필드를 지정할 수 있습니다.
+  - 결과는 userNoList, emlAddrList 순서대로 반환하며 없는 사용자는 `found: false`입니다.
+  """
+  return await call_service(service.getUsersBatch, user_vo)
+
+
+@router.get(
+  '/export',
+  status_code=status.HTTP_200_OK,
+  summary='사용자 목록 내보내기 (NDJSON/CSV)',
+  operation_id='exportUsers',
+  tags=['사용자 관리'],
+  responses={
+    200: {
+      'description': '성공 응답 (fields 오류는 ApiResponse JSON)',
+      'content': {
+        'application/x-ndjson': {
+          'schema': {'type': 'string'},
+          'example': '{"userNo": 1, "emlAddr": "user1@example.com", '
+          '"userNm": "user1"}\n',
+        },
+        'text/csv': {
+          'schema': {'type': 'string'},
+          'example': 'userNo,emlAddr,userNm\n1,user1@example.com,user1\n',
+        },
+      },
+    },
+  },
+)
+async def exportUsers(
+  user_vo: UserVo = Depends(),
+  export_format: Literal['ndjson', 'csv'] = Query(
+    default='ndjson', alias='format', description='파일 형식 (ndjson, csv)'
+  ),
+  admin_no: int = Depends(get_current_admin_id),
+  service: UserService | AsyncUserService = Depends(get_user_service),
+):
+  """검색 조건에 맞는 사용자 전체를 NDJSON 또는 CSV로 내보냅니다. (관리자 전용)
+
+  - 검색 조건과 fields는 목록 조회와 같으며, page/pageSz/cursor는 무시합니다.
+  - 결과를 메모리에 모으지 않고 DB 커서에서 읽는 대로 응답 스트림으로 보냅니다.
+  """
+  result = await call_streaming_service(service.exportUsers, user_vo, export_format)
+  if isinstance(result, ApiResponse):
+    return result
+
+  print(f'[ROUTER] export: format={export_format} admin_no={admin_no}')
+  return StreamingResponse(
+    result,
+    media_type=EXPORT_MEDIA_TYPES[export_format],
+    headers={'Content-Disposition': f'attachment; filename=users.{export_format}'},
+  )
 
 
 @router.get(
   '/email/{eml_addr}',
   response_model=ApiResponse[UserVo],
+  # 응답 VO에 설정된 필드만 출력 (비밀번호 등 조회하지 않은 필드와 검색 필드 제외)
+  response_model_exclude_unset=True,
   status_code=status.HTTP_200_OK,
   summary='이메일로 사용자 조회',
   operation_id='getUserByEmail',
   tags=['사용자 관리'],
   responses={
+    304: NOT_MODIFIED_RESPONSE,
     200: {
       'description': '성공 응답',
       'content': {
@@ -125,23 +359,32 @@ def createUser(
     },
   },
 )
-def getUserByEmail(
+async def getUserByEmail(
+  response: Response,
   eml_addr: str,
-  service: UserService = Depends(get_user_service),
+  if_none_match: Optional[str] = Header(
+    default=None, description=IF_NONE_MATCH_DESCRIPTION
+  ),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
-  """이메일로 사용자 정보를 조회합니다."""
+  """이메일로 사용자 정보를 조회합니다.
+
+  - 응답의 ETag를 If-None-Match로 보내면, 바뀌지 않은 경우 본문 없이 304를 응답합니다.
+  """
   user_vo = UserVo(emlAddr=eml_addr)
-  return service.getUserByEmail(user_vo)
+  return await get_user_with_etag(service, user_vo, response, if_none_match)
 
 
 @router.get(
   '/{user_no}',
   response_model=ApiResponse[UserVo],
+  response_model_exclude_unset=True,
   status_code=status.HTTP_200_OK,
   summary='사용자 조회',
   operation_id='getUserByNo',
   tags=['사용자 관리'],
   responses={
+    304: NOT_MODIFIED_RESPONSE,
     200: {
       'description': '성공 응답',
       'content': {
@@ -171,23 +414,35 @@ def getUserByEmail(
     },
   },
 )
-def getUserByNo(
+async def getUserByNo(
+  response: Response,
   user_no: int,
-  service: UserService = Depends(get_user_service),
+  fields: Optional[str] = Query(
+    default=None, description='응답에 포함할 필드 (콤마 구분, 예: userNo,userNm)'
+  ),
+  if_none_match: Optional[str] = Header(
+    default=None, description=IF_NONE_MATCH_DESCRIPTION
+  ),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
-  """사용자 번호로 사용자 정보를 조회합니다."""
-  user_vo = UserVo(userNo=user_no)
-  return service.getUserByNo(user_vo)
+  """사용자 번호로 사용자 정보를 조회합니다.
+
+  - 응답의 ETag를 If-None-Match로 보내면, 바뀌지 않은 경우 본문 없이 304를 응답합니다.
+  """
+  user_vo = UserVo(userNo=user_no, fields=fields)
+  return await get_user_with_etag(service, user_vo, response, if_none_match)
 
 
 @router.get(
   '/',
   response_model=ApiResponse[ListResponse[UserVo]],
+  response_model_exclude_unset=True,
   status_code=status.HTTP_200_OK,
   summary='사용자 목록 조회',
   operation_id='getUserList',
   tags=['사용자 관리'],
   responses={
+    304: NOT_MODIFIED_RESPONSE,
     200: {
       'description': '성공 응답',
       'content': {
@@ -199,6 +454,9 @@ def getUserByNo(
                 'data': {
                   'list': get_user_list_example(),
                   'totalCnt': 3,
+                  'page': 1,
+                  'pageSz': 10,
+                  'totalPage': 1,
                 },
                 'error': False,
                 'code': ResponseCode.OK,
@@ -211,6 +469,9 @@ def getUserByNo(
                 'data': {
                   'list': [],
                   'totalCnt': 0,
+                  'page': 1,
+                  'pageSz': 10,
+                  'totalPage': 0,
                 },
                 'error': False,
                 'code': ResponseCode.OK,
@@ -223,12 +484,32 @@ def getUserByNo(
     },
   },
 )
-def getUserList(
+async def getUserList(
+  response: Response,
   user_vo: UserVo = Depends(),
-  service: UserService = Depends(get_user_service),
+  if_none_match: Optional[str] = Header(
+    default=None, description=IF_NONE_MATCH_DESCRIPTION
+  ),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
-  """사용자 목록을 페이지네이션으로 조회합니다."""
-  return service.getUserList(user_vo)
+  """사용자 목록을 페이지네이션으로 조회합니다.
+
+  - 응답에는 약한 ETag(W/)가 있으며, 검색 조건/페이지와 조건에 맞는 사용자 수,
+    최근 수정 일시로 만듭니다. If-None-Match가 같으면 본문 없이 304를 응답합니다.
+  """
+  version = await call_service(service.getUserListVersion, user_vo)
+  if version is None:
+    return await call_service(service.getUserList, user_vo)
+
+  etag = make_etag(user_vo.model_dump(exclude_none=True), *version, weak=True)
+  if etag_matches(if_none_match, etag):
+    return not_modified_response(etag)
+
+  # 버전 조회에서 센 전체 건수를 사용 (건수 조회 생략)
+  result = await call_service(service.getUserList, user_vo, total_cnt=version.totalCnt)
+  if not result.error:
+    set_etag(response, etag)
+  return result
 
 
 @router.patch(
@@ -277,16 +558,18 @@ def getUserList(
     },
   },
 )
-def updateUserPassword(
+async def updateUserPassword(
   request: Request,
   user_no: int,
   user_vo: UserVo,
   current_user_no: int = Depends(get_current_user_id),
-  service: UserService = Depends(get_user_service),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
   """사용자 비밀번호를 수정합니다."""
   user_vo.userNo = user_no
-  return service.updateUserPassword(user_vo, updt_no=current_user_no)
+  return await call_service(
+    service.updateUserPassword, user_vo, updt_no=current_user_no
+  )
 
 
 @router.patch(
@@ -344,16 +627,16 @@ def updateUserPassword(
     },
   },
 )
-def updateUser(
+async def updateUser(
   request: Request,
   user_no: int,
   user_vo: UserVo,
   current_user_no: int = Depends(get_current_user_id),
-  service: UserService = Depends(get_user_service),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
   """사용자 정보를 수정합니다."""
   user_vo.userNo = user_no
-  return service.updateUser(user_vo, updt_no=current_user_no)
+  return await call_service(service.updateUser, user_vo, updt_no=current_user_no)
 
 
 @router.delete(
@@ -402,15 +685,15 @@ def updateUser(
     },
   },
 )
-def deleteUser(
+async def deleteUser(
   request: Request,
   user_no: int,
   current_user_no: int = Depends(get_current_user_id),
-  service: UserService = Depends(get_user_service),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
   """사용자를 단건 삭제합니다."""
   user_vo = UserVo(userNo=user_no)
-  return service.deleteUser(user_vo, updt_no=current_user_no)
+  return await call_service(service.deleteUser, user_vo, updt_no=current_user_no)
 
 
 @router.delete(
@@ -459,14 +742,14 @@ def deleteUser(
     },
   },
 )
-def deleteUsers(
+async def deleteUsers(
   request: Request,
   user_vo: UserVo,
   current_user_no: int = Depends(get_current_user_id),
-  service: UserService = Depends(get_user_service),
+  service: UserService | AsyncUserService = Depends(get_user_service),
 ):
   """사용자를 다건 삭제합니다.
 
   - 요청 예시: `{"userNoList": [1, 2, 3]}` 형태로 요청
   """
-  return service.deleteUsers(user_vo, updt_no=current_user_no)
+  return await call_service(service.deleteUsers, user_vo, updt_no=current_user_no)
@@ -0,0 +1,43 @@
+"""관리자 API 스키마 정의"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class PoolStatsResponse(BaseModel):
+  """DB 연결 풀 통계 응답 스키마 (엔진 하나)"""
+
+  name: str  # 풀 이름 (primary, replica-1, async-primary 등)
+  poolSize: int  # 상시 유지하는 연결 수
+  maxOverflow: int  # 추가로 열 수 있는 연결 수
+  checkedOut: int  # 현재 대여 중인 연결 수
+  checkedIn: int  # 현재 풀에서 대기 중인 연결 수
+  overflowInUse: int  # 현재 사용 중인 overflow 연결 수
+  checkouts: int  # 누적 연결 대여 횟수
+  connects: int  # 누적 DB 연결 생성 수
+  invalidations: int  # 누적 연결 무효화 수
+  prePingReconnects: int  # pool_pre_ping 실패로 재연결한 횟수
+  checkoutWaitAvgMs: float  # 평균 연결 대여 대기 시간 (밀리초)
+  checkoutWaitMaxMs: float  # 최대 연결 대여 대기 시간 (밀리초)
+  checkoutWaitHistogram: dict[str, int]  # 대기 시간 구간별 건수 (구간 상한 -> 건수)
+  holdTimeAvgMs: float  # 평균 연결 점유 시간 (대여 ~ 반납, 밀리초)
+  holdTimeMaxMs: float  # 최대 연결 점유 시간 (밀리초)
+  holdTimeHistogram: dict[str, int]  # 점유 시간 구간별 건수 (구간 상한 -> 건수)
+
+
+class CacheStatsResponse(BaseModel):
+  """캐시 통계 응답 스키마 (캐시 하나, 누적 통계는 현재 워커 기준)"""
+
+  name: str  # 캐시 이름 (user 등)
+  backend: str  # 저장소 (memory, shm, redis)
+  enabled: bool  # 사용 여부
+  maxSize: int  # 최대 항목 수
+  ttlSeconds: float  # 항목 유효 시간 (초)
+  size: Optional[int]  # 현재 항목 수 (redis는 제공하지 않음)
+  hits: int  # 누적 조회 성공 수
+  misses: int  # 누적 조회 실패 수 (없음 + 만료)
+  hitRatio: float  # 조회 성공 비율 (0~1)
+  evictions: int  # 크기 제한으로 제거한 수
+  expirations: int  # 유효 시간이 지나 제거한 수
+  invalidations: int  # 쓰기 후 무효화한 수
@@ -2,13 +2,15 @@
 
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel
+
+from src.utils.email_helper import NormalizedEmail
 
 
 class LoginRequest(BaseModel):
   """로그인 요청 스키마"""
 
-  emlAddr: EmailStr
+  emlAddr: NormalizedEmail
   password: str
 
 
@@ -29,13 +31,13 @@ class LogoutRequest(BaseModel):
 class ResetPasswordRequestRequest(BaseModel):
   """비밀번호 재설정 요청 스키마 (이메일 검증)"""
 
-  emlAddr: EmailStr
+  emlAddr: NormalizedEmail
 
 
 class ResetPasswordRequest(BaseModel):
   """비밀번호 재설정 스키마 (실제 재설정)"""
 
-  emlAddr: EmailStr
+  emlAddr: NormalizedEmail
   resetToken: str  # 이메일로 받은 인증 토큰
   newPassword: str
 
@@ -11,7 +11,11 @@ class ListResponse(BaseModel, Generic[TData]):
   """리스트 응답 데이터 형식"""
 
   list: list[TData]
-  totalCnt: int
+  totalCnt: Optional[int] = None  # 전체 개수 (커서 조회에서는 생략)
+  page: Optional[int] = None  # 현재 페이지 (1부터 시작, 커서 조회에서는 생략)
+  pageSz: Optional[int] = None  # 페이지 사이즈
+  totalPage: Optional[int] = None  # 전체 페이지 수 (커서 조회에서는 생략)
+  nextCursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
   class Config:
     from_attributes = True
@@ -1,13 +1,16 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 from src.models import UserRole, YnStatus
+from src.utils.datetime_helper import UtcDateTime
+from src.utils.email_helper import NormalizedEmail
+from src.vos.user_vo import UserVo
 
 
 # 요청 스키마
 class CreateUser(BaseModel):
-  emlAddr: EmailStr
+  emlAddr: NormalizedEmail
   userNm: str
   password: str
   userRole: UserRole = UserRole.USER
@@ -21,7 +24,7 @@ class DeleteUserRequest(BaseModel):
 
 
 class UpdateUser(BaseModel):
-  emlAddr: Optional[EmailStr] = None
+  emlAddr: Optional[NormalizedEmail] = None
   userNm: Optional[str] = None
   userRole: Optional[UserRole] = None
   proflImg: Optional[str] = None
@@ -29,10 +32,10 @@ class UpdateUser(BaseModel):
   password: Optional[str] = None
   useYn: Optional[YnStatus] = None
   delYn: Optional[YnStatus] = None
-  lastLgnDt: Optional[str] = None
-  lastPswdChgDt: Optional[str] = None
-  updtDt: Optional[str] = None
-  delDt: Optional[str] = None
+  lastLgnDt: Optional[UtcDateTime] = None
+  lastPswdChgDt: Optional[UtcDateTime] = None
+  updtDt: Optional[UtcDateTime] = None
+  delDt: Optional[UtcDateTime] = None
   updtNo: Optional[int] = None
   delNo: Optional[int] = None
 
@@ -49,14 +52,14 @@ class UserResponse(BaseModel):
   reshToken: Optional[str] = None  # 보안상 항상 null로 반환
   useYn: YnStatus
   delYn: YnStatus
-  lastLgnDt: Optional[str]
-  lastPswdChgDt: Optional[str]
+  lastLgnDt: Optional[UtcDateTime]
+  lastPswdChgDt: Optional[UtcDateTime]
   crtNo: Optional[int]
-  crtDt: str
+  crtDt: UtcDateTime
   updtNo: Optional[int]
-  updtDt: str
+  updtDt: UtcDateTime
   delNo: Optional[int]
-  delDt: Optional[str]
+  delDt: Optional[UtcDateTime]
 
   class Config:
     from_attributes = True
@@ -67,3 +70,44 @@ class UserResponse(BaseModel):
     self.encptPswd = None
     self.reshToken = None
     return self
+
+
+class UserImportError(BaseModel):
+  """대량 가입 실패 행"""
+
+  rowNo: int  # 파일의 행 번호 (헤더/빈 줄 제외, 1부터)
+  emlAddr: Optional[str] = None  # 행의 이메일 (읽을 수 없으면 None)
+  message: str  # 실패 사유
+
+
+class UserImportResponse(BaseModel):
+  """대량 가입 결과 (배치별 결과를 합산)"""
+
+  totalCnt: int = 0  # 처리한 행 수
+  createdCnt: int = 0  # 생성된 사용자 수
+  failedCnt: int = 0  # 실패한 행 수
+  errors: list[UserImportError] = Field(default_factory=list)  # 실패 행 목록
+
+  def add(self, batch_result: 'UserImportResponse') -> None:
+    """배치 결과 합산"""
+    self.totalCnt += batch_result.totalCnt
+    self.createdCnt += batch_result.createdCnt
+    self.failedCnt += batch_result.failedCnt
+    self.errors.extend(batch_result.errors)
+
+
+class UserBatchItem(BaseModel):
+  """다건 조회 결과 한 건 (요청한 번호 또는 이메일 하나)"""
+
+  userNo: Optional[int] = None  # 요청한 사용자 번호 (번호로 조회한 경우)
+  emlAddr: Optional[str] = None  # 요청한 이메일 (이메일로 조회한 경우)
+  found: bool  # 사용자 존재 여부
+  data: Optional[UserVo] = None  # 사용자 정보 (없으면 None)
+
+
+class UserBatchResponse(BaseModel):
+  """다건 조회 결과 (userNoList, emlAddrList 순서대로)"""
+
+  list: list[UserBatchItem]
+  foundCnt: int  # 찾은 건수
+  notFoundCnt: int  # 찾지 못한 건수
@@ -0,0 +1,330 @@
+"""인증 관련 비즈니스 로직 서비스 (비동기)"""
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.dao.async_user_dao import AsyncUserDAO
+from src.dao.user_dao import UserStatus
+from src.messages.auth_message import AuthMessage
+from src.models import YnStatus
+from src.schemas.auth_schema import (
+  ChangePasswordRequest,
+  LoginRequest,
+  LoginResponse,
+  ResetPasswordRequest,
+  ResetPasswordRequestRequest,
+)
+from src.schemas.response_code import ResponseCode
+from src.schemas.response_schema import ApiResponse
+from src.services.auth_service import get_reset_token_cache
+from src.utils.async_helper import call_cache
+from src.utils.cache_helper import CacheBackend
+from src.utils.jwt_helper import (
+  create_access_token,
+  create_refresh_token,
+  get_access_token_cache,
+  verify_access_token,
+  verify_refresh_token,
+)
+from src.utils.password_helper import hash_password, verify_password
+from src.utils.replica_helper import read_only
+from src.utils.response_helper import error_response, success_response
+
+
+class AsyncAuthService:
+  """인증 비즈니스 로직 서비스 (비동기)
+
+  AuthService와 동일한 규칙으로 동작하며, DB 접근은 AsyncUserDAO를 사용합니다.
+  비밀번호 해시화/검증은 스레드풀에서 실행하여 이벤트 루프를 막지 않습니다.
+  """
+
+  def __init__(
+    self,
+    session: AsyncSession,
+    reset_token_cache: Optional[CacheBackend] = None,
+    user_cache: Optional[CacheBackend] = None,
+    user_status_cache: Optional[CacheBackend] = None,
+  ):
+    self.session = session
+    self.dao = AsyncUserDAO(user_cache, user_status_cache)
+    self.reset_token_cache = reset_token_cache or get_reset_token_cache()
+
+  async def signin(self, login_request: LoginRequest) -> ApiResponse[LoginResponse]:
+    """로그인"""
+    # 이메일로 사용자 조회
+    user_entity = await self.dao.load_user_by_email(self.session, login_request.emlAddr)
+    if not user_entity:
+      return error_response(
+        message=AuthMessage.LOGIN_FAILED,
+        code=ResponseCode.UNAUTHORIZED,
+      )
+
+    # 사용자 상태 확인
+    if user_entity.useYn != YnStatus.Y or user_entity.delYn != YnStatus.N:
+      return error_response(
+        message=AuthMessage.USER_DISABLED,
+        code=ResponseCode.FORBIDDEN,
+      )
+
+    # 비밀번호 검증
+    if not await run_in_threadpool(
+      verify_password, login_request.password, user_entity.encptPswd
+    ):
+      return error_response(
+        message=AuthMessage.LOGIN_FAILED,
+        code=ResponseCode.UNAUTHORIZED,
+      )
+
+    # 이미 활성화된 세션이 있는지 확인 (reshToken 존재 여부)
+    if user_entity.reshToken:
+      return error_response(
+        message=AuthMessage.ALREADY_LOGGED_IN,
+        code=ResponseCode.FORBIDDEN,
+      )
+
+    # JWT 토큰 생성 (사용자 번호, 이름, 이메일, userRole 포함)
+    token_data = {
+      'sub': str(user_entity.userNo),
+      'userNm': user_entity.userNm,
+      'email': user_entity.emlAddr,
+      'userRole': user_entity.userRole.value,
+    }
+    access_token = create_access_token(token_data)
+    refresh_token = create_refresh_token(token_data)
+
+    # DAO를 통해 로그인 정보 업데이트 (마지막 로그인 시간, 리프레시 토큰)
+    if user_entity.userNo is None:
+      return error_response(
+        message=AuthMessage.LOGIN_FAILED,
+        code=ResponseCode.UNAUTHORIZED,
+      )
+    await self.dao.update_user_login_info(
+      session=self.session,
+      user=user_entity,
+      refresh_token=refresh_token,
+      updt_no=user_entity.userNo,
+    )
+
+    login_response = LoginResponse(accessToken=access_token, refreshToken=refresh_token)
+
+    return success_response(
+      data=login_response,
+      message=AuthMessage.LOGIN_SUCCESS,
+      code=ResponseCode.OK,
+    )
+
+  async def signout(self, refresh_token: Optional[str]) -> ApiResponse[None]:
+    """로그아웃"""
+    if refresh_token:
+      # Refresh Token 검증
+      payload = verify_refresh_token(refresh_token)
+      if payload:
+        user_no = int(payload.get('sub', 0))
+        user_entity = await self.dao.load_user_by_no(self.session, user_no)
+        if user_entity and user_entity.reshToken == refresh_token:
+          # DAO를 통해 리프레시 토큰 초기화
+          await self.dao.clear_user_refresh_token(
+            session=self.session, user=user_entity, updt_no=user_no
+          )
+
+    return success_response(
+      message=AuthMessage.LOGOUT_SUCCESS,
+      code=ResponseCode.OK,
+    )
+
+  async def refresh(self, refresh_token: str) -> ApiResponse[LoginResponse]:
+    """Refresh Token을 사용하여 Access Token 및 Refresh Token 재발급"""
+    payload = verify_refresh_token(refresh_token)
+    if not payload:
+      return error_response(
+        message=AuthMessage.REFRESH_TOKEN_INVALID, code=ResponseCode.UNAUTHORIZED
+      )
+
+    user_no = int(payload.get('sub', 0))
+    user_entity = await self.dao.load_user_by_no(self.session, user_no)
+
+    # 사용자 정보가 없거나, 저장된 Refresh Token이 요청된 Refresh Token과 다르면 에러
+    if not user_entity or user_entity.reshToken != refresh_token:
+      return error_response(
+        message=AuthMessage.REFRESH_TOKEN_INVALID, code=ResponseCode.UNAUTHORIZED
+      )
+
+    # 새로운 Access Token과 Refresh Token 생성
+    token_data = {
+      'sub': str(user_entity.userNo),
+      'userNm': user_entity.userNm,
+      'email': user_entity.emlAddr,
+      'userRole': user_entity.userRole.value,
+    }
+    new_access_token = create_access_token(token_data)
+    new_refresh_token = create_refresh_token(token_data)
+
+    # DAO를 통해 새로운 Refresh Token으로 업데이트
+    if user_entity.userNo is None:
+      return error_response(
+        message=AuthMessage.REFRESH_TOKEN_INVALID, code=ResponseCode.UNAUTHORIZED
+      )
+    await self.dao.update_user_refresh_token(
+      session=self.session,
+      user=user_entity,
+      new_refresh_token=new_refresh_token,
+      updt_no=user_entity.userNo,
+    )
+
+    login_response = LoginResponse(
+      accessToken=new_access_token, refreshToken=new_refresh_token
+    )
+    return success_response(
+      data=login_response, message='토큰이 성공적으로 재발급되었습니다.'
+    )
+
+  async def request_reset_password(
+    self, request: ResetPasswordRequestRequest
+  ) -> ApiResponse[None]:
+    """비밀번호 재설정 요청"""
+    user_entity = await self.dao.load_user_by_email(self.session, request.emlAddr)
+    if not user_entity:
+      # 보안을 위해 사용자가 존재하지 않아도 성공 메시지 반환
+      return success_response(
+        message=AuthMessage.RESET_PASSWORD_REQUEST_SUCCESS,
+        code=ResponseCode.OK,
+      )
+
+    # 비밀번호 재설정 토큰 생성 (간단하게 JWT 사용)
+    token_data = {
+      'sub': str(user_entity.userNo),
+      'email': user_entity.emlAddr,
+      'type': 'reset',
+    }
+    reset_token = create_access_token(token_data)  # ACCESS_TOKEN_SECRET 사용
+
+    # 토큰 저장 (CACHE_BACKEND 저장소, 토큰 만료 시간 동안 유지)
+    await call_cache(
+      self.reset_token_cache,
+      self.reset_token_cache.set,
+      request.emlAddr,
+      {
+        'token': reset_token,
+        'user_no': user_entity.userNo,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+      },
+    )
+
+    return success_response(
+      message=AuthMessage.RESET_PASSWORD_REQUEST_SUCCESS,
+      code=ResponseCode.OK,
+    )
+
+  def get_reset_token(self, eml_addr: str) -> Optional[str]:
+    """저장된 비밀번호 재설정 토큰 조회 (재설정 이메일 발송용)"""
+    token_info = self.reset_token_cache.get(eml_addr)
+    return token_info['token'] if token_info else None
+
+  async def reset_password(self, request: ResetPasswordRequest) -> ApiResponse[None]:
+    """비밀번호 재설정"""
+    # 저장된 토큰 확인
+    token_info = await call_cache(
+      self.reset_token_cache, self.reset_token_cache.get, request.emlAddr
+    )
+    if not token_info or token_info['token'] != request.resetToken:
+      return error_response(
+        message=AuthMessage.RESET_TOKEN_NOT_FOUND,
+        code=ResponseCode.BAD_REQUEST,
+      )
+
+    # 토큰 검증
+    token_cache = get_access_token_cache()
+    payload = await call_cache(token_cache, verify_access_token, request.resetToken)
+    if not payload or payload.get('type') != 'reset':
+      # 토큰 삭제
+      await call_cache(
+        self.reset_token_cache, self.reset_token_cache.delete, request.emlAddr
+      )
+      return error_response(
+        message=AuthMessage.RESET_TOKEN_INVALID,
+        code=ResponseCode.BAD_REQUEST,
+      )
+
+    # 사용자 조회
+    user_no = token_info['user_no']
+    user_entity = await self.dao.load_user_by_no(self.session, user_no)
+    if not user_entity or user_entity.userNo is None:
+      await call_cache(
+        self.reset_token_cache, self.reset_token_cache.delete, request.emlAddr
+      )
+      return error_response(
+        message=AuthMessage.USER_NOT_FOUND,
+        code=ResponseCode.NOT_FOUND,
+      )
+
+    # 비밀번호 업데이트
+    encpt_pswd = await run_in_threadpool(hash_password, request.newPassword)
+    await self.dao.update_user_password(
+      session=self.session,
+      user=user_entity,
+      encpt_pswd=encpt_pswd,
+      updt_no=user_entity.userNo,
+    )
+
+    # 토큰 삭제
+    await call_cache(
+      self.reset_token_cache, self.reset_token_cache.delete, request.emlAddr
+    )
+
+    return success_response(
+      message=AuthMessage.RESET_PASSWORD_SUCCESS,
+      code=ResponseCode.OK,
+    )
+
+  async def change_password(
+    self, user_no: int, request: ChangePasswordRequest
+  ) -> ApiResponse[None]:
+    """비밀번호 변경"""
+    # 사용자 조회
+    user_entity = await self.dao.load_user_by_no(self.session, user_no)
+    if not user_entity:
+      return error_response(
+        message=AuthMessage.USER_NOT_FOUND,
+        code=ResponseCode.NOT_FOUND,
+      )
+
+    # 현재 비밀번호 검증
+    if not await run_in_threadpool(
+      verify_password, request.currentPassword, user_entity.encptPswd
+    ):
+      return error_response(
+        message=AuthMessage.CURRENT_PASSWORD_INCORRECT,
+        code=ResponseCode.UNAUTHORIZED,
+      )
+
+    # 새 비밀번호가 현재 비밀번호와 같은지 확인
+    if await run_in_threadpool(
+      verify_password, request.newPassword, user_entity.encptPswd
+    ):
+      return error_response(
+        message=AuthMessage.NEW_PASSWORD_SAME,
+        code=ResponseCode.BAD_REQUEST,
+      )
+
+    # 비밀번호 업데이트
+    encpt_pswd = await run_in_threadpool(hash_password, request.newPassword)
+    await self.dao.update_user_password(
+      session=self.session, user=user_entity, encpt_pswd=encpt_pswd, updt_no=user_no
+    )
+
+    return success_response(
+      message=AuthMessage.CHANGE_PASSWORD_SUCCESS,
+      code=ResponseCode.OK,
+    )
+
+  def get_cached_user_status(self, user_no: int) -> Optional[UserStatus]:
+    """캐시된 사용자 상태 조회 (DB 조회가 없으므로 이벤트 루프에서 바로 호출)"""
+    return self.dao.get_cached_user_status(user_no)
+
+  @read_only
+  async def get_user_status(self, user_no: int) -> Optional[UserStatus]:
+    """사용자 상태 조회 (인증 의존성용)"""
+    return await self.dao.load_user_status(self.session, user_no)
@@ -5,7 +5,7 @@ from typing import Optional
 
 from sqlmodel import Session
 
-from src.dao.user_dao import UserDAO
+from src.dao.user_dao import UserDAO, UserStatus
 from src.messages.auth_message import AuthMessage
 from src.models import YnStatus
 from src.schemas.auth_schema import (
@@ -17,30 +17,55 @@ from src.schemas.auth_schema import (
 )
 from src.schemas.response_code import ResponseCode
 from src.schemas.response_schema import ApiResponse
+from src.settings import settings
+from src.utils.cache_helper import CacheBackend, register_cache
 from src.utils.jwt_helper import (
   create_access_token,
   create_refresh_token,
+  parse_expiration,
   verify_access_token,
   verify_refresh_token,
 )
 from src.utils.password_helper import hash_password, verify_password
+from src.utils.replica_helper import read_only
 from src.utils.response_helper import error_response, success_response
 
-# 비밀번호 재설정 토큰 저장소 (실제 프로덕션에서는 Redis나 DB 사용 권장)
-reset_tokens: dict[str, dict] = {}
+# 비밀번호 재설정 토큰 저장소에 보관할 최대 요청 수
+RESET_TOKEN_MAX_SIZE = 10000
+
+# 비밀번호 재설정 토큰 저장소 (이메일 -> 토큰 정보, 토큰 만료 시간 동안 유지)
+# CACHE_BACKEND가 shm/redis면 요청을 받은 워커와 재설정을 처리하는 워커가 달라도 됨
+reset_token_cache = register_cache(
+  'reset_token',
+  max_size=RESET_TOKEN_MAX_SIZE,
+  ttl_seconds=parse_expiration(settings.ACCESS_EXP).total_seconds(),
+  enabled=True,
+)
+
+
+def get_reset_token_cache() -> CacheBackend:
+  """비밀번호 재설정 토큰 저장소 의존성 주입"""
+  return reset_token_cache
 
 
 class AuthService:
   """인증 비즈니스 로직 서비스"""
 
-  def __init__(self, session: Session):
+  def __init__(
+    self,
+    session: Session,
+    reset_token_cache: Optional[CacheBackend] = None,
+    user_cache: Optional[CacheBackend] = None,
+    user_status_cache: Optional[CacheBackend] = None,
+  ):
     self.session = session
-    self.dao = UserDAO()
+    self.dao = UserDAO(user_cache, user_status_cache)
+    self.reset_token_cache = reset_token_cache or get_reset_token_cache()
 
   def signin(self, login_request: LoginRequest) -> ApiResponse[LoginResponse]:
     """로그인"""
     # 이메일로 사용자 조회
-    user_entity = self.dao.get_user_by_email(self.session, login_request.emlAddr)
+    user_entity = self.dao.load_user_by_email(self.session, login_request.emlAddr)
     if not user_entity:
       return error_response(
         message=AuthMessage.LOGIN_FAILED,
@@ -106,7 +131,7 @@ class AuthService:
       payload = verify_refresh_token(refresh_token)
       if payload:
         user_no = int(payload.get('sub', 0))
-        user_entity = self.dao.get_user_by_no(self.session, user_no)
+        user_entity = self.dao.load_user_by_no(self.session, user_no)
         if user_entity and user_entity.reshToken == refresh_token:
           # DAO를 통해 리프레시 토큰 초기화
           self.dao.clear_user_refresh_token(
@@ -127,7 +152,7 @@ class AuthService:
       )
 
     user_no = int(payload.get('sub', 0))
-    user_entity = self.dao.get_user_by_no(self.session, user_no)
+    user_entity = self.dao.load_user_by_no(self.session, user_no)
 
     # 사용자 정보가 없거나, 저장된 Refresh Token이 요청된 Refresh Token과 다르면 에러
     if not user_entity or user_entity.reshToken != refresh_token:
@@ -168,7 +193,7 @@ class AuthService:
     self, request: ResetPasswordRequestRequest
   ) -> ApiResponse[None]:
     """비밀번호 재설정 요청"""
-    user_entity = self.dao.get_user_by_email(self.session, request.emlAddr)
+    user_entity = self.dao.load_user_by_email(self.session, request.emlAddr)
     if not user_entity:
       # 보안을 위해 사용자가 존재하지 않아도 성공 메시지 반환
       return success_response(
@@ -184,12 +209,15 @@ class AuthService:
     }
     reset_token = create_access_token(token_data)  # ACCESS_TOKEN_SECRET 사용
 
-    # 토큰 저장 (실제 프로덕션에서는 Redis나 DB 사용)
-    reset_tokens[request.emlAddr] = {
-      'token': reset_token,
-      'user_no': user_entity.userNo,
-      'created_at': datetime.now(timezone.utc).isoformat(),
-    }
+    # 토큰 저장 (CACHE_BACKEND 저장소, 토큰 만료 시간 동안 유지)
+    self.reset_token_cache.set(
+      request.emlAddr,
+      {
+        'token': reset_token,
+        'user_no': user_entity.userNo,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+      },
+    )
 
     # 이메일 발송은 router에서 BackgroundTasks로 처리
 
@@ -198,10 +226,15 @@ class AuthService:
       code=ResponseCode.OK,
     )
 
+  def get_reset_token(self, eml_addr: str) -> Optional[str]:
+    """저장된 비밀번호 재설정 토큰 조회 (재설정 이메일 발송용)"""
+    token_info = self.reset_token_cache.get(eml_addr)
+    return token_info['token'] if token_info else None
+
   def reset_password(self, request: ResetPasswordRequest) -> ApiResponse[None]:
     """비밀번호 재설정"""
     # 저장된 토큰 확인
-    token_info = reset_tokens.get(request.emlAddr)
+    token_info = self.reset_token_cache.get(request.emlAddr)
     if not token_info or token_info['token'] != request.resetToken:
       return error_response(
         message=AuthMessage.RESET_TOKEN_NOT_FOUND,
@@ -212,7 +245,7 @@ class AuthService:
     payload = verify_access_token(request.resetToken)
     if not payload or payload.get('type') != 'reset':
       # 토큰 삭제
-      reset_tokens.pop(request.emlAddr, None)
+      self.reset_token_cache.delete(request.emlAddr)
       return error_response(
         message=AuthMessage.RESET_TOKEN_INVALID,
         code=ResponseCode.BAD_REQUEST,
@@ -220,9 +253,9 @@ class AuthService:
 
     # 사용자 조회
     user_no = token_info['user_no']
-    user_entity = self.dao.get_user_by_no(self.session, user_no)
+    user_entity = self.dao.load_user_by_no(self.session, user_no)
     if not user_entity:
-      reset_tokens.pop(request.emlAddr, None)
+      self.reset_token_cache.delete(request.emlAddr)
       return error_response(
         message=AuthMessage.USER_NOT_FOUND,
         code=ResponseCode.NOT_FOUND,
@@ -230,7 +263,7 @@ class AuthService:
 
     # 비밀번호 업데이트
     if user_entity.userNo is None:
-      reset_tokens.pop(request.emlAddr, None)
+      self.reset_token_cache.delete(request.emlAddr)
       return error_response(
         message=AuthMessage.USER_NOT_FOUND,
         code=ResponseCode.NOT_FOUND,
@@ -244,7 +277,7 @@ class AuthService:
     )
 
     # 토큰 삭제
-    reset_tokens.pop(request.emlAddr, None)
+    self.reset_token_cache.delete(request.emlAddr)
 
     return success_response(
       message=AuthMessage.RESET_PASSWORD_SUCCESS,
@@ -256,7 +289,7 @@ class AuthService:
   ) -> ApiResponse[None]:
     """비밀번호 변경"""
     # 사용자 조회
-    user_entity = self.dao.get_user_by_no(self.session, user_no)
+    user_entity = self.dao.load_user_by_no(self.session, user_no)
     if not user_entity:
       return error_response(
         message=AuthMessage.USER_NOT_FOUND,
@@ -288,11 +321,11 @@ class AuthService:
       code=ResponseCode.OK,
     )
 
-  def get_current_user(self, token: str):
-    """현재 사용자 정보 조회"""
-    payload = verify_access_token(token)
-    if not payload:
-      return None
+  def get_cached_user_status(self, user_no: int) -> Optional[UserStatus]:
+    """캐시된 사용자 상태 조회 (DB 조회가 없으므로 이벤트 루프에서 바로 호출)"""
+    return self.dao.get_cached_user_status(user_no)
 
-    user_no = int(payload.get('sub', 0))
-    return self.dao.get_user_by_no(self.session, user_no)
+  @read_only
+  def get_user_status(self, user_no: int) -> Optional[UserStatus]:
+    """사용자 상태 조회 (인증 의존성용)"""
+    return self.dao.load_user_status(self.session, user_no)
@@ -1,22 +1,155 @@
-from typing import Optional
+from typing import Callable, Iterator, Optional, Sequence
 
+from pydantic import ValidationError
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
 
-from src.dao.user_dao import UserDAO
+from src.dao.user_dao import (
+  USER_PUBLIC_FIELDS,
+  UserDAO,
+  UserListVersion,
+  UserVersion,
+)
 from src.messages.user_message import UserMessage
 from src.schemas.response_code import ResponseCode
 from src.schemas.response_schema import ApiResponse, ListResponse
-from src.utils.password_helper import hash_password
+from src.schemas.user_schema import (
+  UserBatchItem,
+  UserBatchResponse,
+  UserImportError,
+  UserImportResponse,
+)
+from src.utils.cache_helper import CacheBackend
+from src.utils.cursor_helper import decode_cursor, encode_cursor
+from src.utils.email_helper import normalize_email
+from src.utils.export_helper import iter_export_chunks
+from src.utils.import_helper import ImportRow
+from src.utils.password_helper import hash_password, hash_passwords
+from src.utils.replica_helper import read_only
 from src.utils.response_helper import error_response, success_response
+from src.vos.search_vo import SRCH_SORT_SIMILARITY
 from src.vos.user_vo import UserVo
 
+# 대량 가입 파일에서 읽는 필드 (그 외 필드는 무시)
+USER_IMPORT_FIELDS = ('emlAddr', 'userNm', 'password', 'userRole')
+
+# 다건 조회 한 번에 요청할 수 있는 최대 번호/이메일 수 (userNoList + emlAddrList)
+USER_BATCH_MAX_SIZE = 1000
+
+
+def validate_import_rows(
+  import_rows: list[ImportRow],
+) -> tuple[list[tuple[int, UserVo]], list[UserImportError]]:
+  """대량 가입 행 검증 (UserVo 변환, 필수값, 파일 안 중복)
+
+  동기/비동기 서비스에서 공통으로 사용합니다. (DB 조회 없음)
+
+  Returns:
+    (저장할 (행 번호, VO) 목록, 실패 행 목록)
+  """
+  valid_rows: list[tuple[int, UserVo]] = []
+  errors: list[UserImportError] = []
+  seen_eml_addrs: set[str] = set()
+  seen_user_nms: set[str] = set()
+  for import_row in import_rows:
+    if import_row.values is None:
+      errors.append(
+        UserImportError(rowNo=import_row.rowNo, message=UserMessage.IMPORT_PARSE_ERROR)
+      )
+      continue
+
+    # CSV의 빈 값은 입력하지 않은 것으로 처리
+    values = {
+      field: import_row.values[field]
+      for field in USER_IMPORT_FIELDS
+      if import_row.values.get(field) not in (None, '')
+    }
+    eml_addr = str(values['emlAddr']) if 'emlAddr' in values else None
+    try:
+      user_vo = UserVo.model_validate(values)
+    except ValidationError as error:
+      fields = dict.fromkeys(str(detail['loc'][0]) for detail in error.errors())
+      errors.append(
+        UserImportError(
+          rowNo=import_row.rowNo,
+          emlAddr=eml_addr,
+          message=UserMessage.IMPORT_INVALID_FIELDS.format(fields=', '.join(fields)),
+        )
+      )
+      continue
+
+    if (
+      not user_vo.emlAddr
+      or not user_vo.userNm
+      or not user_vo.password
+      or not user_vo.userRole
+    ):
+      message = UserMessage.IMPORT_REQUIRED_FIELDS
+    elif user_vo.emlAddr in seen_eml_addrs:
+      message = UserMessage.IMPORT_DUPLICATE_EMAIL
+    elif user_vo.userNm in seen_user_nms:
+      message = UserMessage.IMPORT_DUPLICATE_USERNAME
+    else:
+      seen_eml_addrs.add(user_vo.emlAddr)
+      seen_user_nms.add(user_vo.userNm)
+      valid_rows.append((import_row.rowNo, user_vo))
+      continue
+    errors.append(
+      UserImportError(rowNo=import_row.rowNo, emlAddr=eml_addr, message=message)
+    )
+  return valid_rows, errors
+
+
+def build_user_batch_response(
+  user_vo: UserVo, user_rows: Sequence[Row], to_public_vo: Callable[[Row], UserVo]
+) -> UserBatchResponse:
+  """다건 조회 결과를 요청 순서(userNoList, emlAddrList)대로 정렬
+
+  동기/비동기 서비스에서 공통으로 사용합니다. 같은 사용자를 여러 번 요청하면
+  요청한 만큼 결과를 반환하고, 없는 사용자는 found=False로 표시합니다.
+  """
+  users_by_no: dict[int, UserVo] = {}
+  users_by_eml_addr: dict[str, UserVo] = {}
+  for user_row in user_rows:
+    user_response = to_public_vo(user_row)
+    users_by_no[user_row.userNo] = user_response
+    if 'emlAddr' in user_row._fields:
+      users_by_eml_addr[normalize_email(user_row.emlAddr)] = user_response
+
+  items = [
+    UserBatchItem(
+      userNo=user_no,
+      found=user_no in users_by_no,
+      data=users_by_no.get(user_no),
+    )
+    for user_no in user_vo.userNoList or []
+  ]
+  items.extend(
+    UserBatchItem(
+      emlAddr=eml_addr,
+      found=eml_addr in users_by_eml_addr,
+      data=users_by_eml_addr.get(eml_addr),
+    )
+    for eml_addr in user_vo.emlAddrList or []
+  )
+  found_cnt = sum(item.found for item in items)
+  return UserBatchResponse(
+    list=items, foundCnt=found_cnt, notFoundCnt=len(items) - found_cnt
+  )
+
 
 class UserService:
   """사용자 비즈니스 로직 서비스"""
 
-  def __init__(self, session: Session):
+  def __init__(
+    self,
+    session: Session,
+    user_cache: Optional[CacheBackend] = None,
+    user_status_cache: Optional[CacheBackend] = None,
+  ):
     self.session = session
-    self.dao = UserDAO()
+    self.dao = UserDAO(user_cache, user_status_cache)
 
   def _nullify_sensitive_fields(self, user_vo: UserVo) -> UserVo:
     """응답으로 보내기 전 민감한 필드를 None으로 설정"""
@@ -25,6 +158,11 @@ class UserService:
     user_vo.password = None
     return user_vo
 
+  def _to_public_vo(self, user_row: Row, fields: Optional[list[str]] = None) -> UserVo:
+    """공개 컬럼 Row를 VO로 변환 (fields가 있으면 해당 필드만 응답에 포함)"""
+    names = user_row._fields if fields is None else fields
+    return UserVo.model_validate({name: getattr(user_row, name) for name in names})
+
   def createUser(
     self, user_vo: UserVo, crt_no: int | None = None
   ) -> ApiResponse[UserVo]:
@@ -47,22 +185,6 @@ class UserService:
         code=ResponseCode.VALIDATION_ERROR,
       )
 
-    # 이메일 중복 체크
-    existing_user = self.dao.get_user_by_email(self.session, user_vo.emlAddr)
-    if existing_user:
-      return error_response(
-        message=UserMessage.EMAIL_CONFLICT,
-        code=ResponseCode.CONFLICT,
-      )
-
-    # 사용자명 중복 체크
-    existing_username = self.dao.get_user_by_username(self.session, user_vo.userNm)
-    if existing_username:
-      return error_response(
-        message=UserMessage.USERNAME_CONFLICT,
-        code=ResponseCode.CONFLICT,
-      )
-
     # 비밀번호 해시화 (password -> encptPswd)s
     if user_vo.password:
       user_vo.encptPswd = hash_password(user_vo.password)
@@ -73,7 +195,19 @@ class UserService:
     # 여기서는 crt_no가 항상 유효한 값이라고 가정
     # 자기 가입 시0번 또는 다른 기본값 사용
     creator_id = crt_no if crt_no is not None else 0
-    user_entity = self.dao.create_user(self.session, user_vo, creator_id)
+    # 이메일/사용자명 중복은 미리 조회하지 않고 UNIQUE 제약 위반으로 판단
+    try:
+      user_entity = self.dao.create_user(self.session, user_vo, creator_id)
+    except IntegrityError as error:
+      conflict_field = self.dao.get_conflict_field(error)
+      if conflict_field is None:
+        raise
+      return error_response(
+        message=UserMessage.EMAIL_CONFLICT
+        if conflict_field == 'emlAddr'
+        else UserMessage.USERNAME_CONFLICT,
+        code=ResponseCode.CONFLICT,
+      )
 
     # Entity를 VO로 변환하여 반환
     user_response = UserVo.model_validate(user_entity)
@@ -84,51 +218,256 @@ class UserService:
       code=ResponseCode.CREATED,
     )
 
-  def getUserByNo(self, user_vo: UserVo) -> ApiResponse[UserVo]:
-    """번호로 사용자 조회"""
-    if not user_vo.userNo:
+  def importUsers(
+    self, import_rows: list[ImportRow], crt_no: int
+  ) -> UserImportResponse:
+    """사용자 대량 가입 (파일의 한 배치, 배치별 결과는 라우터에서 합산)
+
+    행을 검증한 뒤 비밀번호를 프로세스 풀에서 한 번에 해시화하고,
+    INSERT 한 번으로 저장합니다. 저장하지 못한 행은 행 번호와 사유를 결과에 담습니다.
+    """
+    valid_rows, errors = validate_import_rows(import_rows)
+    user_vos = [user_vo for _, user_vo in valid_rows]
+    created: dict[str, int] = {}
+    if user_vos:
+      encpt_pswds = hash_passwords([str(user_vo.password) for user_vo in user_vos])
+      for user_vo, encpt_pswd in zip(user_vos, encpt_pswds):
+        user_vo.encptPswd = encpt_pswd
+      created = self.dao.insert_users(self.session, user_vos, crt_no)
+
+    # 저장되지 않은 행: 이미 가입된 이메일이면 이메일 중복, 아니면 사용자명 중복
+    skipped_rows = [
+      (row_no, str(user_vo.emlAddr))
+      for row_no, user_vo in valid_rows
+      if user_vo.emlAddr not in created
+    ]
+    if skipped_rows:
+      existing_eml_addrs = self.dao.get_existing_eml_addrs(
+        self.session, [eml_addr for _, eml_addr in skipped_rows]
+      )
+      errors.extend(
+        UserImportError(
+          rowNo=row_no,
+          emlAddr=eml_addr,
+          message=UserMessage.EMAIL_CONFLICT
+          if eml_addr in existing_eml_addrs
+          else UserMessage.USERNAME_CONFLICT,
+        )
+        for row_no, eml_addr in skipped_rows
+      )
+
+    errors.sort(key=lambda import_error: import_error.rowNo)
+    return UserImportResponse(
+      totalCnt=len(import_rows),
+      createdCnt=len(created),
+      failedCnt=len(errors),
+      errors=errors,
+    )
+
+  def _get_public_user(
+    self, user_vo: UserVo, by_email: bool
+  ) -> tuple[ApiResponse[UserVo], Optional[UserVersion]]:
+    """번호 또는 이메일로 공개 컬럼 조회 (응답, 응답을 만든 행의 버전)"""
+    if not (user_vo.emlAddr if by_email else user_vo.userNo):
       return error_response(
         message=UserMessage.INVALID_REQUEST, code=ResponseCode.VALIDATION_ERROR
+      ), None
+
+    fields = user_vo.to_field_list()
+    if fields is not None and not set(fields) <= set(USER_PUBLIC_FIELDS):
+      return error_response(
+        message=UserMessage.INVALID_FIELDS, code=ResponseCode.VALIDATION_ERROR
+      ), None
+
+    # 비밀번호/리프레시 토큰을 제외한 공개 컬럼만 조회
+    # ETag가 응답 본문과 같은 행을 가리키도록 수정 일시를 함께 조회 (응답에는 fields만)
+    query_fields = (
+      fields if fields is None or 'updtDt' in fields else [*fields, 'updtDt']
+    )
+    if by_email:
+      user_row = self.dao.get_public_user_by_email(
+        self.session, user_vo.emlAddr, query_fields
+      )
+    else:
+      user_row = self.dao.get_public_user_by_no(
+        self.session, user_vo.userNo, query_fields
       )
+    if not user_row:
+      return error_response(
+        message=UserMessage.NOT_FOUND, code=ResponseCode.NOT_FOUND
+      ), None
 
-    user_entity = self.dao.get_user_by_no(self.session, user_vo.userNo)
-    if not user_entity:
-      return error_response(message=UserMessage.NOT_FOUND, code=ResponseCode.NOT_FOUND)
+    user_response = self._to_public_vo(user_row, fields)
+    return (
+      success_response(data=user_response, message=UserMessage.GET_SUCCESS),
+      UserVersion(user_row.userNo, user_row.updtDt),
+    )
 
-    # Entity를 VO로 변환하여 반환
-    user_response = UserVo.model_validate(user_entity)
-    user_response = self._nullify_sensitive_fields(user_response)
-    return success_response(data=user_response, message=UserMessage.GET_SUCCESS)
+  @read_only
+  def getUserByNo(self, user_vo: UserVo) -> ApiResponse[UserVo]:
+    """번호로 사용자 조회"""
+    response, _ = self._get_public_user(user_vo, by_email=False)
+    return response
 
+  @read_only
   def getUserByEmail(self, user_vo: UserVo) -> ApiResponse[UserVo]:
     """이메일로 사용자 조회"""
-    if not user_vo.emlAddr:
+    response, _ = self._get_public_user(user_vo, by_email=True)
+    return response
+
+  @read_only
+  def getUserWithVersion(
+    self, user_vo: UserVo
+  ) -> tuple[ApiResponse[UserVo], Optional[UserVersion]]:
+    """단건 조회(번호 또는 이메일) 응답과 응답을 만든 행의 버전 (강한 ETag용)
+
+    버전은 응답 본문과 같은 행에서 조회하므로 ETag가 본문과 항상 일치합니다.
+    오류 응답이면 버전은 None입니다.
+    """
+    return self._get_public_user(user_vo, by_email=not user_vo.userNo)
+
+  @read_only
+  def getUserVersion(self, user_vo: UserVo) -> Optional[UserVersion]:
+    """단건 조회(번호 또는 이메일) 응답의 버전 조회 (If-None-Match 비교용)
+
+    조회 메서드가 오류를 응답할 요청(키 없음, 공개 필드가 아닌 fields)이면 None을
+    반환합니다. 응답 ETag는 getUserWithVersion의 버전으로 만듭니다.
+    """
+    fields = user_vo.to_field_list()
+    if fields is not None and not set(fields) <= set(USER_PUBLIC_FIELDS):
+      return None
+    if user_vo.userNo:
+      return self.dao.get_user_version(self.session, user_vo.userNo)
+    if user_vo.emlAddr:
+      return self.dao.get_user_version_by_email(self.session, user_vo.emlAddr)
+    return None
+
+  @read_only
+  def getUsersBatch(self, user_vo: UserVo) -> ApiResponse[UserBatchResponse]:
+    """사용자 번호/이메일 목록으로 다건 조회 (쿼리 한 번)"""
+    user_nos = list(dict.fromkeys(user_vo.userNoList or []))
+    eml_addrs = list(dict.fromkeys(user_vo.emlAddrList or []))
+    if not user_nos and not eml_addrs:
       return error_response(
         message=UserMessage.INVALID_REQUEST, code=ResponseCode.VALIDATION_ERROR
       )
+    if len(user_nos) + len(eml_addrs) > USER_BATCH_MAX_SIZE:
+      return error_response(
+        message=UserMessage.BATCH_TOO_MANY.format(max_size=USER_BATCH_MAX_SIZE),
+        code=ResponseCode.VALIDATION_ERROR,
+      )
 
-    user_entity = self.dao.get_user_by_email(self.session, user_vo.emlAddr)
-    if not user_entity:
-      return error_response(message=UserMessage.NOT_FOUND, code=ResponseCode.NOT_FOUND)
+    fields = user_vo.to_field_list()
+    if fields is not None and not set(fields) <= set(USER_PUBLIC_FIELDS):
+      return error_response(
+        message=UserMessage.INVALID_FIELDS, code=ResponseCode.VALIDATION_ERROR
+      )
 
-    # Entity를 VO로 변환하여 반환
-    user_response = UserVo.model_validate(user_entity)
-    user_response = self._nullify_sensitive_fields(user_response)
-    return success_response(data=user_response, message=UserMessage.GET_SUCCESS)
+    user_rows = self.dao.get_public_users(self.session, user_nos, eml_addrs, fields)
+    batch_response = build_user_batch_response(
+      user_vo, user_rows, lambda user_row: self._to_public_vo(user_row, fields)
+    )
+    return success_response(
+      data=batch_response,
+      message=UserMessage.GET_BATCH_SUCCESS.format(
+        found=batch_response.foundCnt, not_found=batch_response.notFoundCnt
+      ),
+    )
 
+  @read_only
+  def getUserListVersion(self, user_vo: UserVo) -> Optional[UserListVersion]:
+    """목록 조회 응답의 버전 조회 (ETag용, 목록 조회가 오류를 응답할 요청이면 None)"""
+    fields = user_vo.to_field_list()
+    if fields is not None and not set(fields) <= set(USER_PUBLIC_FIELDS):
+      return None
+    if user_vo.cursor and user_vo.srchSort == SRCH_SORT_SIMILARITY:
+      return None
+    return self.dao.get_users_version(self.session, user_vo)
+
+  @read_only
   def getUserList(
-    self, user_vo: Optional[UserVo] = None
+    self, user_vo: Optional[UserVo] = None, total_cnt: Optional[int] = None
   ) -> ApiResponse[ListResponse[UserVo]]:
-    """사용자 목록 조회"""
-    user_entities = self.dao.get_users(self.session, user_vo)
+    """사용자 목록 조회
 
-    # Entity 리스트를 VO 리스트로 변환
-    user_responses = [
-      self._nullify_sensitive_fields(UserVo.model_validate(u)) for u in user_entities
-    ]
-    list_response = ListResponse(list=user_responses, totalCnt=len(user_responses))
+    cursor가 없으면 page/pageSz(OFFSET) 방식으로 전체 건수와 함께 조회하고,
+    cursor가 있으면 키셋 방식으로 이어서 조회합니다. (전체 건수 생략)
+    유사도순 정렬(srchSort=similarity)은 커서를 만들지 않으므로 cursor와 함께 쓸 수
+    없습니다.
+
+    Args:
+      user_vo: 검색 조건과 페이지 정보
+      total_cnt: getUserListVersion으로 이미 조회한 전체 건수 (건수 조회 생략)
+    """
+    user_vo = user_vo or UserVo()
+    offset, limit = user_vo.to_offset_limit()
+    fields = user_vo.to_field_list()
+    if fields is not None and not set(fields) <= set(USER_PUBLIC_FIELDS):
+      return error_response(
+        message=UserMessage.INVALID_FIELDS, code=ResponseCode.VALIDATION_ERROR
+      )
+
+    if user_vo.cursor:
+      # 커서는 user_no 역순 기준이므로 유사도순 정렬과 함께 쓰면 순서가 바뀜
+      if user_vo.srchSort == SRCH_SORT_SIMILARITY:
+        return error_response(
+          message=UserMessage.INVALID_CURSOR, code=ResponseCode.VALIDATION_ERROR
+        )
+      cursor_keys = decode_cursor(user_vo.cursor)
+      after_user_no = cursor_keys.get('userNo') if cursor_keys else None
+      if not isinstance(after_user_no, int):
+        return error_response(
+          message=UserMessage.INVALID_CURSOR, code=ResponseCode.VALIDATION_ERROR
+        )
+      user_entities, has_next = self.dao.get_users_after(
+        self.session, user_vo, after_user_no
+      )
+      total_cnt = None
+    else:
+      user_entities, total_cnt = self.dao.get_users(self.session, user_vo, total_cnt)
+      has_next = offset + len(user_entities) < total_cnt
+
+    # 다음 페이지 커서 (마지막 행의 정렬 키, 유사도순 정렬에서는 생략)
+    next_cursor = (
+      encode_cursor({'userNo': user_entities[-1].userNo})
+      if has_next and user_entities and user_vo.srchSort != SRCH_SORT_SIMILARITY
+      else None
+    )
+
+    # 공개 컬럼 Row 리스트를 VO 리스트로 변환
+    user_responses = [self._to_public_vo(u, fields) for u in user_entities]
+    list_response = ListResponse(
+      list=user_responses,
+      totalCnt=total_cnt,
+      page=None if total_cnt is None else offset // limit + 1,
+      pageSz=limit,
+      totalPage=None if total_cnt is None else (total_cnt + limit - 1) // limit,
+      nextCursor=next_cursor,
+    )
     return success_response(data=list_response, message=UserMessage.GET_LIST_SUCCESS)
 
+  @read_only
+  def exportUsers(
+    self, user_vo: UserVo, export_format: str
+  ) -> ApiResponse[None] | Iterator[str]:
+    """사용자 목록 내보내기 (목록 조회와 같은 검색 조건, 페이지 없이 전체)
+
+    쿼리는 여기서 실행하고(읽기 전용 라우팅 적용), 행은 반환한 텍스트 조각
+    이터레이터를 읽는 동안 EXPORT_CHUNK_SIZE행씩 가져옵니다.
+
+    Returns:
+      fields가 공개 필드가 아니면 오류 응답, 아니면 NDJSON/CSV 텍스트 조각 이터레이터
+    """
+    fields = user_vo.to_field_list()
+    if fields is not None and not set(fields) <= set(USER_PUBLIC_FIELDS):
+      return error_response(
+        message=UserMessage.INVALID_FIELDS, code=ResponseCode.VALIDATION_ERROR
+      )
+
+    fields = fields or list(USER_PUBLIC_FIELDS)
+    partitions = self.dao.stream_users(self.session, user_vo, fields)
+    return iter_export_chunks(partitions, fields, export_format)
+
   def updateUser(self, user_vo: UserVo, updt_no: int) -> ApiResponse[UserVo]:
     """사용자 정보 업데이트"""
     if not user_vo.userNo:
@@ -136,32 +475,28 @@ class UserService:
         message=UserMessage.INVALID_REQUEST, code=ResponseCode.VALIDATION_ERROR
       )
 
-    user_entity = self.dao.get_user_by_no(self.session, user_vo.userNo)
+    # 쓰기 대상은 캐시가 아닌 DB에서 조회 (다른 워커의 쓰기로 캐시 값이 오래되었다면
+    # 캐시 값과 같은 값으로 바꾸는 변경이 UPDATE에서 빠짐)
+    user_entity = self.dao.load_user_by_no(self.session, user_vo.userNo)
     if not user_entity:
       return error_response(message=UserMessage.NOT_FOUND, code=ResponseCode.NOT_FOUND)
 
-    # 이메일 변경 시 중복 체크 (자기 자신 제외)
-    if user_vo.emlAddr and user_vo.emlAddr != user_entity.emlAddr:
-      existing_user = self.dao.get_user_by_email(self.session, user_vo.emlAddr)
-      if existing_user and existing_user.userNo != user_entity.userNo:
-        return error_response(
-          message=UserMessage.UPDATE_EMAIL_CONFLICT,
-          code=ResponseCode.CONFLICT,
-        )
-
-    # 사용자명 변경 시 중복 체크 (자기 자신 제외)
-    if user_vo.userNm and user_vo.userNm != user_entity.userNm:
-      existing_user = self.dao.get_user_by_username(self.session, user_vo.userNm)
-      if existing_user and existing_user.userNo != user_entity.userNo:
-        return error_response(
-          message=UserMessage.UPDATE_USERNAME_CONFLICT,
-          code=ResponseCode.CONFLICT,
-        )
-
     # DAO를 통해 사용자 정보 업데이트 (수정자 번호 전달)
-    updated_user_entity = self.dao.update_user(
-      self.session, user_entity, user_vo, updt_no
-    )
+    # 이메일/사용자명 중복은 미리 조회하지 않고 UNIQUE 제약 위반으로 판단
+    try:
+      updated_user_entity = self.dao.update_user(
+        self.session, user_entity, user_vo, updt_no
+      )
+    except IntegrityError as error:
+      conflict_field = self.dao.get_conflict_field(error)
+      if conflict_field is None:
+        raise
+      return error_response(
+        message=UserMessage.UPDATE_EMAIL_CONFLICT
+        if conflict_field == 'emlAddr'
+        else UserMessage.UPDATE_USERNAME_CONFLICT,
+        code=ResponseCode.CONFLICT,
+      )
 
     # Entity를 VO로 변환하여 반환
     user_response = UserVo.model_validate(updated_user_entity)
@@ -178,7 +513,7 @@ class UserService:
         message=UserMessage.INVALID_REQUEST, code=ResponseCode.VALIDATION_ERROR
       )
 
-    user_entity = self.dao.get_user_by_no(self.session, user_vo.userNo)
+    user_entity = self.dao.load_user_by_no(self.session, user_vo.userNo)
     if not user_entity:
       return error_response(message=UserMessage.NOT_FOUND, code=ResponseCode.NOT_FOUND)
 
@@ -205,7 +540,7 @@ class UserService:
         message=UserMessage.INVALID_REQUEST, code=ResponseCode.VALIDATION_ERROR
       )
 
-    user_entity = self.dao.get_user_by_no(self.session, user_vo.userNo)
+    user_entity = self.dao.load_user_by_no(self.session, user_vo.userNo)
     if not user_entity:
       return success_response(
         message=UserMessage.get_delete_not_found_message(
@@ -224,26 +559,23 @@ class UserService:
         message=UserMessage.INVALID_REQUEST, code=ResponseCode.VALIDATION_ERROR
       )
 
-    user_entities = []
-    not_found_nos = []
+    # UPDATE ... RETURNING 한 번으로 삭제 (같은 번호는 한 번만 전달)
+    user_nos = list(dict.fromkeys(user_vo.userNoList))
+    deleted_nos = set(self.dao.delete_users(self.session, user_nos, updt_no))
 
-    for user_no in user_vo.userNoList:
-      user_entity = self.dao.get_user_by_no(self.session, user_no)
-      if user_entity:
-        user_entities.append(user_entity)
-      else:
-        not_found_nos.append(user_no)
+    # 건수와 찾을 수 없는 번호는 요청 목록 기준 (중복 요청한 번호는 요청한 만큼 셈)
+    found_cnt = sum(user_no in deleted_nos for user_no in user_vo.userNoList)
+    not_found_nos = [
+      user_no for user_no in user_vo.userNoList if user_no not in deleted_nos
+    ]
 
-    if not user_entities:
+    if not found_cnt:
       return success_response(
         message=UserMessage.get_delete_not_found_message(is_single=False)
       )
 
-    # DAO를 통해 다건 삭제 (updt_no 전달)
-    self.dao.delete_users(self.session, user_entities, updt_no)
-
     message = UserMessage.get_delete_message(
-      count=len(user_entities), not_found_nos=not_found_nos if not_found_nos else None
+      count=found_cnt, not_found_nos=not_found_nos if not_found_nos else None
     )
 
     return success_response(message=message)
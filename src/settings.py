@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -6,11 +8,55 @@ class Settings(BaseSettings):
   # .env 파일에 있는 변수명과 똑같이 적어주면 자동으로 매핑됩니다.
   DATABASE_URL: str = ''
   ENVIRONMENT: str = 'development'  # development 또는 production
+  DB_ASYNC_ENABLED: bool = False  # 비동기 DB 엔진(psycopg async) 사용 여부
+  DB_EARLY_RELEASE: bool = True  # 서비스 호출이 끝나면 바로 DB 연결 반납 (직렬화 전)
+  DB_MIGRATE_ON_STARTUP: bool = True  # False면 기동 시 스키마 확인만 (src.migrate)
+
+  # SQL 실행 통계/로그 설정
+  DB_QUERY_STATS_ENABLED: bool = True  # 요청 단위 SQL 통계 수집 (Server-Timing 헤더)
+  DB_SQL_LOG_SAMPLE_RATE: float = 0.0  # SQL 로그 샘플링 비율 (0~1, 0이면 미출력)
+  DB_SLOW_REQUEST_MS: int = 500  # 요청 DB 시간이 이 값을 넘으면 SQL 수/시간 출력
+
+  # 읽기 복제본 설정
+  DATABASE_REPLICA_URLS: str = ''  # 읽기 복제본 URL 목록 (콤마 구분, 비어있으면 미사용)
+  DB_REPLICA_STICKY_SECONDS: int = 5  # 쓰기 후 primary 고정 시간 (초)
+  DB_REPLICA_EJECT_SECONDS: int = 30  # 연결 오류 복제본 제외 시간 (초)
+
+  # prepared statement 설정 (psycopg)
+  DB_PREPARED_STATEMENTS: bool = True  # 사용자 단건 조회를 prepared statement로 실행
+  DB_TRANSACTION_POOLER: bool = False  # pgbouncer 트랜잭션 풀러 사용 시 True
+
+  # 연결 풀 크기 설정
+  DB_POOL_AUTO_SIZE: bool = False  # True면 아래 값으로 pool_size/max_overflow 계산
+  DB_CONNECTION_BUDGET: int = 100  # 앱 전체가 DB 서버 하나에 사용할 최대 연결 수
+  WEB_CONCURRENCY: int = 1  # 워커(프로세스) 수 (uvicorn --workers 기본값과 동일)
+  THREADPOOL_LIMIT: int = 40  # anyio 스레드풀 크기 (동기 코드 동시 실행 수)
+
+  # 대량 가입 비밀번호 해시화 프로세스 수 (0이면 CPU 코어 수)
+  PASSWORD_HASH_WORKERS: int = 0
+
+  # 캐시 저장소 (memory: 워커마다 따로, shm: 호스트의 워커가 공유, redis: 서버 공유)
+  CACHE_BACKEND: Literal['memory', 'shm', 'redis'] = 'memory'
+  CACHE_NAMESPACE: str = 'app'  # shm 파일/Redis 키 접두사 (같은 저장소를 쓰는 앱 구분)
+  CACHE_SHM_DIR: str = ''  # shm 파일 디렉터리 (비어 있으면 /dev/shm 또는 임시 디렉터리)
+  CACHE_SHM_SLOT_SIZE: int = 2048  # shm 항목 하나의 최대 크기 (바이트, 직렬화한 키+값)
+  CACHE_REDIS_URL: str = 'redis://localhost:6379/0'  # Redis 프로토콜 서버 주소
+  CACHE_REDIS_TIMEOUT_SECONDS: float = 0.5  # Redis 연결/응답 제한 시간
+
+  # 사용자 단건 조회 캐시 (userNo/이메일 -> 사용자)
+  USER_CACHE_ENABLED: bool = True  # False면 항상 DB 조회
+  USER_CACHE_SIZE: int = 10000  # 최대 사용자 수 (LRU)
+  USER_CACHE_TTL_SECONDS: int = 30  # 저장 후 유효 시간 (다른 워커의 쓰기 반영 지연)
+
+  # 인증 의존성의 사용자 상태(useYn/delYn/userRole) 확인
+  AUTH_STATUS_CACHE_TTL_SECONDS: int = 5  # 상태 캐시 유효 시간 (0이면 매 요청 DB 조회)
+  AUTH_TRUST_TOKEN: bool = False  # True면 DB 확인 없이 토큰의 userRole만 신뢰
 
   # JWT 관련 환경변수
   ACCESS_TOKEN_SECRET: str = ''
   REFRESH_TOKEN_SECRET: str = ''
   ACCESS_EXP: str = '15m'  # 기본값 15분
+  ACCESS_TOKEN_CACHE_SIZE: int = 10000  # 검증된 Access Token 캐시 크기 (0이면 끔)
   REFRESH_EXP: str = '7d'  # 기본값 7일
 
   # SMTP 이메일 발송 설정
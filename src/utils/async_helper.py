@@ -0,0 +1,81 @@
+"""동기/비동기 서비스 호출 유틸리티"""
+
+import inspect
+from typing import Any, Callable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from src.settings import settings
+from src.utils.cache_helper import CacheBackend
+
+
+async def call_service(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+  """서비스 메서드를 실행 모드에 맞게 호출합니다.
+
+  비동기 서비스(AsyncUserService 등)의 메서드는 그대로 await하고,
+  동기 서비스의 메서드는 스레드풀에서 실행하여 이벤트 루프를 막지 않습니다.
+
+  DB_EARLY_RELEASE=True면 호출이 끝나는 즉시 서비스 세션을 닫아 DB 연결을
+  풀에 반납합니다. (응답 직렬화/전송 동안 연결을 점유하지 않음)
+  세션은 닫힌 뒤에도 재사용할 수 있으며, 다음 쿼리에서 연결을 다시 대여합니다.
+
+  Args:
+    func: 호출할 서비스 메서드
+    *args: 위치 인자
+    **kwargs: 키워드 인자
+
+  Returns:
+    서비스 메서드의 반환값
+  """
+  session = getattr(getattr(func, '__self__', None), 'session', None)
+
+  if inspect.iscoroutinefunction(func):
+    try:
+      return await func(*args, **kwargs)
+    finally:
+      if settings.DB_EARLY_RELEASE and isinstance(session, AsyncSession):
+        await session.close()
+
+  def run_and_release() -> Any:
+    try:
+      return func(*args, **kwargs)
+    finally:
+      if settings.DB_EARLY_RELEASE and isinstance(session, Session):
+        session.close()
+
+  return await run_in_threadpool(run_and_release)
+
+
+async def call_streaming_service(
+  func: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+  """스트림(이터레이터)을 반환하는 서비스 메서드를 호출합니다.
+
+  call_service와 같지만 DB_EARLY_RELEASE와 관계없이 세션을 닫지 않습니다.
+  반환한 이터레이터가 세션의 서버 측 커서에서 행을 읽으므로, 세션은 요청이
+  끝날 때(응답 스트림 전송 후) get_session 의존성에서 닫힙니다.
+  """
+  if inspect.iscoroutinefunction(func):
+    return await func(*args, **kwargs)
+  return await run_in_threadpool(func, *args, **kwargs)
+
+
+async def call_cache(cache: CacheBackend, func: Callable[..., Any], *args: Any) -> Any:
+  """캐시를 사용하는 동기 함수를 이벤트 루프에서 호출합니다.
+
+  네트워크 I/O를 기다리는 백엔드(cache.blocking, 예: redis)면 스레드풀에서 실행하고,
+  프로세스/호스트 안의 백엔드(memory, shm)면 바로 실행합니다.
+
+  Args:
+    cache: func가 사용하는 캐시
+    func: 호출할 함수
+    *args: 위치 인자
+
+  Returns:
+    func의 반환값
+  """
+  if cache.blocking:
+    return await run_in_threadpool(func, *args)
+  return func(*args)
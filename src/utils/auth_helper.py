@@ -5,38 +5,70 @@ from typing import Annotated, Optional
 from fastapi import Cookie, Depends, HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from src.db import get_session
+from src.dao.user_dao import get_user_cache, get_user_status_cache
+from src.db import get_db_session
 from src.messages.auth_message import AuthMessage
-from src.services.auth_service import AuthService
-from src.utils.jwt_helper import verify_access_token
+from src.models import UserRole
+from src.services.async_auth_service import AsyncAuthService
+from src.services.auth_service import AuthService, get_reset_token_cache
+from src.settings import settings
+from src.utils.async_helper import call_cache, call_service
+from src.utils.cache_helper import CacheBackend
+from src.utils.jwt_helper import get_access_token_cache, verify_access_token
 
 # HTTP Bearer 토큰 스키마
 security = HTTPBearer(auto_error=False)
 
 
-def get_auth_service(session: Session = Depends(get_session)) -> AuthService:
-  """AuthService 의존성 주입"""
-  return AuthService(session)
+def get_auth_service(
+  session: Session | AsyncSession = Depends(get_db_session),
+  reset_token_cache: CacheBackend = Depends(get_reset_token_cache),
+  user_cache: CacheBackend = Depends(get_user_cache),
+  user_status_cache: CacheBackend = Depends(get_user_status_cache),
+) -> AuthService | AsyncAuthService:
+  """AuthService 의존성 주입 (DB_ASYNC_ENABLED=True면 AsyncAuthService)"""
+  if isinstance(session, AsyncSession):
+    return AsyncAuthService(session, reset_token_cache, user_cache, user_status_cache)
+  return AuthService(session, reset_token_cache, user_cache, user_status_cache)
 
 
-def _get_current_user_id_internal(
+def _auth_error(code: str, message: str) -> HTTPException:
+  """인증/권한 오류 응답 (다른 API와 같은 응답 형식, HTTP 200)"""
+  return HTTPException(
+    status_code=status.HTTP_200_OK,
+    detail={'data': None, 'error': True, 'code': code, 'message': message},
+  )
+
+
+async def _get_current_user_id_internal(
   request: Request,
   credentials: Annotated[
     Optional[HTTPAuthorizationCredentials], Security(security)
   ] = None,
   access_token: Annotated[Optional[str], Cookie()] = None,
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
+  token_cache: CacheBackend = Depends(get_access_token_cache),
+  status_cache: CacheBackend = Depends(get_user_status_cache),
   required: bool = True,
+  admin_only: bool = False,
 ) -> Optional[int]:
   """현재 로그인한 사용자 ID 추출 (내부 함수)
 
+  토큰의 사용자가 사용 중(useYn=Y, delYn=N)인지 사용자 상태 캐시
+  (AUTH_STATUS_CACHE_TTL_SECONDS)로 확인합니다. AUTH_TRUST_TOKEN=True면
+  DB를 확인하지 않고 토큰만 신뢰합니다.
+
   Args:
     request: FastAPI Request 객체
     credentials: Authorization 헤더에서 추출한 인증 정보
     access_token: 쿠키에서 추출한 액세스 토큰
-    service: AuthService 인스턴스
+    service: AuthService 또는 AsyncAuthService 인스턴스
+    token_cache: 검증된 Access Token 캐시
+    status_cache: 사용자 상태 캐시 (service가 사용하는 캐시)
     required: True면 토큰이 없을 때 에러 발생, False면 None 반환
+    admin_only: True면 관리자(ADMIN)가 아닐 때 에러 발생
 
   Returns:
     사용자 번호 (required=False이고 토큰이 없으면 None)
@@ -52,77 +84,110 @@ def _get_current_user_id_internal(
 
   if not token:
     if required:
-      raise HTTPException(
-        status_code=status.HTTP_200_OK,
-        detail={
-          'data': None,
-          'error': True,
-          'code': 'UNAUTHORIZED',
-          'message': AuthMessage.TOKEN_INVALID,
-        },
-      )
+      raise _auth_error('UNAUTHORIZED', AuthMessage.TOKEN_INVALID)
     return None
 
-  payload = verify_access_token(token)
+  # 토큰은 여기서 한 번만 검증/디코딩
+  payload = await call_cache(token_cache, verify_access_token, token, token_cache)
   if not payload:
     if required:
-      raise HTTPException(
-        status_code=status.HTTP_200_OK,
-        detail={
-          'data': None,
-          'error': True,
-          'code': 'UNAUTHORIZED',
-          'message': AuthMessage.TOKEN_INVALID,
-        },
-      )
+      raise _auth_error('UNAUTHORIZED', AuthMessage.TOKEN_INVALID)
     return None
 
   user_no = int(payload.get('sub', 0))
-  user = service.get_current_user(token)
-  if not user:
-    if required:
-      raise HTTPException(
-        status_code=status.HTTP_200_OK,
-        detail={
-          'data': None,
-          'error': True,
-          'code': 'UNAUTHORIZED',
-          'message': AuthMessage.USER_NOT_FOUND,
-        },
-      )
-    return None
+  if settings.AUTH_TRUST_TOKEN:
+    # 토큰 발급 시점의 권한을 그대로 사용 (삭제/비활성화는 토큰 만료 후 반영)
+    user_role = payload.get('userRole')
+  else:
+    # 상태 캐시에 있으면 세션을 거치지 않고 바로 확인 (redis 저장소는 스레드풀에서 조회)
+    user_status = await call_cache(
+      status_cache, service.get_cached_user_status, user_no
+    )
+    if user_status is None:
+      user_status = await call_service(service.get_user_status, user_no)
+    if user_status is None or not user_status.is_active:
+      if required:
+        raise _auth_error(
+          'UNAUTHORIZED',
+          AuthMessage.USER_DISABLED if user_status else AuthMessage.USER_NOT_FOUND,
+        )
+      return None
+    user_role = user_status.userRole
+
+  if admin_only and user_role != UserRole.ADMIN:
+    raise _auth_error('FORBIDDEN', AuthMessage.ADMIN_REQUIRED)
 
   return user_no
 
 
-def get_current_user_id(
+async def get_current_user_id(
   request: Request,
   credentials: Annotated[
     Optional[HTTPAuthorizationCredentials], Security(security)
   ] = None,
   access_token: Annotated[Optional[str], Cookie()] = None,
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
+  token_cache: CacheBackend = Depends(get_access_token_cache),
+  status_cache: CacheBackend = Depends(get_user_status_cache),
 ) -> int:
   """현재 로그인한 사용자 ID 추출 (필수 - 토큰이 없으면 에러 반환)"""
-  result = _get_current_user_id_internal(
-    request, credentials, access_token, service, required=True
+  result = await _get_current_user_id_internal(
+    request,
+    credentials,
+    access_token,
+    service,
+    token_cache,
+    status_cache,
+    required=True,
   )
   # required=True이므로 result는 항상 int
   return result  # type: ignore[return-value]
 
 
-def get_current_user_id_optional(
+async def get_current_user_id_optional(
   request: Request,
   credentials: Annotated[
     Optional[HTTPAuthorizationCredentials], Security(security)
   ] = None,
   access_token: Annotated[Optional[str], Cookie()] = None,
-  service: AuthService = Depends(get_auth_service),
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
+  token_cache: CacheBackend = Depends(get_access_token_cache),
+  status_cache: CacheBackend = Depends(get_user_status_cache),
 ) -> Optional[int]:
   """현재 로그인한 사용자 ID 추출 (선택적 - 토큰이 없으면 None 반환)"""
-  return _get_current_user_id_internal(
-    request, credentials, access_token, service, required=False
+  return await _get_current_user_id_internal(
+    request,
+    credentials,
+    access_token,
+    service,
+    token_cache,
+    status_cache,
+    required=False,
+  )
+
+
+async def get_current_admin_id(
+  request: Request,
+  credentials: Annotated[
+    Optional[HTTPAuthorizationCredentials], Security(security)
+  ] = None,
+  access_token: Annotated[Optional[str], Cookie()] = None,
+  service: AuthService | AsyncAuthService = Depends(get_auth_service),
+  token_cache: CacheBackend = Depends(get_access_token_cache),
+  status_cache: CacheBackend = Depends(get_user_status_cache),
+) -> int:
+  """현재 로그인한 관리자 ID 추출 (관리자가 아니면 에러 반환)"""
+  result = await _get_current_user_id_internal(
+    request,
+    credentials,
+    access_token,
+    service,
+    token_cache,
+    status_cache,
+    required=True,
+    admin_only=True,
   )
+  return result  # type: ignore[return-value]
 
 
 def get_refresh_token_from_cookie(
@@ -0,0 +1,272 @@
+"""캐시 백엔드 인터페이스와 프로세스 내 LRU + TTL 캐시
+
+자주 조회하지만 거의 바뀌지 않는 값(사용자 단건 조회, 검증된 토큰 등)을 DB 앞에서
+캐시합니다. 캐시는 register_cache로 만들고, 저장소는 CACHE_BACKEND로 고릅니다.
+
+- memory: 프로세스 내 LRU + TTL (LruTtlCache, 워커마다 따로 유지)
+- shm: 같은 호스트의 워커가 공유하는 공유 메모리 세그먼트 (shm_cache_helper)
+- redis: Redis 프로토콜 서버 (redis_cache_helper, 여러 호스트가 공유)
+
+모든 백엔드는 같은 규칙으로 동작합니다.
+
+- 저장 후 TTL이 지난 항목은 조회되지 않습니다.
+- 값을 바꾸는 쪽은 쓰기 후 delete로 무효화합니다.
+- 조회(DB)와 저장 사이에 무효화가 끼어들면 오래된 값이 저장되지 않도록,
+  조회 전 generation을 받아 set에 전달합니다.
+- 무효화에 실패하면(공유 저장소 연결 오류 등) 다시 성공할 때까지 값을 돌려주지 않습니다.
+
+공유 저장소(shm 파일, Redis 키)는 재시작 후에도 남으므로, 이름에 캐시 버전
+(get_cache_version)을 넣어 값 형식이나 비밀 키가 다른 이전 프로세스의 항목을 읽지
+않습니다.
+"""
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Sequence
+
+from src.settings import settings
+
+# 캐시 값 형식 버전 (저장하는 값의 구조를 바꾸면 올림)
+CACHE_FORMAT_VERSION = 2
+
+
+def get_cache_version(version: str = '') -> str:
+  """공유 저장소 이름에 넣는 캐시 버전 (값 형식 버전, 비밀 키, 캐시별 버전의 해시)
+
+  비밀 키는 해시로만 반영합니다. (발급한 토큰으로도 검증할 수 있는 값이므로 추가로
+  드러나는 정보는 없음)
+
+  Args:
+    version: 캐시별 값 구조 (예: 캐시하는 컬럼 이름과 타입)
+  """
+  digest = hashlib.blake2b(digest_size=6)
+  for part in (
+    str(CACHE_FORMAT_VERSION),
+    settings.ACCESS_TOKEN_SECRET,
+    settings.REFRESH_TOKEN_SECRET,
+    version,
+  ):
+    digest.update(part.encode() + b'\0')
+  return digest.hexdigest()
+
+
+class CacheBackend(ABC):
+  """캐시 백엔드 공통 인터페이스 (여러 스레드에서 동시에 사용)
+
+  통계(hits 등)는 백엔드와 관계없이 현재 워커에서 센 값입니다.
+  """
+
+  backend = ''  # 백엔드 이름 (memory, shm, redis)
+  blocking = False  # 네트워크 I/O를 기다리는지 (이벤트 루프에서는 call_cache로 호출)
+  shared = False  # 워커 간에 값과 무효화를 공유하는지 (다른 워커의 쓰기가 바로 반영)
+
+  def __init__(
+    self,
+    name: str,
+    max_size: int,
+    ttl_seconds: float,
+    enabled: bool,
+    version: str = '',
+  ):
+    self.name = name
+    self.version = version  # 캐시별 값 구조 (공유 저장소 이름에 반영)
+    self.max_size = max_size
+    self.ttl_seconds = ttl_seconds
+    self.enabled = enabled and max_size > 0 and ttl_seconds > 0
+    self.hits = 0  # 조회 성공 수
+    self.misses = 0  # 조회 실패 수 (없음 + 만료)
+    self.evictions = 0  # 크기 제한으로 제거한 수
+    self.expirations = 0  # TTL이 지나 제거한 수
+    self.invalidations = 0  # delete로 제거한 수
+    self._stats_lock = threading.Lock()
+
+  @property
+  @abstractmethod
+  def generation(self) -> int:
+    """delete/clear 호출마다 증가하는 번호"""
+
+  def get(self, key: Hashable) -> Optional[Any]:
+    """값 조회 (없거나 만료되었거나 캐시가 꺼져 있으면 None)"""
+    return self.get_many([key])[0]
+
+  @abstractmethod
+  def get_many(self, keys: Sequence[Hashable]) -> list[Optional[Any]]:
+    """여러 값을 한 번에 조회 (keys 순서대로, 없는 값은 None)"""
+
+  def set(
+    self,
+    key: Hashable,
+    value: Any,
+    generation: Optional[int] = None,
+    ttl_seconds: Optional[float] = None,
+  ) -> None:
+    """값 저장
+
+    Args:
+      key: 키
+      value: 값 (None은 저장하지 않음)
+      generation: 값을 조회하기 전의 self.generation
+        (그 사이 무효화가 있었다면 저장하지 않음)
+      ttl_seconds: 이 항목의 유효 시간 (캐시 TTL보다 길게 지정할 수 없음)
+    """
+    if ttl_seconds is None or ttl_seconds > self.ttl_seconds:
+      ttl_seconds = self.ttl_seconds
+    if not self.enabled or value is None or ttl_seconds <= 0:
+      return
+    self._set(key, value, generation, ttl_seconds)
+
+  @abstractmethod
+  def _set(
+    self, key: Hashable, value: Any, generation: Optional[int], ttl_seconds: float
+  ) -> None:
+    """값 저장 (set에서 인자를 확인한 뒤 호출)"""
+
+  @abstractmethod
+  def delete(self, *keys: Hashable) -> None:
+    """값 무효화 (쓰기 후 호출)"""
+
+  @abstractmethod
+  def clear(self) -> None:
+    """전체 무효화"""
+
+  @abstractmethod
+  def size(self) -> Optional[int]:
+    """현재 항목 수 (백엔드가 알 수 없으면 None)"""
+
+  def _count(self, **counts: int) -> None:
+    """누적 통계 증가 (예: self._count(hits=1))"""
+    with self._stats_lock:
+      for field, count in counts.items():
+        setattr(self, field, getattr(self, field) + count)
+
+  def snapshot(self) -> dict[str, Any]:
+    """설정과 누적 통계를 응답용 dict로 변환"""
+    size = self.size()
+    with self._stats_lock:
+      lookups = self.hits + self.misses
+      return {
+        'name': self.name,
+        'backend': self.backend,
+        'enabled': self.enabled,
+        'maxSize': self.max_size,
+        'ttlSeconds': self.ttl_seconds,
+        'size': size,
+        'hits': self.hits,
+        'misses': self.misses,
+        'hitRatio': round(self.hits / lookups, 4) if lookups else 0.0,
+        'evictions': self.evictions,
+        'expirations': self.expirations,
+        'invalidations': self.invalidations,
+      }
+
+
+class LruTtlCache(CacheBackend):
+  """프로세스 내 크기 제한 LRU + TTL 캐시
+
+  - 최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다. (LRU)
+  - 워커(프로세스)마다 따로 있으므로 다른 워커의 쓰기는 TTL이 지나야 반영됩니다.
+  """
+
+  backend = 'memory'
+
+  def __init__(
+    self,
+    name: str,
+    max_size: int,
+    ttl_seconds: float,
+    enabled: bool,
+    version: str = '',
+  ):
+    super().__init__(name, max_size, ttl_seconds, enabled, version)
+    self._generation = 0
+    self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    # 항목과 통계를 같은 잠금으로 보호 (통계는 잠금 안에서 직접 갱신)
+    self._lock = self._stats_lock
+
+  @property
+  def generation(self) -> int:
+    return self._generation
+
+  def get_many(self, keys: Sequence[Hashable]) -> list[Optional[Any]]:
+    if not self.enabled:
+      return [None] * len(keys)
+    values: list[Optional[Any]] = []
+    now = time.monotonic()
+    with self._lock:
+      for key in keys:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= now:
+          del self._entries[key]
+          self.expirations += 1
+          entry = None
+        if entry is None:
+          self.misses += 1
+          values.append(None)
+          continue
+        self._entries.move_to_end(key)
+        self.hits += 1
+        values.append(entry[1])
+    return values
+
+  def _set(
+    self, key: Hashable, value: Any, generation: Optional[int], ttl_seconds: float
+  ) -> None:
+    with self._lock:
+      if generation is not None and generation != self._generation:
+        return
+      self._entries[key] = (time.monotonic() + ttl_seconds, value)
+      self._entries.move_to_end(key)
+      while len(self._entries) > self.max_size:
+        self._entries.popitem(last=False)
+        self.evictions += 1
+
+  def delete(self, *keys: Hashable) -> None:
+    with self._lock:
+      self._generation += 1
+      for key in keys:
+        if self._entries.pop(key, None) is not None:
+          self.invalidations += 1
+
+  def clear(self) -> None:
+    with self._lock:
+      self._generation += 1
+      self.invalidations += len(self._entries)
+      self._entries.clear()
+
+  def size(self) -> Optional[int]:
+    return len(self._entries)
+
+
+def create_cache(
+  name: str, max_size: int, ttl_seconds: float, enabled: bool, version: str = ''
+) -> CacheBackend:
+  """CACHE_BACKEND 설정에 맞는 캐시 백엔드를 생성합니다."""
+  if settings.CACHE_BACKEND == 'shm':
+    from src.utils.shm_cache_helper import SharedMemoryCache
+
+    return SharedMemoryCache(name, max_size, ttl_seconds, enabled, version)
+  if settings.CACHE_BACKEND == 'redis':
+    from src.utils.redis_cache_helper import RedisCache
+
+    return RedisCache(name, max_size, ttl_seconds, enabled, version)
+  return LruTtlCache(name, max_size, ttl_seconds, enabled, version)
+
+
+# 캐시 이름 -> 캐시 (관리자 API 통계, 의존성 주입용)
+caches: dict[str, CacheBackend] = {}
+
+
+def register_cache(
+  name: str, max_size: int, ttl_seconds: float, enabled: bool, version: str = ''
+) -> CacheBackend:
+  """캐시를 생성하고 통계 조회 대상으로 등록합니다.
+
+  version에는 캐시에 저장하는 값의 구조를 넘깁니다. 구조가 바뀌면 공유 저장소에 남은
+  이전 값을 읽지 않습니다.
+  """
+  cache = create_cache(name, max_size, ttl_seconds, enabled, version)
+  caches[name] = cache
+  return cache
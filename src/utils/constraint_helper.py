@@ -0,0 +1,44 @@
+"""DB 제약조건 위반 오류 해석 유틸리티
+
+중복 여부를 미리 조회하면 조회와 INSERT/UPDATE 사이에 다른 요청이 끼어들 수 있어
+결국 UNIQUE 제약조건이 최종 방어선이 됩니다. 따라서 INSERT/UPDATE를 바로 실행하고
+UNIQUE 제약 위반(IntegrityError) 시 제약조건 이름으로 중복 필드를 찾습니다.
+"""
+
+import re
+from typing import Optional
+
+from psycopg import errors
+from sqlalchemy.exc import IntegrityError
+
+# 진단 정보가 없는 드라이버의 UNIQUE 위반 메시지
+# - Postgres(psycopg 외): duplicate key value violates unique constraint "이름"
+# - SQLite 이름 있는 인덱스: UNIQUE constraint failed: index '이름'
+# - SQLite 컬럼 제약조건: UNIQUE constraint failed: 테이블.컬럼[, 테이블.컬럼]
+UNIQUE_CONSTRAINT_MESSAGE = re.compile(r'unique constraint "(?P<name>[^"]+)"')
+SQLITE_UNIQUE_MESSAGE = re.compile(
+  r"UNIQUE constraint failed: (?:index '(?P<index>[^']+)'|(?P<columns>.+))"
+)
+
+
+def get_unique_violation(error: IntegrityError) -> Optional[str]:
+  """UNIQUE 제약 위반이면 위반한 제약조건(인덱스) 이름 반환 (그 외 None)
+
+  psycopg는 진단 정보의 제약조건 이름을, 그 외 드라이버(SQLite 등)는 오류 메시지를
+  사용합니다. SQLite의 컬럼 제약조건은 메시지에 이름이 없으므로 Postgres 기본 이름
+  규칙(테이블_컬럼_key)으로 만들어 반환합니다.
+  """
+  if isinstance(error.orig, errors.UniqueViolation):
+    return error.orig.diag.constraint_name
+
+  message = str(error.orig)
+  match = UNIQUE_CONSTRAINT_MESSAGE.search(message)
+  if match:
+    return match.group('name')
+  match = SQLITE_UNIQUE_MESSAGE.search(message)
+  if match is None:
+    return None
+  if match.group('index'):
+    return match.group('index')
+  columns = [name.strip().split('.') for name in match.group('columns').split(',')]
+  return '_'.join([columns[0][0], *(column for _, column in columns), 'key'])
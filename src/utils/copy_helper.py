@@ -0,0 +1,49 @@
+"""Postgres COPY 유틸리티 (psycopg)
+
+여러 행 INSERT는 행 수 x 컬럼 수만큼 바인드 파라미터가 생겨 SQL 파싱/전송 비용이
+커지므로, 대량 저장은 COPY ... FROM STDIN으로 행 데이터만 스트림으로 보냅니다.
+COPY는 SQLAlchemy를 거치지 않고 세션이 사용 중인 psycopg 연결에서 직접 실행하며,
+같은 트랜잭션에 포함됩니다.
+"""
+
+from typing import Any, Iterable, Sequence
+
+import psycopg
+from sqlalchemy import Connection
+from sqlalchemy.util import await_only
+
+
+async def _copy_rows_async(
+  driver_connection: psycopg.AsyncConnection,
+  copy_sql: str,
+  rows: Iterable[Sequence[Any]],
+) -> None:
+  async with driver_connection.cursor() as cursor:
+    async with cursor.copy(copy_sql) as copy:
+      for row in rows:
+        await copy.write_row(row)
+
+
+def copy_rows(
+  connection: Connection, copy_sql: str, rows: Iterable[Sequence[Any]]
+) -> None:
+  """COPY ... FROM STDIN으로 행 전송
+
+  비동기 엔진(AsyncSession.run_sync 내부)에서는 psycopg 비동기 연결의 COPY를
+  run_sync의 greenlet에서 기다립니다.
+
+  Args:
+    connection: 세션의 현재 연결 (session.connection())
+    copy_sql: COPY 문 (예: COPY 테이블 (컬럼, ...) FROM STDIN)
+    rows: 컬럼 순서대로 값을 담은 행 목록
+  """
+  driver_connection = connection.connection.driver_connection
+  if isinstance(driver_connection, psycopg.AsyncConnection):
+    await_only(_copy_rows_async(driver_connection, copy_sql, rows))
+    return
+
+  assert isinstance(driver_connection, psycopg.Connection), 'psycopg 연결만 지원'
+  with driver_connection.cursor() as cursor:
+    with cursor.copy(copy_sql) as copy:
+      for row in rows:
+        copy.write_row(row)
@@ -0,0 +1,33 @@
+"""키셋(커서) 페이지네이션 유틸리티
+
+커서는 마지막으로 조회한 행의 정렬 키를 JSON으로 담아 base64url로 인코딩한 문자열입니다.
+클라이언트는 내용을 해석하지 않고 nextCursor를 그대로 다음 요청의 cursor로 전달합니다.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Optional
+
+
+def encode_cursor(keys: dict[str, Any]) -> str:
+  """정렬 키를 불투명한 커서 문자열로 인코딩
+
+  Args:
+    keys: 마지막 행의 정렬 키 (예: {'userNo': 123})
+
+  Returns:
+    base64url 커서 문자열 (패딩 제거)
+  """
+  raw = json.dumps(keys, separators=(',', ':')).encode()
+  return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str) -> Optional[dict[str, Any]]:
+  """커서 문자열을 정렬 키로 디코딩 (형식이 잘못되면 None)"""
+  try:
+    raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+    keys = json.loads(raw)
+  except (binascii.Error, ValueError):
+    return None
+  return keys if isinstance(keys, dict) else None
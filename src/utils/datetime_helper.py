@@ -0,0 +1,38 @@
+"""일시 변환 유틸리티
+
+DB에는 TIMESTAMP WITH TIME ZONE으로 저장하고, API에서는 기존과 같은
+ISO 8601 UTC 문자열(YYYY-MM-DDTHH:MM:SSZ)로 주고받습니다.
+"""
+
+from datetime import datetime, timezone
+from typing import Annotated
+
+from pydantic import AfterValidator, PlainSerializer
+
+# API 응답 일시 형식
+ISO_Z_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def utc_now() -> datetime:
+  """현재 UTC 일시"""
+  return datetime.now(timezone.utc)
+
+
+def to_utc(value: datetime) -> datetime:
+  """UTC 일시로 변환 (시간대가 없는 값은 UTC로 간주)"""
+  if value.tzinfo is None:
+    return value.replace(tzinfo=timezone.utc)
+  return value.astimezone(timezone.utc)
+
+
+def to_iso_z(value: datetime) -> str:
+  """ISO 8601 UTC 문자열로 변환 (예: 2024-01-01T00:00:00Z)"""
+  return to_utc(value).strftime(ISO_Z_FORMAT)
+
+
+# VO/스키마 일시 타입 (입력은 UTC로 정규화, JSON 응답은 ISO 8601 UTC 문자열)
+UtcDateTime = Annotated[
+  datetime,
+  AfterValidator(to_utc),
+  PlainSerializer(to_iso_z, return_type=str, when_used='json'),
+]
@@ -1,13 +1,29 @@
-"""이메일 발송 유틸리티"""
+"""이메일 정규화 및 발송 유틸리티
+
+이메일은 대소문자를 구분하지 않습니다. 요청 경계(VO/스키마)에서 소문자로 정규화하고,
+DB에서는 lower(eml_addr) 유니크 인덱스로 비교합니다. (이전에 저장된 대소문자가
+섞인 값도 lower(eml_addr)로 찾을 수 있음)
+"""
 
 import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import Annotated, Optional
+
+from pydantic import AfterValidator, EmailStr
 
 from src.settings import settings
 
 
+def normalize_email(value: str) -> str:
+  """이메일 정규화 (앞뒤 공백 제거, 소문자 변환)"""
+  return value.strip().lower()
+
+
+# VO/스키마 이메일 타입 (형식 검증 후 정규화)
+NormalizedEmail = Annotated[EmailStr, AfterValidator(normalize_email)]
+
+
 def send_reset_password_email(
   to_email: str, reset_token: str, frontend_url: Optional[str] = None
 ) -> bool:
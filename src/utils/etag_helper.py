@@ -0,0 +1,67 @@
+"""ETag 조건부 조회 유틸리티
+
+조회 응답에 ETag를 붙이고, 클라이언트가 If-None-Match로 보낸 값이 현재 ETag와 같으면
+본문 없이 304 Not Modified를 응답합니다. (본문 조회/직렬화 생략)
+
+- 강한 ETag: 같은 값이면 응답 본문이 바이트 단위로 같음 (사용자 단건 조회)
+- 약한 ETag(W/): 같은 값이면 의미상 같은 응답 (사용자 목록 조회)
+
+오류 응답은 기존 규칙대로 200 + ApiResponse로 응답하며 ETag를 붙이지 않습니다.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import Response, status
+
+# ETag 응답에 함께 붙이는 헤더 (캐시에 저장하되 사용할 때마다 다시 확인)
+ETAG_CACHE_CONTROL = 'no-cache'
+
+
+def make_etag(*parts: Any, weak: bool = False) -> str:
+  """응답을 결정하는 값들로 ETag 생성
+
+  Args:
+    *parts: 응답 본문을 결정하는 값 (예: 사용자 번호, 수정 일시, 응답 필드)
+    weak: 약한 ETag(W/) 여부
+
+  Returns:
+    따옴표로 감싼 ETag (예: "3f2a...", W/"3f2a...")
+  """
+  # 같은 시각이면 tzinfo 종류(timezone.utc, ZoneInfo)와 관계없이 같은 값
+  values = tuple(
+    part.isoformat() if isinstance(part, datetime) else part for part in parts
+  )
+  digest = hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+  return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+  """If-None-Match 헤더가 ETag와 일치하는지 확인
+
+  If-None-Match는 약한 비교(W/ 무시)를 사용하며, 콤마로 여러 값을 보내거나
+  *(모든 ETag)를 보낼 수 있습니다.
+  """
+  if not if_none_match:
+    return False
+  if if_none_match.strip() == '*':
+    return True
+  opaque = etag.removeprefix('W/')
+  return any(
+    candidate.strip().removeprefix('W/') == opaque
+    for candidate in if_none_match.split(',')
+  )
+
+
+def set_etag(response: Response, etag: str) -> None:
+  """응답에 ETag와 Cache-Control 헤더 설정"""
+  response.headers['ETag'] = etag
+  response.headers['Cache-Control'] = ETAG_CACHE_CONTROL
+
+
+def not_modified_response(etag: str) -> Response:
+  """본문 없는 304 Not Modified 응답"""
+  response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+  set_etag(response, etag)
+  return response
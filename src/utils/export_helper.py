@@ -0,0 +1,87 @@
+"""내보내기(NDJSON/CSV) 직렬화 유틸리티
+
+DB에서 나누어 읽은 Row 묶음을 VO로 변환하지 않고 바로 텍스트로 바꿔 스트림으로 보냅니다.
+한 번에 한 묶음만 메모리에 있으므로 전체 행 수와 관계없이 메모리 사용량이 일정합니다.
+
+- NDJSON: 한 줄에 JSON 객체 하나
+- CSV: 첫 줄은 헤더(필드명)
+- 일시는 API 응답과 같은 ISO 8601 UTC 문자열, Enum은 값으로 변환
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Sequence
+
+from sqlalchemy import Row
+
+from src.utils.datetime_helper import to_iso_z
+
+# 지원하는 파일 형식 -> 응답 Content-Type
+EXPORT_MEDIA_TYPES = {
+  'ndjson': 'application/x-ndjson',
+  'csv': 'text/csv; charset=utf-8',
+}
+
+
+def to_export_value(value: Any) -> Any:
+  """Row 값을 내보내기 값으로 변환 (일시 -> ISO 8601 UTC 문자열, Enum -> 값)"""
+  if isinstance(value, datetime):
+    return to_iso_z(value)
+  if isinstance(value, Enum):
+    return value.value
+  return value
+
+
+def format_export_rows(
+  rows: Sequence[Row], fields: Sequence[str], export_format: str
+) -> str:
+  """Row 묶음을 NDJSON/CSV 텍스트로 변환 (CSV 헤더 제외)"""
+  if export_format == 'csv':
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerows(
+      [to_export_value(getattr(row, field)) for field in fields] for row in rows
+    )
+    return buffer.getvalue()
+
+  return ''.join(
+    json.dumps(
+      {field: to_export_value(getattr(row, field)) for field in fields},
+      ensure_ascii=False,
+    )
+    + '\n'
+    for row in rows
+  )
+
+
+def format_export_header(fields: Sequence[str], export_format: str) -> str:
+  """CSV 헤더 줄 (NDJSON은 빈 문자열)"""
+  if export_format != 'csv':
+    return ''
+  buffer = io.StringIO()
+  csv.writer(buffer, lineterminator='\n').writerow(fields)
+  return buffer.getvalue()
+
+
+def iter_export_chunks(
+  partitions: Iterable[Sequence[Row]], fields: Sequence[str], export_format: str
+) -> Iterator[str]:
+  """Row 묶음 이터레이터를 텍스트 조각 스트림으로 변환 (동기)"""
+  header = format_export_header(fields, export_format)
+  if header:
+    yield header
+  for rows in partitions:
+    yield format_export_rows(rows, fields, export_format)
+
+
+async def aiter_export_chunks(
+  partitions: AsyncIterable[Sequence[Row]], fields: Sequence[str], export_format: str
+) -> AsyncIterator[str]:
+  """Row 묶음 비동기 이터레이터를 텍스트 조각 스트림으로 변환 (비동기)"""
+  header = format_export_header(fields, export_format)
+  if header:
+    yield header
+  async for rows in partitions:
+    yield format_export_rows(rows, fields, export_format)
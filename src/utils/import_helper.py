@@ -0,0 +1,105 @@
+"""대량 가입 파일(NDJSON/CSV) 파싱 유틸리티
+
+요청 본문을 한 번에 읽지 않고 스트림으로 받아 줄 단위로 파싱하고,
+batch_size개씩 묶어서 반환합니다.
+
+- NDJSON (application/x-ndjson): 한 줄에 JSON 객체 하나
+- CSV (text/csv): 첫 줄은 헤더(필드명), 한 행은 한 줄 (값 안의 줄바꿈은 지원하지 않음)
+
+빈 줄은 건너뛰며, 행 번호(rowNo)는 헤더와 빈 줄을 제외하고 1부터 셉니다.
+"""
+
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, NamedTuple, Optional
+
+# 한 번에 검증/해시화/저장할 행 수
+IMPORT_BATCH_SIZE = 1000
+
+# 지원하는 파일 형식
+IMPORT_FORMAT_NDJSON = 'ndjson'
+IMPORT_FORMAT_CSV = 'csv'
+
+# Content-Type -> 파일 형식
+IMPORT_CONTENT_TYPES = {
+  'application/x-ndjson': IMPORT_FORMAT_NDJSON,
+  'application/jsonl': IMPORT_FORMAT_NDJSON,
+  'text/csv': IMPORT_FORMAT_CSV,
+}
+
+
+class ImportRow(NamedTuple):
+  """파일의 한 행"""
+
+  rowNo: int  # 행 번호 (1부터)
+  values: Optional[dict[str, Any]]  # 필드명 -> 값 (파싱에 실패하면 None)
+
+
+def get_import_format(content_type: Optional[str]) -> Optional[str]:
+  """Content-Type으로 파일 형식 판별 (지원하지 않으면 None)"""
+  media_type = (content_type or '').split(';', 1)[0].strip().lower()
+  return IMPORT_CONTENT_TYPES.get(media_type)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+  """바이트 스트림을 줄 단위 문자열로 변환 (UTF-8, BOM 제거)"""
+  decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+  pending = ''
+  async for chunk in chunks:
+    pending += decoder.decode(chunk)
+    *lines, pending = pending.split('\n')
+    for line in lines:
+      yield line.rstrip('\r')
+  pending += decoder.decode(b'', final=True)
+  if pending:
+    yield pending.rstrip('\r')
+
+
+def parse_ndjson_line(line: str) -> Optional[dict[str, Any]]:
+  """NDJSON 한 줄을 dict로 변환 (JSON 객체가 아니면 None)"""
+  try:
+    values = json.loads(line)
+  except ValueError:
+    return None
+  return values if isinstance(values, dict) else None
+
+
+async def iter_import_batches(
+  chunks: AsyncIterator[bytes], import_format: str, batch_size: int
+) -> AsyncIterator[list[ImportRow]]:
+  """요청 본문 스트림을 batch_size행씩 파싱
+
+  Args:
+    chunks: 요청 본문 스트림 (Request.stream())
+    import_format: 파일 형식 (IMPORT_FORMAT_NDJSON, IMPORT_FORMAT_CSV)
+    batch_size: 한 번에 반환할 최대 행 수
+
+  Yields:
+    ImportRow 목록 (마지막 배치는 batch_size보다 적을 수 있음)
+  """
+  header: Optional[list[str]] = None
+  batch: list[ImportRow] = []
+  row_no = 0
+  async for line in iter_lines(chunks):
+    if not line.strip():
+      continue
+
+    values: Optional[dict[str, Any]]
+    if import_format == IMPORT_FORMAT_CSV:
+      cells = next(csv.reader([line]))
+      if header is None:
+        header = [cell.strip() for cell in cells]
+        continue
+      values = dict(zip(header, cells)) if len(cells) == len(header) else None
+    else:
+      values = parse_ndjson_line(line)
+
+    row_no += 1
+    batch.append(ImportRow(row_no, values))
+    if len(batch) >= batch_size:
+      yield batch
+      batch = []
+
+  if batch:
+    yield batch
@@ -1,11 +1,14 @@
 """JWT 토큰 생성 및 검증 유틸리티"""
 
+import hmac
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from jose import JWTError, jwt  # type: ignore[import-untyped]
 
 from src.settings import settings
+from src.utils.cache_helper import CacheBackend, register_cache
 
 
 def parse_expiration(exp_str: str) -> timedelta:
@@ -38,6 +41,23 @@ def parse_expiration(exp_str: str) -> timedelta:
     raise ValueError(f'지원하지 않는 만료 시간 형식: {exp_str}')
 
 
+# 검증된 Access Token 캐시 (HMAC(비밀 키, 토큰) -> payload, 항목은 토큰의 exp에 만료)
+# 같은 토큰을 ACCESS_EXP 동안 재사용하므로 서명/클레임 검증을 한 번만 수행합니다.
+# 비밀 키가 바뀌면 키도 바뀌므로 공유 저장소에 남은 이전 키의 검증 결과는 쓰지 않으며,
+# 토큰 원문 대신 해시를 키로 쓰므로 조회 시간이 토큰 내용에 따라 달라지지 않습니다.
+access_token_cache = register_cache(
+  'access_token',
+  max_size=settings.ACCESS_TOKEN_CACHE_SIZE,
+  ttl_seconds=parse_expiration(settings.ACCESS_EXP).total_seconds(),
+  enabled=True,
+)
+
+
+def get_access_token_cache() -> CacheBackend:
+  """검증된 Access Token 캐시 의존성 주입"""
+  return access_token_cache
+
+
 def create_access_token(data: dict) -> str:
   """Access Token을 생성합니다.
 
@@ -70,23 +90,38 @@ def create_refresh_token(data: dict) -> str:
   return encoded_jwt
 
 
-def verify_access_token(token: str) -> Optional[dict]:
+def verify_access_token(
+  token: str, cache: Optional[CacheBackend] = None
+) -> Optional[dict]:
   """Access Token을 검증하고 디코딩합니다.
 
+  검증에 성공한 토큰은 검증된 토큰 캐시에 저장하고, 같은 토큰은 만료(exp)
+  전까지 캐시의 payload를 사용합니다.
+
   Args:
     token: 검증할 JWT 토큰
+    cache: 검증된 토큰 캐시 (없으면 access_token_cache)
 
   Returns:
     디코딩된 토큰 데이터 또는 None (검증 실패 시)
   """
+  cache = cache or get_access_token_cache()
+  key = hmac.digest(settings.ACCESS_TOKEN_SECRET.encode(), token.encode(), 'sha256')
+  cached = cache.get(key)
+  if cached is not None:
+    return dict(cached)
+
+  generation = cache.generation
   try:
     payload = jwt.decode(token, settings.ACCESS_TOKEN_SECRET, algorithms=['HS256'])
     if payload.get('type') != 'access':
       return None
-    return payload
   except JWTError:
     return None
 
+  cache.set(key, payload, generation, ttl_seconds=payload.get('exp', 0) - time.time())
+  return dict(payload)
+
 
 def verify_refresh_token(token: str) -> Optional[dict]:
   """Refresh Token을 검증하고 디코딩합니다.
@@ -1,7 +1,15 @@
 """비밀번호 해시화 및 검증 유틸리티"""
 
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
 from passlib.context import CryptContext  # type: ignore[import-untyped]
 
+from src.settings import settings
+
 # CryptContext 초기화 (sha256_crypt를 기본 알고리즘으로 사용)
 # sha256_crypt는 기본적으로 80000 rounds를 사용하며, 비밀번호 길이 제한이 없습니다.
 pwd_context = CryptContext(
@@ -11,6 +19,17 @@ pwd_context = CryptContext(
 )
 
 
+class HashPool:
+  """대량 해시화용 프로세스 풀 (처음 사용할 때 생성, None이면 미생성)"""
+
+  executor: Optional[ProcessPoolExecutor] = None
+  workers = 0
+  lock = threading.Lock()
+
+
+hash_pool = HashPool()
+
+
 def hash_password(plain_password: str) -> str:
   """평문 비밀번호를 해시화합니다.
 
@@ -34,3 +53,46 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     비밀번호가 일치하면 True, 그렇지 않으면 False
   """
   return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_hash_executor() -> ProcessPoolExecutor:
+  """해시화 프로세스 풀 반환 (없으면 PASSWORD_HASH_WORKERS개로 생성)
+
+  워커는 spawn 방식으로 띄워 서버 프로세스의 스레드/DB 연결을 물려받지 않습니다.
+  """
+  with hash_pool.lock:
+    if hash_pool.executor is None:
+      hash_pool.workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+      hash_pool.executor = ProcessPoolExecutor(
+        max_workers=hash_pool.workers,
+        mp_context=multiprocessing.get_context('spawn'),
+      )
+    return hash_pool.executor
+
+
+def hash_passwords(plain_passwords: list[str]) -> list[str]:
+  """여러 비밀번호를 프로세스 풀에서 나누어 해시화합니다. (대량 가입용)
+
+  sha256_crypt는 CPU만 사용하고 GIL을 놓지 않으므로, 스레드가 아닌 별도 프로세스에서
+  실행하여 코어 수만큼 병렬로 처리하고 서버 프로세스의 다른 요청을 막지 않습니다.
+
+  Args:
+    plain_passwords: 해시화할 평문 비밀번호 목록
+
+  Returns:
+    입력 순서대로 해시화된 비밀번호 목록
+  """
+  if not plain_passwords:
+    return []
+  executor = get_hash_executor()
+  # 워커당 4개 정도로 나누어 프로세스 간 전송 횟수를 줄이면서 부하를 고르게 분배
+  chunksize = max(len(plain_passwords) // (hash_pool.workers * 4), 1)
+  return list(executor.map(hash_password, plain_passwords, chunksize=chunksize))
+
+
+def shutdown_hash_executor() -> None:
+  """해시화 프로세스 풀 종료 (애플리케이션 종료 시)"""
+  with hash_pool.lock:
+    if hash_pool.executor is not None:
+      hash_pool.executor.shutdown(cancel_futures=True)
+      hash_pool.executor = None
@@ -0,0 +1,208 @@
+"""DB 연결 풀 계측 및 자동 크기 산정 유틸리티
+
+엔진별로 다음 값을 수집하여 관리자 API(GET /admin/pool)로 노출합니다.
+- 현재 대여 중인 연결 수 / 사용 중인 overflow 연결 수
+- 연결 대여(checkout) 대기 시간 분포, 대여부터 반납(checkin)까지의 점유 시간 분포
+- 무효화(invalidate)된 연결 수, pool_pre_ping 실패로 재연결한 횟수
+
+DB_POOL_AUTO_SIZE=True이면 워커 수, 스레드풀 크기, DB 연결 예산으로
+pool_size/max_overflow를 계산합니다.
+"""
+
+import bisect
+import threading
+import time
+from typing import Any, Optional, cast
+
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 시간 분포 구간 경계 (밀리초, 마지막 구간은 5000ms 초과)
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# 연결 대여 시각을 담는 ConnectionRecord.info 키
+CHECKOUT_TIME_KEY = 'pool_checkout_time'
+
+
+class LatencyHistogram:
+  """시간(밀리초) 분포 (잠금은 PoolTelemetry에서 처리)"""
+
+  def __init__(self):
+    self.count = 0
+    self.total_ms = 0.0
+    self.max_ms = 0.0
+    self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+  def record(self, elapsed_ms: float) -> None:
+    self.count += 1
+    self.total_ms += elapsed_ms
+    self.max_ms = max(self.max_ms, elapsed_ms)
+    self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+  @property
+  def avg_ms(self) -> float:
+    return round(self.total_ms / max(self.count, 1), 3)
+
+  def to_dict(self) -> dict[str, int]:
+    """구간 상한 -> 건수"""
+    labels = [f'{bound}ms' for bound in LATENCY_BUCKETS_MS] + ['inf']
+    return dict(zip(labels, self.buckets))
+
+
+class PoolTelemetry:
+  """엔진 하나의 연결 풀 통계 (여러 스레드에서 동시에 갱신)"""
+
+  def __init__(self, name: str, engine: Engine, max_overflow: int):
+    self.name = name
+    self.engine = engine
+    self.max_overflow = max_overflow
+    self.connects = 0  # 새로 연 DB 연결 수
+    self.invalidations = 0  # 무효화된 연결 수
+    self.pre_ping_reconnects = 0  # pool_pre_ping 실패로 재연결한 횟수
+    self.wait = LatencyHistogram()  # 연결 대여 대기 시간
+    self.hold = LatencyHistogram()  # 연결 점유 시간 (대여 ~ 반납)
+    self._lock = threading.Lock()
+
+  def record_wait(self, elapsed_ms: float) -> None:
+    """연결 대여 대기 시간을 분포에 반영"""
+    with self._lock:
+      self.wait.record(elapsed_ms)
+
+  def record_hold(self, elapsed_ms: float) -> None:
+    """연결 점유 시간을 분포에 반영"""
+    with self._lock:
+      self.hold.record(elapsed_ms)
+
+  def increment(self, field: str) -> None:
+    """카운터 증가 (connects, invalidations, pre_ping_reconnects)"""
+    with self._lock:
+      setattr(self, field, getattr(self, field) + 1)
+
+  def reset_latency(self) -> None:
+    """대기/점유 시간 분포 초기화 (벤치마크 워밍업 제외용)"""
+    with self._lock:
+      self.wait = LatencyHistogram()
+      self.hold = LatencyHistogram()
+
+  def snapshot(self) -> dict[str, Any]:
+    """현재 풀 상태와 누적 통계를 응답용 dict로 변환"""
+    pool = cast(QueuePool, self.engine.pool)
+    with self._lock:
+      return {
+        'name': self.name,
+        'poolSize': pool.size(),
+        'maxOverflow': self.max_overflow,
+        'checkedOut': pool.checkedout(),
+        'checkedIn': pool.checkedin(),
+        # overflow()는 풀이 다 차기 전에는 음수이므로 0으로 보정
+        'overflowInUse': max(pool.overflow(), 0),
+        'checkouts': self.wait.count,
+        'connects': self.connects,
+        'invalidations': self.invalidations,
+        'prePingReconnects': self.pre_ping_reconnects,
+        'checkoutWaitAvgMs': self.wait.avg_ms,
+        'checkoutWaitMaxMs': round(self.wait.max_ms, 3),
+        'checkoutWaitHistogram': self.wait.to_dict(),
+        'holdTimeAvgMs': self.hold.avg_ms,
+        'holdTimeMaxMs': round(self.hold.max_ms, 3),
+        'holdTimeHistogram': self.hold.to_dict(),
+      }
+
+
+# 풀 이름(pool_logging_name) -> 통계
+pool_telemetry: dict[str, PoolTelemetry] = {}
+
+
+class _TimedPoolMixin:
+  """connect() 소요 시간(대기 + pre_ping 포함)을 측정하는 풀 믹스인"""
+
+  logging_name: Optional[str]
+
+  def connect(self):
+    started = time.perf_counter()
+    try:
+      return super().connect()  # type: ignore[misc]
+    finally:
+      telemetry = pool_telemetry.get(self.logging_name or '')
+      if telemetry is not None:
+        telemetry.record_wait((time.perf_counter() - started) * 1000)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+  """대기 시간을 측정하는 QueuePool (동기 엔진용)"""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+  """대기 시간을 측정하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+def instrument_pool(engine: Engine, max_overflow: int) -> PoolTelemetry:
+  """엔진의 연결 풀 이벤트를 등록하고 통계 객체를 반환합니다.
+
+  엔진은 pool_logging_name과 Timed*QueuePool을 지정하여 생성해야
+  대기 시간이 집계됩니다. (비동기 엔진은 sync_engine 전달)
+
+  Args:
+    engine: 대상 엔진
+    max_overflow: 엔진 생성 시 지정한 max_overflow
+
+  Returns:
+    등록된 PoolTelemetry
+  """
+  name = engine.pool.logging_name or engine.url.render_as_string()
+  telemetry = PoolTelemetry(name, engine, max_overflow)
+  pool_telemetry[name] = telemetry
+
+  @event.listens_for(engine, 'connect')
+  def _on_connect(dbapi_connection, connection_record):
+    telemetry.increment('connects')
+
+  @event.listens_for(engine, 'checkout')
+  def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info[CHECKOUT_TIME_KEY] = time.perf_counter()
+
+  @event.listens_for(engine, 'checkin')
+  def _on_checkin(dbapi_connection, connection_record):
+    started = connection_record.info.pop(CHECKOUT_TIME_KEY, None)
+    if started is not None:
+      telemetry.record_hold((time.perf_counter() - started) * 1000)
+
+  @event.listens_for(engine, 'invalidate')
+  def _on_invalidate(dbapi_connection, connection_record, exception):
+    telemetry.increment('invalidations')
+
+  @event.listens_for(engine, 'handle_error')
+  def _on_error(context):
+    # pool_pre_ping 실패 시 풀이 연결을 버리고 새로 연결함
+    if context.is_pre_ping and context.is_disconnect:
+      telemetry.increment('pre_ping_reconnects')
+
+  return telemetry
+
+
+def compute_pool_size(
+  connection_budget: int,
+  worker_count: int,
+  threadpool_limit: int,
+  async_enabled: bool,
+) -> tuple[int, int]:
+  """워커당 연결 풀 크기(pool_size, max_overflow)를 계산합니다.
+
+  - 워커 전체가 DB 연결 예산(connection_budget)을 넘지 않도록 워커 수로 나눕니다.
+  - 동기 모드에서는 동시에 DB를 사용하는 스레드가 스레드풀 크기를 넘을 수 없으므로
+    스레드풀 크기 이상은 할당하지 않습니다.
+  - 절반은 상시 유지(pool_size), 나머지는 부하 시에만 여는 overflow로 둡니다.
+
+  Args:
+    connection_budget: 이 애플리케이션이 DB 서버 하나에 사용할 수 있는 총 연결 수
+    worker_count: 프로세스(워커) 수
+    threadpool_limit: anyio 스레드풀 크기
+    async_enabled: 비동기 DB 엔진 사용 여부
+
+  Returns:
+    (pool_size, max_overflow)
+  """
+  per_worker = max(connection_budget // max(worker_count, 1), 1)
+  total = per_worker if async_enabled else min(per_worker, max(threadpool_limit, 1))
+  pool_size = max(total // 2, 1)
+  return pool_size, total - pool_size
@@ -0,0 +1,70 @@
+"""서버 측 prepared statement 유틸리티 (psycopg 3)
+
+자주 실행하는 조회(get_user_by_no/email/username)만 psycopg의 prepare_threshold로
+서버 측 prepared statement를 사용하여 매 요청의 SQL 파싱/실행 계획 비용을 줄입니다.
+
+- 연결의 prepare_threshold는 기본적으로 None(비활성화)으로 둡니다.
+- PREPARED_LOOKUP 실행 옵션이 있는 SQL 문만 threshold=0으로 실행하여
+  연결별 첫 실행부터 prepared statement를 만들고 이후 재사용합니다.
+- pgbouncer 등 트랜잭션 풀러 뒤에서는 연결이 바뀌어 prepared statement가 깨지므로
+  DB_TRANSACTION_POOLER=True로 비활성화합니다. 설정하지 않았더라도 관련 오류가
+  발생하면 즉시 비활성화하여 이후 요청은 일반 실행으로 처리합니다.
+"""
+
+from psycopg import errors
+from sqlalchemy import Engine, event
+
+# prepared statement를 사용할 SQL 문의 실행 옵션 키
+PREPARE_OPTION = 'psycopg_prepare'
+
+# DAO에서 사용: select(...).execution_options(**PREPARED_LOOKUP)
+PREPARED_LOOKUP = {PREPARE_OPTION: True}
+
+# 트랜잭션 풀러 환경을 나타내는 오류 (다른 서버 연결에서 실행된 경우)
+POOLER_ERRORS = (errors.InvalidSqlStatementName, errors.DuplicatePreparedStatement)
+
+
+class PrepareState:
+  """prepared statement 사용 여부 (오류 발생 시 프로세스 전체에서 비활성화)"""
+
+  enabled: bool = True
+
+
+prepare_state = PrepareState()
+
+
+def instrument_prepare(engine: Engine, enabled: bool) -> None:
+  """엔진에 prepared statement 제어 이벤트를 등록합니다. (psycopg 드라이버만)
+
+  Args:
+    engine: 대상 엔진 (비동기 엔진은 sync_engine 전달)
+    enabled: PREPARED_LOOKUP 조회에 prepared statement 사용 여부
+  """
+  if engine.dialect.driver not in ('psycopg', 'psycopg_async'):
+    return
+
+  @event.listens_for(engine, 'connect')
+  def _on_connect(dbapi_connection, connection_record):
+    # psycopg 기본값(5회 실행 후 자동 prepare)을 끄고 지정한 조회만 prepare
+    connection_record.driver_connection.prepare_threshold = None
+
+  if not enabled:
+    return
+
+  @event.listens_for(engine, 'before_cursor_execute')
+  def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    is_lookup = (
+      prepare_state.enabled
+      and context is not None
+      and context.execution_options.get(PREPARE_OPTION, False)
+    )
+    conn.connection.driver_connection.prepare_threshold = 0 if is_lookup else None
+
+  @event.listens_for(engine, 'handle_error')
+  def _on_error(context):
+    if isinstance(context.original_exception, POOLER_ERRORS) and prepare_state.enabled:
+      prepare_state.enabled = False
+      print(
+        '[DB] prepared statement 오류로 비활성화합니다. '
+        '트랜잭션 풀러를 사용한다면 DB_TRANSACTION_POOLER=true로 설정하세요.'
+      )
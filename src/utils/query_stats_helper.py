@@ -0,0 +1,83 @@
+"""요청 단위 SQL 실행 통계 유틸리티
+
+SQLAlchemy before/after_cursor_execute 이벤트로 요청마다 다음 값을 수집합니다.
+- 실행한 SQL 문 수
+- 총 DB 시간
+- 가장 느린 SQL 문과 실행 시간
+
+수집한 값은 query_stats 컨텍스트 변수로 노출되며, 미들웨어에서 읽어 사용합니다.
+전체 SQL 로그는 DB_SQL_LOG_SAMPLE_RATE(0~1)를 설정한 경우에만 샘플링하여 출력합니다.
+"""
+
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import Engine, event
+
+from src.settings import settings
+
+
+@dataclass
+class QueryStats:
+  """요청 단위 SQL 실행 통계"""
+
+  count: int = 0  # 실행한 SQL 문 수
+  total_ms: float = 0.0  # 총 DB 시간 (밀리초)
+  slowest_ms: float = 0.0  # 가장 느린 SQL 문 실행 시간 (밀리초)
+  slowest_statement: Optional[str] = None  # 가장 느린 SQL 문
+
+  def record(self, statement: str, elapsed_ms: float) -> None:
+    """SQL 문 실행 결과를 통계에 반영"""
+    self.count += 1
+    self.total_ms += elapsed_ms
+    if elapsed_ms > self.slowest_ms:
+      self.slowest_ms = elapsed_ms
+      self.slowest_statement = statement
+
+  def to_server_timing(self) -> str:
+    """Server-Timing 헤더 값으로 변환"""
+    return f'db;dur={self.total_ms:.2f};desc="{self.count} queries"'
+
+
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar('query_stats', default=None)
+
+
+def start_query_stats() -> QueryStats:
+  """요청 시작 시 통계 객체를 생성하여 컨텍스트에 등록합니다.
+
+  Returns:
+    현재 요청의 QueryStats (하위 호출에서 공유되는 가변 객체)
+  """
+  stats = QueryStats()
+  query_stats.set(stats)
+  return stats
+
+
+def instrument_engine(engine: Engine) -> None:
+  """엔진에 SQL 실행 시간 측정 이벤트를 등록합니다.
+
+  Args:
+    engine: 대상 엔진 (비동기 엔진은 sync_engine 전달)
+  """
+
+  @event.listens_for(engine, 'before_cursor_execute')
+  def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+  @event.listens_for(engine, 'after_cursor_execute')
+  def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info['query_start_time'].pop()) * 1000
+
+    stats = query_stats.get()
+    if stats is not None:
+      stats.record(statement, elapsed_ms)
+
+    # 옵트인 샘플링 로그 (기본값 0: 출력하지 않음)
+    if (
+      settings.DB_SQL_LOG_SAMPLE_RATE > 0
+      and random.random() < settings.DB_SQL_LOG_SAMPLE_RATE
+    ):
+      print(f'[SQL] {elapsed_ms:.2f}ms {statement} {parameters}')
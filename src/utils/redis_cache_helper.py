@@ -0,0 +1,281 @@
+"""Redis 프로토콜 캐시 백엔드 (CACHE_BACKEND=redis)
+
+RESP2 명령(GET, MGET, SET PX, DEL, INCR, SCAN)만 사용하는 작은 클라이언트로,
+추가 패키지 없이 Redis 및 호환 서버(Valkey, KeyDB, 로컬 대체 서버 등)에 연결합니다.
+여러 호스트의 워커가 같은 캐시를 공유할 수 있습니다.
+
+- 키: {CACHE_NAMESPACE}:{캐시 이름}:{캐시 버전}:{pickle한 키의 blake2b 해시}
+  (캐시 버전은 get_cache_version, 값 구조나 비밀 키가 바뀌면 이전 키를 읽지 않음)
+- 값: pickle (캐시 서버는 앱만 접근할 수 있는 신뢰된 서버여야 합니다)
+- TTL은 SET PX로 서버가 관리하고, 크기 제한은 서버의 maxmemory 정책을 따릅니다.
+- 연결은 스레드마다 하나씩 유지합니다.
+- 소켓 I/O는 이벤트 루프에서 직접 실행하지 않습니다. AsyncSession.run_sync 안
+  (이벤트 루프 스레드의 greenlet)에서 호출되면 스레드풀에서 실행하고 기다리며,
+  그 밖의 비동기 코드는 call_cache로 호출합니다.
+- 서버 오류/연결 실패는 캐시 실패(None)로 처리하고, REDIS_RETRY_SECONDS 동안은
+  다시 연결하지 않습니다. (캐시가 없어도 요청은 DB로 처리됨)
+- 무효화(delete/clear)에 실패하면 지우지 못한 키를 기억해 두고, 다시 지울 때까지
+  이 워커에서는 조회/저장하지 않습니다. (이전 값을 TTL 동안 돌려주지 않음)
+"""
+
+import hashlib
+import pickle
+import socket
+import threading
+import time
+from typing import Any, Hashable, Optional, Sequence
+from urllib.parse import unquote, urlparse
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from src.settings import settings
+from src.utils.cache_helper import CacheBackend, get_cache_version
+
+# 연결 실패 후 다시 연결하기까지 기다리는 시간 (초)
+REDIS_RETRY_SECONDS = 1.0
+
+# clear에서 SCAN 한 번에 가져올 키 수
+REDIS_SCAN_COUNT = 1000
+
+# 다시 지울 키를 기억하는 최대 수 (넘으면 전체 무효화로 재시도)
+REDIS_PENDING_KEYS = 10000
+
+RespCommand = tuple[Any, ...]
+
+
+class RespError(Exception):
+  """서버가 돌려준 오류 응답"""
+
+
+class RespConnection:
+  """RESP2 프로토콜 연결 (스레드 하나에서만 사용)"""
+
+  def __init__(self, url: str, timeout: float):
+    parsed = urlparse(url)
+    self.sock = socket.create_connection(
+      (parsed.hostname or 'localhost', parsed.port or 6379), timeout=timeout
+    )
+    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    self.reader = self.sock.makefile('rb')
+    if parsed.password:
+      auth = [unquote(parsed.username)] if parsed.username else []
+      self.execute('AUTH', *auth, unquote(parsed.password))
+    db = parsed.path.lstrip('/')
+    if db and db != '0':
+      self.execute('SELECT', db)
+
+  @staticmethod
+  def _encode(command: RespCommand) -> bytes:
+    """명령을 RESP 배열로 인코딩"""
+    parts = [b'*%d\r\n' % len(command)]
+    for arg in command:
+      data = arg if isinstance(arg, bytes) else str(arg).encode()
+      parts.append(b'$%d\r\n%s\r\n' % (len(data), data))
+    return b''.join(parts)
+
+  def _read(self) -> Any:
+    """응답 하나 읽기"""
+    line = self.reader.readline()
+    if not line.endswith(b'\r\n'):
+      raise ConnectionError('Redis 연결이 끊어졌습니다.')
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b'+':
+      return body
+    if prefix == b'-':
+      return RespError(body.decode(errors='replace'))
+    if prefix == b':':
+      return int(body)
+    if prefix == b'$':
+      length = int(body)
+      return None if length < 0 else self.reader.read(length + 2)[:-2]
+    if prefix == b'*':
+      length = int(body)
+      return None if length < 0 else [self._read() for _ in range(length)]
+    raise ConnectionError(f'알 수 없는 Redis 응답: {line[:20]!r}')
+
+  def execute_many(self, *commands: RespCommand) -> list[Any]:
+    """여러 명령을 한 번에 보내고(파이프라인) 응답을 순서대로 반환"""
+    self.sock.sendall(b''.join(self._encode(command) for command in commands))
+    replies = [self._read() for _ in commands]
+    for reply in replies:
+      if isinstance(reply, RespError):
+        raise reply
+    return replies
+
+  def execute(self, *command: Any) -> Any:
+    """명령 하나 실행"""
+    return self.execute_many(command)[0]
+
+  def close(self) -> None:
+    self.reader.close()
+    self.sock.close()
+
+
+class RedisCache(CacheBackend):
+  """Redis 프로토콜 서버에 저장하는 캐시"""
+
+  backend = 'redis'
+  blocking = True
+  shared = True
+
+  def __init__(
+    self,
+    name: str,
+    max_size: int,
+    ttl_seconds: float,
+    enabled: bool,
+    version: str = '',
+  ):
+    super().__init__(name, max_size, ttl_seconds, enabled, version)
+    self.url = settings.CACHE_REDIS_URL
+    self.prefix = f'{settings.CACHE_NAMESPACE}:{name}:{get_cache_version(version)}:'
+    self.generation_key = f'{self.prefix}generation'
+    self._local = threading.local()
+    self._retry_at = 0.0
+    # 무효화에 실패해 다시 지워야 하는 Redis 키와 전체 무효화 요청 수
+    self._pending_keys: set[str] = set()
+    self._pending_clears = 0
+    self._pending_lock = threading.Lock()
+
+  def _execute_many(self, *commands: RespCommand) -> Optional[list[Any]]:
+    """명령 실행 (연결 실패/서버 오류면 None)
+
+    AsyncSession.run_sync 안에서 호출되면 이벤트 루프를 막지 않도록 스레드풀에서
+    실행하고 기다립니다.
+    """
+    if in_greenlet():
+      return await_only(run_in_threadpool(self._execute_blocking, *commands))
+    return self._execute_blocking(*commands)
+
+  def _execute_blocking(self, *commands: RespCommand) -> Optional[list[Any]]:
+    """명령 실행 (현재 스레드에서 소켓 I/O)"""
+    if time.monotonic() < self._retry_at:
+      return None
+    connection: Optional[RespConnection] = getattr(self._local, 'connection', None)
+    try:
+      if connection is None:
+        connection = RespConnection(self.url, settings.CACHE_REDIS_TIMEOUT_SECONDS)
+        self._local.connection = connection
+      return connection.execute_many(*commands)
+    except (OSError, RespError) as error:
+      if connection is not None:
+        connection.close()
+      self._local.connection = None
+      self._retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+      print(f'[CACHE] Redis 캐시 오류 ({self.name}): {error!r}')
+      return None
+
+  def _key(self, key: Hashable) -> str:
+    """캐시 키 -> Redis 키"""
+    key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+    return self.prefix + hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
+
+  @property
+  def generation(self) -> int:
+    replies = self._execute_many(('GET', self.generation_key))
+    return int(replies[0] or 0) if replies else 0
+
+  def get_many(self, keys: Sequence[Hashable]) -> list[Optional[Any]]:
+    if not self.enabled or not keys:
+      return [None] * len(keys)
+    if not self._retry_invalidations():
+      self._count(misses=len(keys))
+      return [None] * len(keys)
+    replies = self._execute_many(('MGET', *(self._key(key) for key in keys)))
+    payloads = replies[0] if replies else [None] * len(keys)
+    values = [pickle.loads(p) if p is not None else None for p in payloads]
+    hits = sum(value is not None for value in values)
+    self._count(hits=hits, misses=len(keys) - hits)
+    return values
+
+  def _set(
+    self, key: Hashable, value: Any, generation: Optional[int], ttl_seconds: float
+  ) -> None:
+    if not self._retry_invalidations():
+      return
+    # generation 확인과 저장은 별도 명령이므로, 그 사이의 무효화는 TTL 동안 남을 수 있음
+    if generation is not None and generation != self.generation:
+      return
+    value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    ttl_ms = max(int(ttl_seconds * 1000), 1)
+    self._execute_many(('SET', self._key(key), value_bytes, 'PX', ttl_ms))
+
+  def delete(self, *keys: Hashable) -> None:
+    with self._pending_lock:
+      self._pending_keys.update(self._key(key) for key in keys)
+      if len(self._pending_keys) > REDIS_PENDING_KEYS:
+        self._pending_keys.clear()
+        self._pending_clears += 1
+    if not self._retry_invalidations():
+      self._log_invalidation_failure()
+
+  def clear(self) -> None:
+    with self._pending_lock:
+      self._pending_keys.clear()
+      self._pending_clears += 1
+    if not self._retry_invalidations():
+      self._log_invalidation_failure()
+
+  def _log_invalidation_failure(self) -> None:
+    print(
+      f'[CACHE] Redis 캐시 무효화 실패 ({self.name}): '
+      '다시 무효화할 때까지 이 워커에서는 캐시를 사용하지 않습니다.'
+    )
+
+  def _retry_invalidations(self) -> bool:
+    """지우지 못한 키/전체 무효화를 실행 (남은 무효화가 없으면 True)
+
+    False면 호출한 쪽은 조회/저장하지 않습니다.
+    """
+    with self._pending_lock:
+      keys = list(self._pending_keys)
+      clears = self._pending_clears
+    if not keys and not clears:
+      return True
+    invalidations = self._clear_keys() if clears else self._delete_keys(keys)
+    if invalidations is None:
+      return False
+    with self._pending_lock:
+      self._pending_keys.difference_update(keys)
+      self._pending_clears -= clears
+    self._count(invalidations=invalidations)
+    return True
+
+  def _delete_keys(self, keys: list[str]) -> Optional[int]:
+    """generation을 올리고 키 삭제 (지운 키 수, 실패하면 None)"""
+    commands: list[RespCommand] = [('INCR', self.generation_key)]
+    if keys:
+      commands.append(('DEL', *keys))
+    replies = self._execute_many(*commands)
+    if replies is None:
+      return None
+    return replies[1] if keys else 0
+
+  def _clear_keys(self) -> Optional[int]:
+    """generation을 올리고 이 캐시의 키 전체 삭제 (지운 키 수, 실패하면 None)"""
+    # 먼저 generation을 올려, 훑는 동안 조회한 값이 저장되지 않도록 함
+    if self._execute_many(('INCR', self.generation_key)) is None:
+      return None
+    invalidations = 0
+    cursor = b'0'
+    while True:
+      replies = self._execute_many(
+        ('SCAN', cursor, 'MATCH', f'{self.prefix}*', 'COUNT', REDIS_SCAN_COUNT)
+      )
+      if replies is None:
+        return None
+      cursor, keys = replies[0]
+      keys = [key for key in keys if key != self.generation_key.encode()]
+      if keys:
+        deleted = self._execute_many(('DEL', *keys))
+        if deleted is None:
+          return None
+        invalidations += deleted[0]
+      if cursor == b'0':
+        return invalidations
+
+  def size(self) -> Optional[int]:
+    # 서버에서 접두사로 세려면 전체 키를 훑어야 하므로 제공하지 않음
+    return None
@@ -0,0 +1,167 @@
+"""읽기 복제본(read replica) 라우팅 유틸리티
+
+- 쓰기(INSERT/UPDATE/DELETE, flush)는 항상 primary로 보냅니다.
+- @read_only로 표시한 서비스 메서드의 조회만 복제본으로 보냅니다.
+- 세션에서 한 번이라도 쓰기가 일어나면 이후 조회도 primary를 사용합니다.
+- 쓰기를 한 클라이언트는 DB_REPLICA_STICKY_SECONDS 동안 primary에 고정됩니다.
+  (쿠키로 전달하므로 여러 워커 사이에서도 유지됩니다.)
+"""
+
+import inspect
+import itertools
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar, cast
+
+from sqlalchemy import Engine, event
+from sqlalchemy.sql.dml import UpdateBase
+from sqlmodel import Session
+
+TFunc = TypeVar('TFunc', bound=Callable[..., Any])
+
+# Session.info 키
+READ_ONLY_KEY = 'replica_read_only'  # 복제본 조회 허용 여부
+WROTE_KEY = 'replica_wrote'  # 세션에서 쓰기 발생 여부
+
+# 쓰기 후 primary 고정 만료 시각(epoch 초)을 담는 쿠키
+STICKY_COOKIE = 'db_primary_until'
+
+
+@dataclass
+class RouteContext:
+  """요청 단위 라우팅 상태"""
+
+  sticky_until: float = 0.0  # 이 시각까지는 primary 사용
+  wrote: bool = False  # 이번 요청에서 쓰기 발생 여부
+
+  @property
+  def is_sticky(self) -> bool:
+    return self.sticky_until > time.time()
+
+
+route_context: ContextVar[Optional[RouteContext]] = ContextVar(
+  'route_context', default=None
+)
+
+
+def start_route_context(sticky_cookie: Optional[str]) -> RouteContext:
+  """요청 시작 시 라우팅 상태를 생성합니다.
+
+  Args:
+    sticky_cookie: STICKY_COOKIE 쿠키 값 (primary 고정 만료 시각)
+
+  Returns:
+    현재 요청의 RouteContext (하위 호출에서 공유되는 가변 객체)
+  """
+  try:
+    sticky_until = float(sticky_cookie) if sticky_cookie else 0.0
+  except ValueError:
+    sticky_until = 0.0
+  ctx = RouteContext(sticky_until=sticky_until)
+  route_context.set(ctx)
+  return ctx
+
+
+class ReplicaRouter:
+  """primary 엔진과 복제본 엔진 풀 (라운드 로빈 + 장애 복제본 제외)"""
+
+  def __init__(self, primary: Engine, replicas: list[Engine], eject_seconds: int):
+    self.primary = primary
+    self.replicas = replicas
+    self.eject_seconds = eject_seconds
+    self._ejected_until: dict[int, float] = {}
+    self._counter = itertools.count()
+    self._lock = threading.Lock()
+
+    for index, replica in enumerate(replicas):
+      self._watch(index, replica)
+
+  def _watch(self, index: int, replica: Engine) -> None:
+    """연결 오류가 발생한 복제본을 일정 시간 동안 제외합니다."""
+
+    @event.listens_for(replica, 'handle_error')
+    def _on_error(context):
+      if context.is_disconnect or context.connection is None:
+        self.eject(index)
+
+  def eject(self, index: int) -> None:
+    """복제본을 eject_seconds 동안 라우팅 대상에서 제외"""
+    with self._lock:
+      self._ejected_until[index] = time.monotonic() + self.eject_seconds
+
+  def pick_replica(self) -> Optional[Engine]:
+    """정상 상태의 복제본을 라운드 로빈으로 선택 (없으면 None)"""
+    now = time.monotonic()
+    for _ in range(len(self.replicas)):
+      index = next(self._counter) % len(self.replicas)
+      if self._ejected_until.get(index, 0.0) <= now:
+        return self.replicas[index]
+    return None
+
+
+class RoutingSession(Session):
+  """조회는 복제본, 쓰기는 primary로 보내는 세션"""
+
+  def __init__(self, router: ReplicaRouter, **kwargs: Any):
+    super().__init__(**kwargs)
+    self.router = router
+    self._replica: Optional[Engine] = None
+
+  def get_bind(self, mapper=None, clause=None, **kwargs):  # type: ignore[override]
+    ctx = route_context.get()
+
+    # 쓰기는 항상 primary (세션/요청에 쓰기 발생 기록)
+    if self._flushing or isinstance(clause, UpdateBase):
+      self.info[WROTE_KEY] = True
+      if ctx is not None:
+        ctx.wrote = True
+      return self.router.primary
+
+    # @read_only 서비스 메서드가 아니거나, 쓰기 직후라면 primary
+    if (
+      not self.info.get(READ_ONLY_KEY)
+      or self.info.get(WROTE_KEY)
+      or (ctx is not None and (ctx.wrote or ctx.is_sticky))
+    ):
+      return self.router.primary
+
+    # 한 세션 안에서는 같은 복제본을 사용 (복제 지연 차이로 인한 역행 방지)
+    if self._replica is None:
+      self._replica = self.router.pick_replica()
+    return self._replica or self.router.primary
+
+
+def read_only(func: TFunc) -> TFunc:
+  """조회 전용 서비스 메서드 표시 (복제본 사용 허용)
+
+  self.session.info에 플래그를 설정하므로 동기/비동기 서비스 모두에 사용할 수 있습니다.
+  복제본이 설정되지 않았다면 아무 영향이 없습니다.
+  """
+  if inspect.iscoroutinefunction(func):
+
+    @wraps(func)
+    async def async_wrapper(self, *args, **kwargs):
+      info = self.session.info
+      previous = info.get(READ_ONLY_KEY, False)
+      info[READ_ONLY_KEY] = True
+      try:
+        return await func(self, *args, **kwargs)
+      finally:
+        info[READ_ONLY_KEY] = previous
+
+    return cast(TFunc, async_wrapper)
+
+  @wraps(func)
+  def wrapper(self, *args, **kwargs):
+    info = self.session.info
+    previous = info.get(READ_ONLY_KEY, False)
+    info[READ_ONLY_KEY] = True
+    try:
+      return func(self, *args, **kwargs)
+    finally:
+      info[READ_ONLY_KEY] = previous
+
+  return cast(TFunc, wrapper)
@@ -0,0 +1,345 @@
+"""스키마 지문(fingerprint) 기반 DDL 실행 유틸리티
+
+매 기동마다 create_all을 실행하면 테이블마다 카탈로그 조회가 발생하고,
+여러 워커가 동시에 기동하면 DDL이 경합합니다.
+
+- SQLModel.metadata로 만든 DDL의 해시를 schema_version 테이블에 저장합니다.
+- 저장된 해시와 같으면 조회 한 번으로 DDL을 건너뜁니다.
+- 다르면 Postgres advisory lock을 잡은 워커 하나만 create_all을 실행하고,
+  기존 테이블에 새로 선언된 인덱스도 생성합니다.
+- 문자열에서 timestamptz로 타입을 바꾼 기존 컬럼은 ALTER TABLE로 변환합니다.
+- 함수 인덱스로 대체한 UNIQUE 제약조건(REPLACED_UNIQUE_CONSTRAINTS)은 삭제합니다.
+- 새 인덱스로 대체한 이전 인덱스(REPLACED_INDEXES)는 삭제합니다.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import (
+  Column,
+  Connection,
+  DateTime,
+  Engine,
+  Index,
+  Integer,
+  MetaData,
+  String,
+  Table,
+  func,
+  inspect,
+  select,
+  text,
+)
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy.engine import Dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+# 스키마 마이그레이션 advisory lock 키 (애플리케이션 내에서 고유한 값)
+SCHEMA_LOCK_KEY = 870_522_001
+
+# 인덱스로 대체되어 삭제할 UNIQUE 제약조건 (테이블 -> 제약조건 이름)
+# 이 목록에 없는 제약조건(DBA가 추가한 것 등)은 모델에 없어도 삭제하지 않음
+REPLACED_UNIQUE_CONSTRAINTS = {
+  # lower(eml_addr) UNIQUE 인덱스(ix_user_info_eml_addr_lower)로 대체
+  'user_info': ('user_info_eml_addr_key',),
+}
+
+# 새 인덱스로 대체되어 삭제할 인덱스 (테이블 -> 인덱스 이름)
+# create_all은 이름이 같은 인덱스의 정의를 바꾸지 않으므로,
+# 정의를 바꿀 때는 인덱스 이름을 바꾸고 이전 이름을 여기에 추가
+REPLACED_INDEXES = {
+  # 권한/사용 여부를 INCLUDE한 ix_user_info_live_user_no_cover로 대체
+  'user_info': ('ix_user_info_live_user_no',),
+}
+
+# UNIQUE 인덱스를 만들 수 없을 때 오류 메시지에 보여줄 중복 값 수
+DUPLICATE_SAMPLE_SIZE = 5
+
+# 스키마 지문 저장 테이블 (SQLModel.metadata와 분리하여 지문 계산에서 제외)
+schema_metadata = MetaData()
+schema_version_table = Table(
+  'schema_version',
+  schema_metadata,
+  Column('id', Integer, primary_key=True),  # 항상 1 (단일 행)
+  Column('fingerprint', String, nullable=False),
+  Column('applied_dt', String, nullable=False),
+)
+
+
+def compute_schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+  """메타데이터로 생성되는 DDL의 SHA-256 해시를 계산합니다.
+
+  Args:
+    metadata: 대상 메타데이터 (SQLModel.metadata)
+    dialect: DDL을 컴파일할 DB 방언 (engine.dialect)
+
+  Returns:
+    16진수 해시 문자열
+  """
+  digest = hashlib.sha256()
+  for table in metadata.sorted_tables:
+    digest.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+    for index in sorted(table.indexes, key=lambda index: index.name or ''):
+      digest.update(str(CreateIndex(index).compile(dialect=dialect)).encode())
+    # Enum 값은 CREATE TABLE에 나타나지 않으므로 별도로 반영
+    for column in table.columns:
+      if isinstance(column.type, SQLEnum):
+        digest.update(f'{column.type.name}:{",".join(column.type.enums)}'.encode())
+  return digest.hexdigest()
+
+
+def get_applied_fingerprint(conn: Connection) -> Optional[str]:
+  """DB에 저장된 스키마 지문 조회 (테이블이 없으면 None)
+
+  테이블이 없을 때 발생하는 오류는 DB마다 다르므로(Postgres는 ProgrammingError,
+  SQLite는 OperationalError) 조회 전에 테이블 존재 여부를 확인합니다.
+  """
+  if not inspect(conn).has_table(schema_version_table.name):
+    return None
+  return conn.execute(
+    select(schema_version_table.c.fingerprint).where(schema_version_table.c.id == 1)
+  ).scalar_one_or_none()
+
+
+def is_schema_current(engine: Engine, metadata: MetaData) -> bool:
+  """DB 스키마 지문이 현재 메타데이터와 같은지 확인"""
+  fingerprint = compute_schema_fingerprint(metadata, engine.dialect)
+  with engine.connect() as conn:
+    return get_applied_fingerprint(conn) == fingerprint
+
+
+def convert_string_datetime_columns(conn: Connection, metadata: MetaData) -> list[str]:
+  """문자열 컬럼을 모델에 선언된 TIMESTAMP WITH TIME ZONE으로 변환 (Postgres만)
+
+  create_all은 기존 테이블의 컬럼 타입을 바꾸지 않으므로, 모델에서
+  DateTime(timezone=True)로 바꾼 컬럼이 DB에 문자열로 남아있으면 변환합니다.
+  테이블당 ALTER TABLE 한 번으로 기본값 제거 -> 타입 변환 -> 기본값 설정을 처리하여
+  테이블을 한 번만 다시 씁니다. (기존 값은 ISO 8601 문자열 또는 빈 문자열)
+
+  Returns:
+    변환한 컬럼 목록 (테이블.컬럼)
+  """
+  if conn.dialect.name != 'postgresql':
+    return []
+
+  inspector = inspect(conn)
+  quote = conn.dialect.identifier_preparer.quote
+  converted: list[str] = []
+  for table in metadata.sorted_tables:
+    if not inspector.has_table(table.name):
+      continue
+    existing_types = {
+      column['name']: column['type'] for column in inspector.get_columns(table.name)
+    }
+
+    clauses: list[str] = []
+    for column in table.columns:
+      if not (
+        isinstance(column.type, DateTime)
+        and column.type.timezone
+        and isinstance(existing_types.get(column.name), String)
+      ):
+        continue
+      name = quote(column.name)
+      clauses.append(f'ALTER COLUMN {name} DROP DEFAULT')
+      clauses.append(
+        f'ALTER COLUMN {name} TYPE TIMESTAMP WITH TIME ZONE '
+        f"USING NULLIF({name}, '')::timestamptz"
+      )
+      if column.server_default is not None:
+        default = column.server_default.arg  # type: ignore[attr-defined]
+        default_sql = default.compile(dialect=conn.dialect)
+        clauses.append(f'ALTER COLUMN {name} SET DEFAULT {default_sql}')
+      converted.append(f'{table.name}.{column.name}')
+
+    if clauses:
+      conn.execute(text(f'ALTER TABLE {quote(table.name)} {", ".join(clauses)}'))
+  return converted
+
+
+def get_index_names(conn: Connection, table_name: str) -> set[str]:
+  """테이블에 있는 인덱스 이름 목록
+
+  SQLite 인스펙터는 함수 인덱스(lower(eml_addr) 등)를 반영하지 못하므로
+  sqlite_master에서 이름을 직접 조회합니다.
+  """
+  if conn.dialect.name == 'sqlite':
+    return set(
+      conn.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :t"),
+        {'t': table_name},
+      ).scalars()
+    )
+  return {index['name'] for index in inspect(conn).get_indexes(table_name)}
+
+
+def check_unique_duplicates(conn: Connection, table: Table, index: Index) -> None:
+  """UNIQUE 인덱스를 만들기 전에 기존 행의 중복 값 확인
+
+  중복이 있으면 CREATE UNIQUE INDEX가 마이그레이션 도중 실패하므로, 중복 값을
+  보여주는 오류로 먼저 중단합니다. (예: 대소문자만 다른 이메일)
+
+  Raises:
+    RuntimeError: 인덱스 키가 중복된 행이 있는 경우
+  """
+  statement = (
+    select(*index.expressions, func.count())
+    .select_from(table)
+    .group_by(*index.expressions)
+    .having(func.count() > 1)
+    .limit(DUPLICATE_SAMPLE_SIZE)
+  )
+  where = index.dialect_options['postgresql']['where']
+  if where is not None:
+    statement = statement.where(where)
+  duplicates = conn.execute(statement).all()
+  if duplicates:
+    samples = ', '.join(f'{tuple(row[:-1])} x {row[-1]}' for row in duplicates)
+    raise RuntimeError(
+      f'{table.name}.{index.name} UNIQUE 인덱스를 만들 수 없습니다. '
+      f'중복 값을 정리한 뒤 다시 실행하세요: {samples}'
+    )
+
+
+def create_missing_indexes(conn: Connection, metadata: MetaData) -> list[str]:
+  """기존 테이블에 새로 선언한 인덱스 생성
+
+  create_all은 이미 있는 테이블의 인덱스를 만들지 않으므로, 이름으로 없는 인덱스를
+  찾아 생성합니다. UNIQUE 인덱스는 기존 행의 중복 여부를 먼저 확인합니다.
+
+  Returns:
+    생성한 인덱스 목록 (테이블.인덱스)
+  """
+  created: list[str] = []
+  for table in metadata.sorted_tables:
+    existing = get_index_names(conn, table.name)
+    for index in sorted(table.indexes, key=lambda index: index.name or ''):
+      if index.name in existing:
+        continue
+      if index.unique:
+        check_unique_duplicates(conn, table, index)
+      # CreateIndex를 직접 실행하지 않고 create로 생성 (ddl_if 조건 적용)
+      index.create(conn)
+      if index.name in get_index_names(conn, table.name):
+        created.append(f'{table.name}.{index.name}')
+  return created
+
+
+def drop_replaced_unique_constraints(conn: Connection) -> list[str]:
+  """인덱스로 대체한 UNIQUE 제약조건 삭제 (REPLACED_UNIQUE_CONSTRAINTS, Postgres만)
+
+  create_all은 기존 제약조건을 지우지 않으므로, 모델에서 unique=True를 제거하고
+  lower(컬럼) 같은 UNIQUE 함수 인덱스로 대체한 경우 남은 제약조건을 삭제합니다.
+  새 인덱스를 만든 뒤에 호출해야 중복을 막지 못하는 구간이 생기지 않습니다.
+
+  Returns:
+    삭제한 제약조건 목록 (테이블.제약조건)
+  """
+  if conn.dialect.name != 'postgresql':
+    return []
+
+  inspector = inspect(conn)
+  quote = conn.dialect.identifier_preparer.quote
+  dropped: list[str] = []
+  for table_name, constraint_names in REPLACED_UNIQUE_CONSTRAINTS.items():
+    if not inspector.has_table(table_name):
+      continue
+    existing = {
+      constraint['name'] for constraint in inspector.get_unique_constraints(table_name)
+    }
+    for constraint_name in constraint_names:
+      if constraint_name not in existing:
+        continue
+      conn.execute(
+        text(
+          f'ALTER TABLE {quote(table_name)} DROP CONSTRAINT {quote(constraint_name)}'
+        )
+      )
+      dropped.append(f'{table_name}.{constraint_name}')
+  return dropped
+
+
+def drop_replaced_indexes(conn: Connection) -> list[str]:
+  """새 인덱스로 대체한 이전 인덱스 삭제 (REPLACED_INDEXES)
+
+  새 인덱스를 만든 뒤에 호출해야 인덱스 없이 조회하는 구간이 생기지 않습니다.
+
+  Returns:
+    삭제한 인덱스 목록 (테이블.인덱스)
+  """
+  inspector = inspect(conn)
+  quote = conn.dialect.identifier_preparer.quote
+  dropped: list[str] = []
+  for table_name, index_names in REPLACED_INDEXES.items():
+    if not inspector.has_table(table_name):
+      continue
+    existing = get_index_names(conn, table_name)
+    for index_name in index_names:
+      if index_name not in existing:
+        continue
+      conn.execute(text(f'DROP INDEX {quote(index_name)}'))
+      dropped.append(f'{table_name}.{index_name}')
+  return dropped
+
+
+def migrate_schema(engine: Engine, metadata: MetaData, force: bool = False) -> bool:
+  """스키마 지문이 다를 때만 create_all을 실행합니다.
+
+  Postgres에서는 트랜잭션 advisory lock으로 한 워커만 DDL을 실행하며,
+  나머지 워커는 잠금을 기다린 뒤 갱신된 지문을 확인하고 건너뜁니다.
+
+  Args:
+    engine: 대상 엔진
+    metadata: 생성할 테이블 메타데이터 (SQLModel.metadata)
+    force: True면 지문이 같아도 create_all 실행
+
+  Returns:
+    DDL 실행 여부
+  """
+  fingerprint = compute_schema_fingerprint(metadata, engine.dialect)
+
+  # 1. 빠른 경로: 잠금 없이 지문만 비교 (조회 1회)
+  if not force and is_schema_current(engine, metadata):
+    return False
+
+  with engine.begin() as conn:
+    # 2. 한 워커만 DDL을 실행하도록 잠금 (트랜잭션 종료 시 자동 해제)
+    if engine.dialect.name == 'postgresql':
+      conn.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': SCHEMA_LOCK_KEY})
+
+    # 3. 잠금을 기다리는 동안 다른 워커가 이미 적용했다면 건너뜀
+    if not force and get_applied_fingerprint(conn) == fingerprint:
+      return False
+
+    # 타입을 바꾼 기존 컬럼 변환 (새로 선언한 인덱스보다 먼저)
+    converted = convert_string_datetime_columns(conn, metadata)
+    if converted:
+      print(f'[DB] timestamptz로 변환: {", ".join(converted)}')
+
+    metadata.create_all(conn)
+    schema_metadata.create_all(conn)
+
+    # create_all은 이미 있는 테이블의 인덱스를 만들지 않으므로 새로 선언한 인덱스 생성
+    created = create_missing_indexes(conn, metadata)
+    if created:
+      print(f'[DB] 인덱스 생성: {", ".join(created)}')
+
+    # 인덱스로 대체한 제약조건 삭제 (새 인덱스 생성 후)
+    dropped = drop_replaced_unique_constraints(conn)
+    if dropped:
+      print(f'[DB] UNIQUE 제약조건 삭제: {", ".join(dropped)}')
+
+    # 새 인덱스로 대체한 이전 인덱스 삭제 (새 인덱스 생성 후)
+    dropped = drop_replaced_indexes(conn)
+    if dropped:
+      print(f'[DB] 인덱스 삭제: {", ".join(dropped)}')
+
+    applied_dt = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    conn.execute(schema_version_table.delete())
+    conn.execute(
+      schema_version_table.insert().values(
+        id=1, fingerprint=fingerprint, applied_dt=applied_dt
+      )
+    )
+  return True
@@ -0,0 +1,100 @@
+"""키워드(부분 문자열) 검색 유틸리티 (pg_trgm)
+
+LIKE '%키워드%'는 btree 인덱스를 사용할 수 없어 매번 전체 테이블을 읽습니다.
+Postgres에서는 pg_trgm 확장의 GIN 인덱스(gin_trgm_ops)로 ILIKE 검색에 인덱스를 사용하고,
+similarity()로 검색 결과를 유사도순으로 정렬합니다.
+
+- 확장은 create_all 직전에 생성합니다. 설치되지 않았거나 권한이 없으면
+  경고만 출력하고 trigram 인덱스 없이 진행합니다.
+- Postgres가 아니거나(SQLite 등) 확장이 없으면 ILIKE(또는 lower() LIKE)만 사용하고
+  유사도 정렬은 기본 정렬로 대체합니다.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import Connection, Index, MetaData, event, text
+from sqlalchemy.exc import DBAPIError
+
+# trigram 확장 이름
+TRGM_EXTENSION = 'pg_trgm'
+
+# LIKE 패턴 이스케이프 문자
+LIKE_ESCAPE = '\\'
+
+
+class TrigramState:
+  """pg_trgm 사용 가능 여부 (프로세스당 한 번 조회 후 캐시, None이면 미확인)"""
+
+  available: Optional[bool] = None
+
+
+trigram_state = TrigramState()
+
+
+def is_trigram_available(conn: Connection) -> bool:
+  """연결된 DB에 pg_trgm 확장이 설치되어 있는지 확인 (결과 캐시)"""
+  if trigram_state.available is None:
+    trigram_state.available = conn.dialect.name == 'postgresql' and bool(
+      conn.execute(
+        text('SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = :name)'),
+        {'name': TRGM_EXTENSION},
+      ).scalar()
+    )
+  return trigram_state.available
+
+
+def create_trigram_extension(conn: Connection) -> bool:
+  """pg_trgm 확장 생성 (Postgres만, 실패하면 경고 후 False)"""
+  if conn.dialect.name != 'postgresql':
+    return False
+  try:
+    # 실패해도 바깥 트랜잭션(DDL)이 중단되지 않도록 savepoint 안에서 실행
+    with conn.begin_nested():
+      conn.execute(text(f'CREATE EXTENSION IF NOT EXISTS {TRGM_EXTENSION}'))
+  except DBAPIError as error:
+    print(
+      f'[DB] {TRGM_EXTENSION} 확장을 생성할 수 없어 trigram 인덱스 없이 진행합니다. '
+      f'({error.orig.__class__.__name__})'
+    )
+    trigram_state.available = False
+    return False
+  trigram_state.available = True
+  return True
+
+
+def register_trigram_extension(metadata: MetaData) -> None:
+  """create_all 직전에 pg_trgm 확장을 생성하도록 이벤트 등록"""
+
+  @event.listens_for(metadata, 'before_create')
+  def _before_create(target, connection, **kw):
+    create_trigram_extension(connection)
+
+
+def _should_create_trigram_index(ddl, target, bind, **kw: Any) -> bool:
+  """확장이 있을 때만 trigram 인덱스 생성 (create_all의 ddl_if 조건)"""
+  return bind is not None and is_trigram_available(bind)
+
+
+def trigram_index(name: str, column_name: str) -> Index:
+  """ILIKE '%키워드%' 검색용 GIN trigram 인덱스 (Postgres + pg_trgm에서만 생성)
+
+  Args:
+    name: 인덱스 이름
+    column_name: 대상 컬럼 이름 (DB 컬럼명)
+  """
+  return Index(
+    name,
+    column_name,
+    postgresql_using='gin',
+    postgresql_ops={column_name: 'gin_trgm_ops'},
+  ).ddl_if(dialect='postgresql', callable_=_should_create_trigram_index)
+
+
+def to_like_pattern(keyword: str) -> str:
+  """부분 일치 LIKE 패턴 생성 (키워드의 %, _는 문자 그대로 검색)"""
+  escaped = (
+    keyword.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+    .replace('%', f'{LIKE_ESCAPE}%')
+    .replace('_', f'{LIKE_ESCAPE}_')
+  )
+  return f'%{escaped}%'
@@ -0,0 +1,253 @@
+"""공유 메모리 캐시 백엔드 (CACHE_BACKEND=shm)
+
+같은 호스트의 워커(uvicorn --workers)가 캐시마다 파일 하나를 mmap으로 공유합니다.
+한 워커의 저장/무효화를 다른 워커도 바로 보므로, 워커 수만큼 캐시가 중복되지 않고
+다른 워커의 쓰기를 TTL까지 기다리지 않습니다.
+
+세그먼트는 헤더와 고정 크기 슬롯 max_size개로 구성됩니다.
+
+- 헤더: 매직, 형식 버전, 슬롯 수, 슬롯 크기, generation
+- 슬롯: 만료 시각, 마지막 사용 시각, 키 해시, 키/값 길이, pickle한 키와 값
+
+키 해시가 가리키는 슬롯부터 SHM_PROBE_SLOTS개 안에서 찾고, 저장할 빈 슬롯이 없으면
+그중 가장 오래 사용하지 않은 슬롯을 덮어씁니다. (근사 LRU)
+프로세스 사이는 파일 잠금(flock), 같은 프로세스의 스레드 사이는 threading.Lock으로
+직렬화합니다. 만료 시각은 호스트 전체에서 같은 time.monotonic 기준입니다.
+직렬화한 키와 값이 슬롯 크기(CACHE_SHM_SLOT_SIZE)를 넘으면 저장하지 않습니다.
+
+파일은 재시작 후에도 남으므로 이름에 세그먼트 형식 버전(SHM_VERSION)과 캐시 버전
+(get_cache_version: 값 형식, 비밀 키, 캐시별 값 구조)을 넣습니다. 배포로 값 구조가
+바뀌거나 비밀 키를 바꾸면 새 파일을 사용하고, 이전 파일의 값은 읽지 않습니다.
+"""
+
+import fcntl
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Hashable, Iterator, Optional, Sequence
+
+from src.settings import settings
+from src.utils.cache_helper import CacheBackend, get_cache_version
+
+SHM_MAGIC = b'FCSH'
+SHM_VERSION = 1
+
+# 헤더: 매직, 형식 버전, 슬롯 수, 슬롯 크기, generation (슬롯은 SHM_HEADER_SIZE부터)
+SHM_HEADER = struct.Struct('<4sIIIQ')
+SHM_GENERATION = struct.Struct('<Q')
+SHM_GENERATION_OFFSET = 16
+SHM_HEADER_SIZE = 64
+
+# 슬롯 헤더: 만료 시각(0이면 빈 슬롯), 마지막 사용 시각, 키 해시, 키 길이, 값 길이
+SHM_SLOT = struct.Struct('<ddQII')
+SHM_LAST_USED = struct.Struct('<d')
+
+# 키 하나를 찾거나 저장할 때 살펴보는 연속 슬롯 수
+SHM_PROBE_SLOTS = 8
+
+
+def get_shm_dir() -> str:
+  """공유 메모리 파일 디렉터리 (CACHE_SHM_DIR, 없으면 /dev/shm 또는 임시 디렉터리)"""
+  if settings.CACHE_SHM_DIR:
+    return settings.CACHE_SHM_DIR
+  return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+
+class SharedMemoryCache(CacheBackend):
+  """같은 호스트의 워커가 공유하는 mmap 캐시"""
+
+  backend = 'shm'
+  shared = True
+
+  def __init__(
+    self,
+    name: str,
+    max_size: int,
+    ttl_seconds: float,
+    enabled: bool,
+    version: str = '',
+  ):
+    super().__init__(name, max_size, ttl_seconds, enabled, version)
+    self.slot_count = max(max_size, SHM_PROBE_SLOTS)
+    self.slot_size = settings.CACHE_SHM_SLOT_SIZE
+    # 슬롯 수/크기가 다르면 다른 파일을 사용 (사용 중인 세그먼트 크기를 바꾸지 않음)
+    self.path = os.path.join(
+      get_shm_dir(),
+      f'{settings.CACHE_NAMESPACE}-cache-{name}-v{SHM_VERSION}'
+      f'-{get_cache_version(version)}-{self.slot_count}x{self.slot_size}',
+    )
+    self._lock = threading.Lock()
+    self._pid = 0
+    self._fd = -1
+    self._mmap: Optional[mmap.mmap] = None
+    self._open()
+
+  def _open(self) -> None:
+    """세그먼트 파일을 열어 매핑 (처음 만든 워커가 헤더를 기록)
+
+    fork로 만든 워커는 부모의 파일 잠금을 공유하지 않도록 다시 엽니다.
+    """
+    if self._mmap is not None:
+      self._mmap.close()
+      os.close(self._fd)
+    size = SHM_HEADER_SIZE + self.slot_count * self.slot_size
+    fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+      if os.fstat(fd).st_size < size:
+        os.ftruncate(fd, size)
+      magic, *_ = SHM_HEADER.unpack(os.pread(fd, SHM_HEADER.size, 0))
+      if magic != SHM_MAGIC:
+        header = (SHM_MAGIC, SHM_VERSION, self.slot_count, self.slot_size, 0)
+        os.pwrite(fd, SHM_HEADER.pack(*header), 0)
+        print(f'[CACHE] 공유 메모리 캐시 생성: {self.path} ({size:,} bytes)')
+    finally:
+      fcntl.flock(fd, fcntl.LOCK_UN)
+    self._fd = fd
+    self._mmap = mmap.mmap(fd, size)
+    self._pid = os.getpid()
+
+  @contextmanager
+  def _locked(self) -> Iterator[mmap.mmap]:
+    """스레드/프로세스 잠금을 잡고 세그먼트 반환"""
+    with self._lock:
+      if self._pid != os.getpid():
+        self._open()
+      fcntl.flock(self._fd, fcntl.LOCK_EX)
+      try:
+        yield self._mmap  # type: ignore[misc]
+      finally:
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+  @staticmethod
+  def _encode_key(key: Hashable) -> tuple[bytes, int]:
+    """키 직렬화 값과 해시 (프로세스마다 달라지는 hash() 대신 blake2b 사용)"""
+    key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+    key_hash = hashlib.blake2b(key_bytes, digest_size=8).digest()
+    return key_bytes, int.from_bytes(key_hash, 'little')
+
+  def _probe(self, key_hash: int) -> Iterator[int]:
+    """키 해시로 살펴볼 슬롯 위치(바이트 오프셋)"""
+    for n in range(SHM_PROBE_SLOTS):
+      index = (key_hash + n) % self.slot_count
+      yield SHM_HEADER_SIZE + index * self.slot_size
+
+  def _find(self, shm: mmap.mmap, key_bytes: bytes, key_hash: int) -> Optional[int]:
+    """키가 저장된 슬롯 위치 (없으면 None, 만료 여부는 확인하지 않음)"""
+    for offset in self._probe(key_hash):
+      expires_at, _, slot_hash, key_len, _ = SHM_SLOT.unpack_from(shm, offset)
+      if not expires_at or slot_hash != key_hash or key_len != len(key_bytes):
+        continue
+      data = offset + SHM_SLOT.size
+      if shm[data : data + key_len] == key_bytes:
+        return offset
+    return None
+
+  @property
+  def generation(self) -> int:
+    with self._locked() as shm:
+      return SHM_GENERATION.unpack_from(shm, SHM_GENERATION_OFFSET)[0]
+
+  def _bump_generation(self, shm: mmap.mmap) -> None:
+    """generation 증가 (잠금 안에서 호출)"""
+    generation = SHM_GENERATION.unpack_from(shm, SHM_GENERATION_OFFSET)[0]
+    SHM_GENERATION.pack_into(shm, SHM_GENERATION_OFFSET, generation + 1)
+
+  def get_many(self, keys: Sequence[Hashable]) -> list[Optional[Any]]:
+    if not self.enabled:
+      return [None] * len(keys)
+    encoded = [self._encode_key(key) for key in keys]
+    payloads: list[Optional[bytes]] = []
+    expirations = 0
+    with self._locked() as shm:
+      now = time.monotonic()
+      for key_bytes, key_hash in encoded:
+        offset = self._find(shm, key_bytes, key_hash)
+        if offset is None:
+          payloads.append(None)
+          continue
+        expires_at, _, _, key_len, value_len = SHM_SLOT.unpack_from(shm, offset)
+        if expires_at <= now:
+          SHM_SLOT.pack_into(shm, offset, 0, 0, 0, 0, 0)
+          expirations += 1
+          payloads.append(None)
+          continue
+        SHM_LAST_USED.pack_into(shm, offset + 8, now)
+        data = offset + SHM_SLOT.size + key_len
+        payloads.append(shm[data : data + value_len])
+    # 역직렬화는 잠금 밖에서 수행
+    values = [pickle.loads(p) if p is not None else None for p in payloads]
+    hits = sum(value is not None for value in values)
+    self._count(hits=hits, misses=len(keys) - hits, expirations=expirations)
+    return values
+
+  def _set(
+    self, key: Hashable, value: Any, generation: Optional[int], ttl_seconds: float
+  ) -> None:
+    key_bytes, key_hash = self._encode_key(key)
+    value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    if SHM_SLOT.size + len(key_bytes) + len(value_bytes) > self.slot_size:
+      return
+
+    evicted = 0
+    with self._locked() as shm:
+      current = SHM_GENERATION.unpack_from(shm, SHM_GENERATION_OFFSET)[0]
+      if generation is not None and generation != current:
+        return
+      now = time.monotonic()
+      target = self._find(shm, key_bytes, key_hash)
+      if target is None:
+        # 빈(만료된) 슬롯이 없으면 가장 오래 사용하지 않은 슬롯을 덮어씀
+        oldest_used = float('inf')
+        for offset in self._probe(key_hash):
+          expires_at, last_used, *_ = SHM_SLOT.unpack_from(shm, offset)
+          if expires_at <= now:
+            target, evicted = offset, 0
+            break
+          if last_used < oldest_used:
+            target, oldest_used, evicted = offset, last_used, 1
+      assert target is not None
+      SHM_SLOT.pack_into(
+        shm, target, now + ttl_seconds, now, key_hash, len(key_bytes), len(value_bytes)
+      )
+      data = target + SHM_SLOT.size
+      shm[data : data + len(key_bytes) + len(value_bytes)] = key_bytes + value_bytes
+    if evicted:
+      self._count(evictions=evicted)
+
+  def delete(self, *keys: Hashable) -> None:
+    encoded = [self._encode_key(key) for key in keys]
+    invalidations = 0
+    with self._locked() as shm:
+      self._bump_generation(shm)
+      for key_bytes, key_hash in encoded:
+        offset = self._find(shm, key_bytes, key_hash)
+        if offset is not None:
+          SHM_SLOT.pack_into(shm, offset, 0, 0, 0, 0, 0)
+          invalidations += 1
+    self._count(invalidations=invalidations)
+
+  def clear(self) -> None:
+    invalidations = 0
+    with self._locked() as shm:
+      self._bump_generation(shm)
+      for index in range(self.slot_count):
+        offset = SHM_HEADER_SIZE + index * self.slot_size
+        if SHM_SLOT.unpack_from(shm, offset)[0]:
+          SHM_SLOT.pack_into(shm, offset, 0, 0, 0, 0, 0)
+          invalidations += 1
+    self._count(invalidations=invalidations)
+
+  def size(self) -> Optional[int]:
+    with self._locked() as shm:
+      now = time.monotonic()
+      return sum(
+        SHM_SLOT.unpack_from(shm, SHM_HEADER_SIZE + index * self.slot_size)[0] > now
+        for index in range(self.slot_count)
+      )
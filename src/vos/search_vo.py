@@ -7,6 +7,12 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+# 한 번에 조회할 수 있는 최대 행 수
+MAX_PAGE_SZ = 100
+
+# srchSort 값: 검색 키워드와의 유사도순 정렬
+SRCH_SORT_SIMILARITY = 'similarity'
+
 
 class SearchVo(BaseModel):
   """검색/페이지네이션용 VO
@@ -20,6 +26,31 @@ class SearchVo(BaseModel):
   endRow: Optional[int] = None  # 종료 행
   srchType: Optional[str] = None  # 검색 타입
   srchKywd: Optional[str] = None  # 검색 키워드
+  srchSort: Optional[str] = None  # 검색 결과 정렬 (similarity: 키워드 유사도순)
+  cursor: Optional[str] = None  # 키셋 페이지네이션 커서 (이전 응답의 nextCursor)
+  fields: Optional[str] = None  # 응답에 포함할 필드 (콤마 구분, 없으면 전체)
+
+  def to_offset_limit(self) -> tuple[int, int]:
+    """DB 조회용 (offset, limit) 계산
+
+    strtRow/endRow(1부터 시작, endRow 포함)가 있으면 우선 사용하고,
+    없으면 page(1부터 시작)/pageSz로 계산합니다. limit는 MAX_PAGE_SZ를 넘지 않습니다.
+    """
+    if self.strtRow and self.endRow and self.endRow >= self.strtRow > 0:
+      offset = self.strtRow - 1
+      limit = self.endRow - self.strtRow + 1
+    else:
+      page_sz = self.pageSz if self.pageSz and self.pageSz > 0 else 10
+      offset = (max(self.page or 1, 1) - 1) * page_sz
+      limit = page_sz
+    return offset, min(limit, MAX_PAGE_SZ)
+
+  def to_field_list(self) -> Optional[list[str]]:
+    """fields(콤마 구분)를 필드명 목록으로 변환 (지정하지 않았으면 None)"""
+    if not self.fields:
+      return None
+    names = (name.strip() for name in self.fields.split(','))
+    return list(dict.fromkeys(name for name in names if name)) or None
 
   class Config:
     from_attributes = True
@@ -6,9 +6,9 @@
 
 from typing import Optional
 
-from pydantic import EmailStr
-
 from src.models import UserRole, YnStatus
+from src.utils.datetime_helper import UtcDateTime
+from src.utils.email_helper import NormalizedEmail
 from src.vos.search_vo import SearchVo
 
 
@@ -21,7 +21,7 @@ class UserVo(SearchVo):
 
   # 테이블 필드 (모두 Optional로 정의하여 검색/생성/수정/삭제 모두에서 사용)
   userNo: Optional[int] = None
-  emlAddr: Optional[EmailStr] = None
+  emlAddr: Optional[NormalizedEmail] = None
   userNm: Optional[str] = None
   userRole: Optional[UserRole] = None
   password: Optional[str] = None  # 입력용 (Service에서 encptPswd로 변환)
@@ -31,14 +31,20 @@ class UserVo(SearchVo):
   reshToken: Optional[str] = None
   useYn: Optional[YnStatus] = None
   delYn: Optional[YnStatus] = None
-  lastLgnDt: Optional[str] = None
-  lastPswdChgDt: Optional[str] = None
+  lastLgnDt: Optional[UtcDateTime] = None
+  lastPswdChgDt: Optional[UtcDateTime] = None
   crtNo: Optional[int] = None
-  crtDt: Optional[str] = None
+  crtDt: Optional[UtcDateTime] = None
   updtNo: Optional[int] = None
-  updtDt: Optional[str] = None
+  updtDt: Optional[UtcDateTime] = None
   delNo: Optional[int] = None
-  delDt: Optional[str] = None
+  delDt: Optional[UtcDateTime] = None
 
   # 확장 필드 (검색 조건, 계산된 필드 등)
   userNoList: Optional[list[int]] = None  # 검색/삭제용
+  emlAddrList: Optional[list[NormalizedEmail]] = None  # 다건 조회용
+  # 일시 범위 검색 (From 이상, To 미만, 시간대가 없으면 UTC)
+  crtDtFrom: Optional[UtcDateTime] = None
+  crtDtTo: Optional[UtcDateTime] = None
+  lastLgnDtFrom: Optional[UtcDateTime] = None
+  lastLgnDtTo: Optional[UtcDateTime] = None
@@ -0,0 +1,115 @@
+"""테스트 공통 설정과 DB 대역(stand-in) 픽스처
+
+src.settings는 import 시점에 환경 변수를 읽으므로, 필수 값이 없으면 테스트용 값을
+넣습니다. (DATABASE_URL이 없으면 메모리 SQLite)
+
+DB 대역은 이름마다 독립된 DB를 만들어 primary/복제본 역할을 맡깁니다.
+- sqlite: 임시 디렉터리의 SQLite 파일 (항상 실행)
+- postgresql: TEST_DATABASE_URL(없으면 Postgres DATABASE_URL) DB 안의 테스트 전용 스키마
+  (Postgres URL이 없으면 건너뛰고, 테스트가 끝나면 스키마를 삭제합니다.)
+
+실행 방법:
+  uv run --with pytest pytest
+"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('ACCESS_TOKEN_SECRET', 'test-access-secret')
+os.environ.setdefault('REFRESH_TOKEN_SECRET', 'test-refresh-secret')
+
+# 이름 -> 독립된 DB URL (테이블 생성 완료)
+StandInFactory = Callable[[str], str]
+
+
+def get_postgres_url() -> Optional[str]:
+  """테스트에 사용할 Postgres URL (없으면 None)"""
+  for name in ('TEST_DATABASE_URL', 'DATABASE_URL'):
+    url = os.getenv(name, '')
+    if url and make_url(url).get_backend_name() == 'postgresql':
+      return url
+  return None
+
+
+def create_tables(url: str) -> None:
+  """모델 테이블 생성"""
+  from sqlmodel import SQLModel
+
+  import src.models  # noqa: F401
+
+  engine = create_engine(url)
+  try:
+    # 새 DB/스키마이므로 확인 없이 생성 (search_path의 public 테이블과 혼동 방지)
+    SQLModel.metadata.create_all(engine, checkfirst=False)
+  finally:
+    engine.dispose()
+
+
+def sqlite_stand_in(tmp_path: Path) -> Iterator[StandInFactory]:
+  """이름마다 SQLite 파일을 만드는 함수"""
+
+  def make(name: str) -> str:
+    url = f'sqlite:///{tmp_path / name}.db'
+    create_tables(url)
+    return url
+
+  yield make
+
+
+def postgres_stand_in(base_url: str) -> Iterator[StandInFactory]:
+  """이름마다 스키마를 만들고 search_path로 연결하는 함수"""
+  admin_engine = create_engine(base_url)
+  prefix = f'test_{uuid.uuid4().hex[:8]}'
+  schemas: list[str] = []
+
+  def make(name: str) -> str:
+    schema = f'{prefix}_{name}'
+    with admin_engine.begin() as conn:
+      conn.execute(text(f'CREATE SCHEMA {schema}'))
+    schemas.append(schema)
+    # pg_trgm 등 public 스키마의 확장도 보이도록 public을 뒤에 둠
+    url = make_url(base_url).update_query_dict(
+      {'options': f'-csearch_path={schema},public'}
+    )
+    url_string = url.render_as_string(hide_password=False)
+    create_tables(url_string)
+    return url_string
+
+  try:
+    yield make
+  finally:
+    with admin_engine.begin() as conn:
+      for schema in schemas:
+        conn.execute(text(f'DROP SCHEMA IF EXISTS {schema} CASCADE'))
+    admin_engine.dispose()
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def stand_in(
+  request: pytest.FixtureRequest, tmp_path: Path
+) -> Iterator[StandInFactory]:
+  """이름별 독립 DB URL을 만드는 함수 (SQLite 파일, Postgres 스키마)"""
+  if request.param == 'sqlite':
+    yield from sqlite_stand_in(tmp_path)
+    return
+
+  base_url = get_postgres_url()
+  if base_url is None:
+    pytest.skip('Postgres URL(TEST_DATABASE_URL 또는 DATABASE_URL)이 없습니다.')
+  yield from postgres_stand_in(base_url)
+
+
+@pytest.fixture(scope='module')
+def postgres_module_stand_in() -> Iterator[StandInFactory]:
+  """모듈 단위 Postgres 대역 (데이터를 한 번만 채우는 테스트용, 없으면 건너뜀)"""
+  base_url = get_postgres_url()
+  if base_url is None:
+    pytest.skip('Postgres URL(TEST_DATABASE_URL 또는 DATABASE_URL)이 없습니다.')
+  yield from postgres_stand_in(base_url)
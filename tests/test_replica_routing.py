@@ -0,0 +1,347 @@
+"""읽기 복제본 라우팅 테스트 (get_session / get_async_session)
+
+primary와 복제본 2개를 DB 대역(conftest.stand_in)으로 만들고, 같은 사용자 번호에
+DB마다 다른 사용자명을 넣어 조회 결과로 어느 DB가 사용되었는지 확인합니다.
+
+비동기 세션은 psycopg 비동기 드라이버를 사용하므로 Postgres 대역에서만 실행합니다.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Callable, Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, create_engine
+
+import src.db as db
+from src.models import UserInfo, UserRole
+from src.schemas.auth_schema import LoginRequest
+from src.services.async_auth_service import AsyncAuthService
+from src.services.async_user_service import AsyncUserService
+from src.services.auth_service import AuthService
+from src.services.user_service import UserService
+from src.utils.cache_helper import CacheBackend, LruTtlCache
+from src.utils.password_helper import hash_password
+from src.utils.replica_helper import (
+  ReplicaRouter,
+  RoutingSession,
+  route_context,
+  start_route_context,
+)
+from src.vos.user_vo import UserVo
+
+USER_NO = 1
+EML_ADDR = 'replica@example.com'
+PASSWORD = 'pw123456!'
+ENCPT_PSWD = hash_password(PASSWORD)
+
+# DB 대역 이름 (사용자명으로도 사용)
+PRIMARY = 'primary'
+REPLICAS = ['replica_1', 'replica_2']
+
+
+def seed_user(url: str, user_nm: str) -> None:
+  """DB마다 같은 번호/이메일, 다른 사용자명의 사용자 저장"""
+  engine = create_engine(url)
+  try:
+    with Session(engine) as session:
+      session.add(
+        UserInfo(
+          userNo=USER_NO,
+          emlAddr=EML_ADDR,
+          userNm=user_nm,
+          encptPswd=ENCPT_PSWD,
+          userRole=UserRole.USER,
+        )
+      )
+      session.commit()
+  finally:
+    engine.dispose()
+
+
+def read_row(url: str) -> tuple[str, str | None, str | None]:
+  """(사용자명, 자기소개, 리프레시 토큰) 직접 조회"""
+  engine = create_engine(url)
+  try:
+    with engine.connect() as conn:
+      row = conn.execute(
+        text(
+          'SELECT user_nm, user_biogp, resh_token FROM user_info WHERE user_no = :no'
+        ),
+        {'no': USER_NO},
+      ).one()
+  finally:
+    engine.dispose()
+  return row.user_nm, row.user_biogp, row.resh_token
+
+
+def new_caches() -> tuple[CacheBackend, CacheBackend]:
+  """테스트마다 비어 있는 사용자/사용자 상태 캐시 (캐시 적중으로 DB 조회 생략 방지)"""
+  return (
+    LruTtlCache('test-user', max_size=100, ttl_seconds=60, enabled=True),
+    LruTtlCache('test-user-status', max_size=100, ttl_seconds=60, enabled=True),
+  )
+
+
+def broken_url(url: str) -> str:
+  """연결할 수 없는 같은 종류의 DB URL"""
+  parsed = make_url(url)
+  if parsed.get_backend_name() == 'sqlite':
+    parsed = parsed.set(database='/nonexistent-dir/replica.db')
+  else:
+    parsed = parsed.set(port=1)
+  return parsed.render_as_string(hide_password=False)
+
+
+@pytest.fixture
+def urls(stand_in: Callable[[str], str]) -> dict[str, str]:
+  """primary/복제본 DB URL (사용자 저장 완료)"""
+  urls = {name: stand_in(name) for name in [PRIMARY, *REPLICAS]}
+  for name, url in urls.items():
+    seed_user(url, name)
+  return urls
+
+
+@pytest.fixture(autouse=True)
+def clear_route_context() -> Iterator[None]:
+  """테스트마다 요청 라우팅 상태 초기화"""
+  token = route_context.set(None)
+  yield
+  route_context.reset(token)
+
+
+@contextmanager
+def make_router(
+  monkeypatch: pytest.MonkeyPatch,
+  primary_url: str,
+  replica_urls: list[str],
+  eject_seconds: int = 30,
+) -> Iterator[ReplicaRouter]:
+  """src.db.get_session이 사용할 복제본 라우터 설정"""
+  router = ReplicaRouter(
+    primary=db.create_pooled_engine(primary_url, 'test-primary'),
+    replicas=[
+      db.create_pooled_engine(url, f'test-replica-{index}')
+      for index, url in enumerate(replica_urls, start=1)
+    ],
+    eject_seconds=eject_seconds,
+  )
+  monkeypatch.setattr(db, 'replica_router', router)
+  try:
+    yield router
+  finally:
+    for engine in [router.primary, *router.replicas]:
+      engine.dispose()
+
+
+@pytest.fixture
+def router(
+  monkeypatch: pytest.MonkeyPatch, urls: dict[str, str]
+) -> Iterator[ReplicaRouter]:
+  """primary + 복제본 2개 라우터"""
+  with make_router(
+    monkeypatch, urls[PRIMARY], [urls[name] for name in REPLICAS]
+  ) as router:
+    yield router
+
+
+def get_user_nm(service: UserService) -> str:
+  """@read_only 조회(getUserByNo) 결과의 사용자명"""
+  response = service.getUserByNo(UserVo(userNo=USER_NO))
+  assert response.data is not None
+  assert response.data.userNm is not None
+  return response.data.userNm
+
+
+def read_in_new_session() -> str:
+  """새 세션(get_session)에서 @read_only 조회"""
+  with contextmanager(db.get_session)() as session:
+    return get_user_nm(UserService(session, *new_caches()))
+
+
+def test_get_session_uses_routing_session(router: ReplicaRouter):
+  with contextmanager(db.get_session)() as session:
+    assert isinstance(session, RoutingSession)
+    assert session.router is router
+
+
+def test_get_session_without_replicas_uses_primary(
+  monkeypatch: pytest.MonkeyPatch, urls: dict[str, str]
+):
+  engine = db.create_pooled_engine(urls[PRIMARY], 'test-primary')
+  monkeypatch.setattr(db, 'replica_router', None)
+  monkeypatch.setattr(db, 'engine', engine)
+  try:
+    with contextmanager(db.get_session)() as session:
+      assert not isinstance(session, RoutingSession)
+    assert read_in_new_session() == PRIMARY
+  finally:
+    engine.dispose()
+
+
+def test_read_only_methods_round_robin_replicas(router: ReplicaRouter):
+  assert [read_in_new_session() for _ in range(4)] == [*REPLICAS, *REPLICAS]
+
+
+def test_session_keeps_one_replica(router: ReplicaRouter):
+  with contextmanager(db.get_session)() as session:
+    service = UserService(session, *new_caches())
+    assert [get_user_nm(service) for _ in range(3)] == [REPLICAS[0]] * 3
+
+
+def test_unmarked_reads_use_primary(router: ReplicaRouter):
+  with contextmanager(db.get_session)() as session:
+    user = UserService(session, *new_caches()).dao.get_user_by_no(session, USER_NO)
+    assert user is not None
+    assert user.userNm == PRIMARY
+
+
+def test_update_user_stays_on_primary(router: ReplicaRouter, urls: dict[str, str]):
+  with contextmanager(db.get_session)() as session:
+    service = UserService(session, *new_caches())
+    response = service.updateUser(
+      UserVo(userNo=USER_NO, userBiogp='updated'), updt_no=USER_NO
+    )
+    assert response.data is not None
+    assert response.data.userNm == PRIMARY
+    # 같은 세션에서 쓰기 이후의 @read_only 조회도 primary
+    assert get_user_nm(service) == PRIMARY
+
+  assert read_row(urls[PRIMARY])[1] == 'updated'
+  for name in REPLICAS:
+    assert read_row(urls[name])[1] is None
+
+
+def test_update_user_login_info_stays_on_primary(
+  router: ReplicaRouter, urls: dict[str, str]
+):
+  with contextmanager(db.get_session)() as session:
+    response = AuthService(session, None, *new_caches()).signin(
+      LoginRequest(emlAddr=EML_ADDR, password=PASSWORD)
+    )
+    assert response.data is not None
+
+  assert read_row(urls[PRIMARY])[2] == response.data.refreshToken
+  for name in REPLICAS:
+    assert read_row(urls[name])[2] is None
+
+
+def test_read_your_writes_after_write(router: ReplicaRouter):
+  route_ctx = start_route_context(None)
+  with contextmanager(db.get_session)() as session:
+    AuthService(session, None, *new_caches()).signin(
+      LoginRequest(emlAddr=EML_ADDR, password=PASSWORD)
+    )
+  assert route_ctx.wrote
+
+  # 같은 요청의 다음 세션도 primary
+  assert read_in_new_session() == PRIMARY
+
+
+@pytest.mark.parametrize(
+  'sticky_cookie, expected',
+  [
+    (lambda: str(time.time() + 5), PRIMARY),  # 쓰기 직후 (고정 시간 안)
+    (lambda: str(time.time() - 1), REPLICAS[0]),  # 고정 시간 지남
+    (lambda: 'invalid', REPLICAS[0]),  # 잘못된 쿠키 값은 무시
+  ],
+)
+def test_sticky_cookie_keeps_caller_on_primary(
+  router: ReplicaRouter, sticky_cookie, expected: str
+):
+  start_route_context(sticky_cookie())
+  assert read_in_new_session() == expected
+
+
+def test_failed_replica_is_ejected(
+  monkeypatch: pytest.MonkeyPatch, urls: dict[str, str]
+):
+  with make_router(
+    monkeypatch,
+    urls[PRIMARY],
+    [broken_url(urls[REPLICAS[0]]), urls[REPLICAS[1]]],
+    eject_seconds=1,
+  ) as router:
+    # 첫 조회는 연결할 수 없는 복제본으로 가서 실패하고, 이후 제외됨
+    with pytest.raises(OperationalError):
+      read_in_new_session()
+    assert [read_in_new_session() for _ in range(3)] == [REPLICAS[1]] * 3
+
+    # 제외 시간이 지나면 다시 라우팅 대상
+    time.sleep(router.eject_seconds + 0.1)
+    names = []
+    for _ in range(2):
+      try:
+        names.append(read_in_new_session())
+      except OperationalError:
+        names.append('broken')
+    assert sorted(names) == ['broken', REPLICAS[1]]
+
+
+@asynccontextmanager
+async def async_router(monkeypatch: pytest.MonkeyPatch, urls: dict[str, str]):
+  """src.db.get_async_session이 사용할 비동기 엔진/복제본 라우터 설정"""
+  primary = db.create_pooled_async_engine(urls[PRIMARY], 'test-async-primary')
+  replicas = [
+    db.create_pooled_async_engine(urls[name], f'test-async-{name}') for name in REPLICAS
+  ]
+  router = ReplicaRouter(
+    primary=primary.sync_engine,
+    replicas=[replica.sync_engine for replica in replicas],
+    eject_seconds=30,
+  )
+  monkeypatch.setattr(db, 'async_engine', primary)
+  monkeypatch.setattr(db, 'async_replica_router', router)
+  try:
+    yield router
+  finally:
+    for engine in [primary, *replicas]:
+      await engine.dispose()
+
+
+async def async_get_user_nm(service: AsyncUserService) -> str:
+  """@read_only 조회(getUserByNo) 결과의 사용자명 (비동기)"""
+  response = await service.getUserByNo(UserVo(userNo=USER_NO))
+  assert response.data is not None
+  assert response.data.userNm is not None
+  return response.data.userNm
+
+
+async def async_read_in_new_session() -> str:
+  """새 세션(get_async_session)에서 @read_only 조회"""
+  async with asynccontextmanager(db.get_async_session)() as session:
+    return await async_get_user_nm(AsyncUserService(session, *new_caches()))
+
+
+def test_async_session_routing(monkeypatch: pytest.MonkeyPatch, urls: dict[str, str]):
+  if make_url(urls[PRIMARY]).get_backend_name() != 'postgresql':
+    pytest.skip('비동기 세션은 Postgres(psycopg 비동기 드라이버)에서만 사용합니다.')
+
+  async def scenario():
+    async with async_router(monkeypatch, urls):
+      # 조회 전용 메서드는 복제본 라운드 로빈
+      assert [await async_read_in_new_session() for _ in range(4)] == [
+        *REPLICAS,
+        *REPLICAS,
+      ]
+
+      # 쓰기(update_user_login_info)는 primary, 이후 같은 요청의 조회도 primary
+      route_ctx = start_route_context(None)
+      async with asynccontextmanager(db.get_async_session)() as session:
+        assert isinstance(session.sync_session, RoutingSession)
+        response = await AsyncAuthService(session, None, *new_caches()).signin(
+          LoginRequest(emlAddr=EML_ADDR, password=PASSWORD)
+        )
+        assert response.data is not None
+      assert route_ctx.wrote
+      assert await async_read_in_new_session() == PRIMARY
+      return response.data.refreshToken
+
+  refresh_token = asyncio.run(scenario())
+  assert read_row(urls[PRIMARY])[2] == refresh_token
+  for name in REPLICAS:
+    assert read_row(urls[name])[2] is None
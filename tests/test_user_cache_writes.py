@@ -0,0 +1,150 @@
+"""사용자 캐시와 쓰기 경로 테스트
+
+워커마다 따로 있는 캐시(CACHE_BACKEND=memory)를 워커별 LruTtlCache로 흉내 냅니다.
+다른 워커의 쓰기로 캐시 값이 오래되어도 수정/비밀번호 변경/삭제는 DB에서 조회한
+사용자를 수정해야 합니다. (캐시 값을 DB 상태로 취급하면 변경이 UPDATE에서 빠짐)
+ETag 버전도 워커별 캐시가 아니라 DB에서 조회해야 합니다.
+"""
+
+from datetime import datetime
+from typing import Callable, Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import Session, create_engine, select
+
+from src.models import UserInfo, UserRole
+from src.services.user_service import UserService
+from src.utils.cache_helper import CacheBackend, LruTtlCache
+from src.vos.user_vo import UserVo
+
+USER_NO = 1
+
+
+class Worker:
+  """워커 하나 (워커별 사용자/사용자 상태 캐시)"""
+
+  def __init__(self, url: str):
+    self.url = url
+    self.caches: tuple[CacheBackend, CacheBackend] = (
+      LruTtlCache('test-user', max_size=100, ttl_seconds=60, enabled=True),
+      LruTtlCache('test-user-status', max_size=100, ttl_seconds=60, enabled=True),
+    )
+
+  def run(self, call: Callable[[UserService], object]) -> object:
+    """새 세션으로 서비스 메서드 실행"""
+    engine = create_engine(self.url)
+    try:
+      with Session(engine, expire_on_commit=False) as session:
+        return call(UserService(session, *self.caches))
+    finally:
+      engine.dispose()
+
+  def cache_user(self) -> None:
+    """조회 전용 경로(get_user_by_no)로 사용자를 캐시에 저장"""
+    self.run(lambda service: service.dao.get_user_by_no(service.session, USER_NO))
+
+
+@pytest.fixture
+def url(stand_in: Callable[[str], str]) -> Iterator[str]:
+  """사용자 한 명(alice)을 저장한 DB URL"""
+  url = stand_in('primary')
+  engine = create_engine(url)
+  try:
+    with Session(engine) as session:
+      session.add(
+        UserInfo(
+          userNo=USER_NO,
+          emlAddr='alice@example.com',
+          userNm='alice',
+          encptPswd='x',
+          userRole=UserRole.USER,
+        )
+      )
+      session.commit()
+  finally:
+    engine.dispose()
+  yield url
+
+
+def read_column(url: str, column: str) -> object:
+  engine = create_engine(url)
+  try:
+    with engine.connect() as conn:
+      return conn.execute(
+        text(f'SELECT {column} FROM user_info WHERE user_no = :no'), {'no': USER_NO}
+      ).scalar_one()
+  finally:
+    engine.dispose()
+
+
+def read_updt_dt(url: str) -> datetime:
+  """DB의 수정 일시 (SQLite도 datetime으로 읽도록 모델 컬럼으로 조회)"""
+  engine = create_engine(url)
+  try:
+    with Session(engine) as session:
+      return session.exec(
+        select(UserInfo.updtDt).where(UserInfo.userNo == USER_NO)
+      ).one()
+  finally:
+    engine.dispose()
+
+
+def test_update_user_with_stale_cache_is_saved(url: str):
+  worker_a, worker_b = Worker(url), Worker(url)
+  worker_a.cache_user()
+
+  # 다른 워커에서 사용자명 변경 (워커 A의 캐시는 alice 그대로)
+  worker_b.run(
+    lambda service: service.updateUser(UserVo(userNo=USER_NO, userNm='bob'), USER_NO)
+  )
+
+  # 워커 A에서 캐시 값과 같은 값으로 되돌림
+  response = worker_a.run(
+    lambda service: service.updateUser(UserVo(userNo=USER_NO, userNm='alice'), USER_NO)
+  )
+  assert response.data.userNm == 'alice'
+  assert read_column(url, 'user_nm') == 'alice'
+
+
+def test_delete_user_with_stale_cache_is_saved(url: str):
+  worker_a, worker_b = Worker(url), Worker(url)
+  worker_a.cache_user()
+  worker_b.run(
+    lambda service: service.updateUser(UserVo(userNo=USER_NO, userNm='bob'), USER_NO)
+  )
+
+  worker_a.run(lambda service: service.deleteUser(UserVo(userNo=USER_NO), USER_NO))
+  assert read_column(url, 'del_yn') == 'Y'
+  assert read_column(url, 'user_nm') == 'bob'
+
+
+def test_user_version_with_stale_cache_is_fresh(url: str):
+  worker_a, worker_b = Worker(url), Worker(url)
+  worker_a.cache_user()
+  before = worker_a.run(lambda service: service.getUserVersion(UserVo(userNo=USER_NO)))
+
+  worker_b.run(
+    lambda service: service.updateUser(UserVo(userNo=USER_NO, userNm='bob'), USER_NO)
+  )
+
+  # 워커별 캐시는 304 확인에 쓰지 않음 (다른 워커의 쓰기가 바로 반영)
+  after = worker_a.run(lambda service: service.getUserVersion(UserVo(userNo=USER_NO)))
+  assert after.updtDt != before.updtDt
+  assert after.updtDt == read_updt_dt(url)
+
+
+def test_user_with_version_matches_body(url: str):
+  worker_a, worker_b = Worker(url), Worker(url)
+  worker_a.cache_user()
+  worker_b.run(
+    lambda service: service.updateUser(UserVo(userNo=USER_NO, userNm='bob'), USER_NO)
+  )
+
+  # 응답 필드에 updtDt가 없어도 버전은 본문과 같은 행에서 조회
+  response, version = worker_a.run(
+    lambda service: service.getUserWithVersion(UserVo(userNo=USER_NO, fields='userNm'))
+  )
+  assert response.data.userNm == 'bob'
+  assert response.data.updtDt is None
+  assert version.updtDt == read_updt_dt(url)
@@ -0,0 +1,187 @@
+"""사용자 목록 필터 조합별 실행 계획 테스트 (Postgres)
+
+UserDAO.get_users가 실행하는 SQL(목록 조회, 건수 조회)을 그대로 캡처하여 EXPLAIN으로
+실행 계획을 확인합니다. 자주 쓰는 필터 조합이 user_info를 전체 스캔(Seq Scan)하지 않고
+기대한 인덱스를 사용하는지 검사합니다.
+
+실행 계획은 행 수와 통계에 따라 달라지므로 Postgres 대역에 PLAN_ROWS만큼 사용자를 채우고
+VACUUM ANALYZE 후 확인합니다. (benchmarks.bench_user_filter_plans는 100만 행 기준 측정)
+"""
+
+import json
+from datetime import timedelta
+from typing import Any, Callable, Iterator
+
+import pytest
+from sqlalchemy import Engine, create_engine, event, text
+from sqlmodel import Session
+
+from src.dao.user_dao import UserDAO
+from src.utils.datetime_helper import utc_now
+from src.vos.user_vo import UserVo
+
+PLAN_ROWS = 100_000
+
+# 사용자 n: 10%는 ADMIN, 5%는 사용 안 함, 1/7은 삭제
+# 마지막 로그인은 n분 전, 가입은 10n분 전 (약 2년에 걸쳐 분포)
+SEED_USERS_SQL = """
+INSERT INTO user_info (
+  eml_addr, user_nm, encpt_pswd, user_role, use_yn, del_yn, last_lgn_dt, crt_dt
+)
+SELECT 'user' || n || '@example.com', 'user' || n, 'x',
+       CASE WHEN n % 10 = 0 THEN 'ADMIN' ELSE 'USER' END::user_role,
+       CASE WHEN n % 20 = 0 THEN 'N' ELSE 'Y' END::yn_status,
+       CASE WHEN n % 7 = 0 THEN 'Y' ELSE 'N' END::yn_status,
+       now() - n * interval '1 minute',
+       now() - n * interval '10 minutes'
+FROM generate_series(1, :rows) AS n
+"""
+
+LIVE_INDEX = 'ix_user_info_live_user_no_cover'
+ROLE_INDEX = 'ix_user_info_role_use_del'
+TRIGRAM_INDEXES = {'ix_user_info_user_nm_trgm', 'ix_user_info_eml_addr_trgm'}
+
+# (필터, 사용할 수 있는 인덱스) - 목록/건수 조회 모두 이 중 하나 이상을 사용해야 함
+# 목록은 user_no 역순으로 LIMIT만큼 읽으므로 권한 필터가 있어도 LIVE_INDEX를 쓸 수 있음
+FILTER_CASES: dict[str, tuple[dict[str, Any], set[str]]] = {
+  'delYn=N': ({'delYn': 'N'}, {LIVE_INDEX}),
+  'useYn=Y,delYn=N': ({'useYn': 'Y', 'delYn': 'N'}, {LIVE_INDEX, ROLE_INDEX}),
+  'userRole=ADMIN,useYn=Y,delYn=N': (
+    {'userRole': 'ADMIN', 'useYn': 'Y', 'delYn': 'N'},
+    {LIVE_INDEX, ROLE_INDEX},
+  ),
+  'userRole=USER,useYn=Y,delYn=N': (
+    {'userRole': 'USER', 'useYn': 'Y', 'delYn': 'N'},
+    {LIVE_INDEX, ROLE_INDEX},
+  ),
+  'userRole=ADMIN,useYn=Y,delYn=N,page=50': (
+    {'userRole': 'ADMIN', 'useYn': 'Y', 'delYn': 'N', 'page': 50},
+    {LIVE_INDEX, ROLE_INDEX},
+  ),
+  'lastLgnDtFrom=10m ago': (
+    {'lastLgnDtFrom': utc_now() - timedelta(minutes=10)},
+    {'ix_user_info_last_lgn_dt'},
+  ),
+  'crtDtFrom~crtDtTo=1 day': (
+    {
+      'crtDtFrom': utc_now() - timedelta(days=366),
+      'crtDtTo': utc_now() - timedelta(days=365),
+    },
+    {'ix_user_info_crt_dt'},
+  ),
+}
+
+# 키워드 부분 일치 검색 (pg_trgm 확장이 있을 때만 trigram 인덱스 생성)
+KEYWORD_CASES: dict[str, tuple[dict[str, Any], set[str]]] = {
+  'srchType=userNm': (
+    {'srchType': 'userNm', 'srchKywd': 'user12345'},
+    {'ix_user_info_user_nm_trgm'},
+  ),
+  'srchType=emlAddr': (
+    {'srchType': 'emlAddr', 'srchKywd': 'user12345@'},
+    {'ix_user_info_eml_addr_trgm'},
+  ),
+  'srchKywd (userNm or emlAddr)': ({'srchKywd': 'user12345'}, TRIGRAM_INDEXES),
+  'srchKywd,delYn=N': ({'srchKywd': 'user12345', 'delYn': 'N'}, TRIGRAM_INDEXES),
+}
+
+
+@pytest.fixture(scope='module')
+def plan_engine(
+  postgres_module_stand_in: Callable[[str], str],
+) -> Iterator[Engine]:
+  """PLAN_ROWS명의 사용자를 채운 Postgres 대역 엔진"""
+  engine = create_engine(postgres_module_stand_in('plans'))
+  with engine.begin() as conn:
+    conn.execute(text(SEED_USERS_SQL), {'rows': PLAN_ROWS})
+  # 인덱스 전용 스캔(Index Only Scan)이 가능하도록 visibility map/통계 갱신
+  with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+    conn.execute(text('VACUUM ANALYZE user_info'))
+  try:
+    yield engine
+  finally:
+    engine.dispose()
+
+
+def iter_plan_nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+  yield node
+  for child in node.get('Plans', []):
+    yield from iter_plan_nodes(child)
+
+
+def capture_get_users_sql(engine: Engine, user_vo: UserVo) -> list[tuple[str, Any]]:
+  """get_users가 실행하는 (SQL, 파라미터) 목록 캡처"""
+  captured: list[tuple[str, Any]] = []
+
+  def _capture(conn, cursor, statement, parameters, context, executemany):
+    captured.append((statement, parameters))
+
+  event.listen(engine, 'before_cursor_execute', _capture)
+  try:
+    with Session(engine) as session:
+      UserDAO.get_users(session, user_vo)
+  finally:
+    event.remove(engine, 'before_cursor_execute', _capture)
+  return captured
+
+
+def get_scans(engine: Engine, statement: str, parameters: Any) -> list[dict[str, Any]]:
+  """EXPLAIN 실행 계획에서 user_info를 읽는 스캔 노드 목록"""
+  with engine.connect() as conn:
+    plan_json = conn.exec_driver_sql(
+      f'EXPLAIN (FORMAT JSON) {statement}', parameters
+    ).scalar_one()
+  plan = (plan_json if isinstance(plan_json, list) else json.loads(plan_json))[0]
+  return [
+    node
+    for node in iter_plan_nodes(plan['Plan'])
+    if 'Scan' in node['Node Type'] and node.get('Relation Name') == 'user_info'
+  ]
+
+
+def assert_uses_index(engine: Engine, filters: dict[str, Any], indexes: set[str]):
+  statements = [
+    (statement, parameters)
+    for statement, parameters in capture_get_users_sql(
+      engine, UserVo(pageSz=20, **filters)
+    )
+    if 'user_info' in statement
+  ]
+  assert statements
+
+  for statement, parameters in statements:
+    scans = get_scans(engine, statement, parameters)
+    summary = [f'{node["Node Type"]}({node.get("Index Name")})' for node in scans]
+    assert scans, statement
+    assert all(node['Node Type'] != 'Seq Scan' for node in scans), summary
+    assert {node.get('Index Name') for node in scans} & indexes, summary
+
+
+@pytest.mark.parametrize(
+  'filters, indexes', FILTER_CASES.values(), ids=list(FILTER_CASES)
+)
+def test_get_users_filters_use_index(
+  plan_engine: Engine, filters: dict[str, Any], indexes: set[str]
+):
+  assert_uses_index(plan_engine, filters, indexes)
+
+
+@pytest.mark.parametrize(
+  'filters, indexes', KEYWORD_CASES.values(), ids=list(KEYWORD_CASES)
+)
+def test_get_users_keyword_search_uses_trigram_index(
+  plan_engine: Engine, filters: dict[str, Any], indexes: set[str]
+):
+  with plan_engine.connect() as conn:
+    trigram_indexes = set(
+      conn.execute(
+        text(
+          'SELECT indexname FROM pg_indexes'
+          ' WHERE schemaname = current_schema() AND indexname = ANY(:names)'
+        ),
+        {'names': list(TRIGRAM_INDEXES)},
+      ).scalars()
+    )
+  if trigram_indexes != TRIGRAM_INDEXES:
+    pytest.skip('pg_trgm 확장이 없어 trigram 인덱스가 생성되지 않았습니다.')
+  assert_uses_index(plan_engine, filters, indexes)